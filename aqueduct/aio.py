@@ -0,0 +1,260 @@
+import asyncio
+import datetime
+import functools
+from typing import Callable, Union
+
+from .buffer import DEFAULT_CAPACITY, OVERFLOW_OVERWRITE
+from .recordable import Recordable
+from .setpoint import Setpoint
+from .user_prompt import Prompt
+from .user_input import Input, UserInputTypes
+
+
+class AsyncDevice(object):
+    """
+    A proxy that exposes every method of a Device as a coroutine function.
+
+    Device methods block the calling thread until the command has been acknowledged
+    (and, with `wait_for_complete=True`, until a finite operation has ended), so each
+    call is run in the event loop's executor and awaited. Inside a pipeline or
+    transaction the commands are only sent, so the calls are made on the event loop's
+    thread and join the pipeline, see :py:func:`AsyncAqueduct.call`.
+
+    .. code-block:: python
+
+        pp = aqueduct.aio.device(PPSIM)
+        await pp.start(mode="finite", rate_value=1., rate_units="ml_min", finite_value=2., finite_units="ml")
+
+    Non-callable attributes are returned unchanged.
+
+    :param device: the Device to wrap
+    :type device: devices.base.obj.Device
+    :param aio: the AsyncAqueduct that runs the calls
+    :type aio: AsyncAqueduct
+    """
+
+    def __init__(self, device, aio: "AsyncAqueduct"):
+        """
+        Constructor method.
+        """
+        self.__device__ = device
+        self.__aio__ = aio
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.__device__, name)
+
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self.__aio__.call(attr, *args, **kwargs)
+
+        return method
+
+
+class AsyncAqueduct(object):
+    """
+    An asyncio interface to an :class:`Aqueduct` instance.
+
+    Accessible as `aqueduct.aio`. Coroutines written against this interface can
+    drive several Devices, Prompts and data recording concurrently from a single
+    Recipe.
+
+    .. code-block:: python
+
+        async def dose(pump, ml):
+            await pump.start(mode="finite", rate_value=5., rate_units="ml_min",
+                             finite_value=ml, finite_units="ml")
+
+        async def monitor(r):
+            while True:
+                await aqueduct.aio.update(r, SCIPSIM.get_pressure())
+                await aqueduct.aio.sleep(0.1)
+
+        async def main():
+            r = await aqueduct.aio.recordable(name="pressure", value=0.)
+            m = asyncio.ensure_future(monitor(r))
+            await asyncio.gather(
+                dose(aqueduct.aio.device(PP_A), 2.),
+                dose(aqueduct.aio.device(PP_B), 3.),
+            )
+            await aqueduct.aio.prompt(message="Dosing complete!")
+            m.cancel()
+
+        aqueduct.aio.run(main())
+
+    :param aqueduct: the Aqueduct instance
+    :type aqueduct: Aqueduct
+    """
+
+    def __init__(self, aqueduct: "Aqueduct"):
+        """
+        Constructor method.
+        """
+        self.__aqueduct__ = aqueduct
+        self.__loop__: asyncio.AbstractEventLoop = None
+
+    def run(self, coro):
+        """
+        Run a coroutine to completion on a new event loop.
+
+        :param coro: coroutine to run, typically the Recipe's `main()`
+        :return: the coroutine's result
+        """
+        loop = asyncio.new_event_loop()
+        self.__loop__ = loop
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                self.__loop__ = None
+                loop.close()
+
+    async def call(self, fn: Callable, *args, **kwargs):
+        """
+        Run a blocking callable in the event loop's executor and await the result.
+
+        Pipelines and transactions are per-thread, so inside one the callable is run on
+        the calling thread instead, where its Device commands are added to the pipeline
+        and sent without waiting for the acknowledgement.
+
+        .. code-block:: python
+
+            with aqueduct.transaction():
+                await pp.start(...)
+                await sv.set_port(...)
+            # the two commands are sent here
+
+        :param fn: the callable
+        :type fn: Callable
+        :return: the callable's result
+        """
+        import devices.base.obj
+        if devices.base.obj.current_pipeline() is not None:
+            return fn(*args, **kwargs)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+    def device(self, device) -> AsyncDevice:
+        """
+        Wrap a Device so that its methods can be awaited.
+
+        :param device: the Device to wrap
+        :type device: devices.base.obj.Device
+        :return: AsyncDevice
+        :rtype: AsyncDevice
+        """
+        return AsyncDevice(device, self)
+
+    @staticmethod
+    async def sleep(seconds: Union[int, float]) -> None:
+        """
+        Suspend the current coroutine without blocking the event loop.
+
+        :param seconds: time to sleep in seconds
+        :type seconds: int, float
+        :return: None
+        """
+        await asyncio.sleep(seconds)
+
+    async def prompt(self, message: str = None, timeout_s: Union[int, float] = None) -> Prompt:
+        """
+        Create a user prompt and wait until it has been dismissed or has timed-out.
+
+        :param message: string to flash in the Prompt
+        :type message: str
+        :param timeout_s: number-like value for a timeout value in seconds
+        :type timeout_s: int, float, defaults to None
+        :return: Prompt
+        :rtype: Prompt
+        """
+        p = self.__aqueduct__.prompt(message=message, timeout_s=timeout_s, pause_recipe=False)
+        await p
+        return p
+
+    async def input(
+        self,
+        message: str = None,
+        timeout_s: Union[int, float] = None,
+        input_type: str = UserInputTypes.TEXT_INPUT.value,
+        options: list = None,
+        rows: list = None,
+        dtype: str = None
+    ) -> Input:
+        """
+        Create a user input and wait until it has been entered or has timed-out.
+
+        Read the entered value with :py:func:`Input.get_value`.
+
+        :param message: string to flash in the Input
+        :param timeout_s: number-like value for a timeout value in seconds
+        :param input_type:
+        :param options:
+        :param rows:
+        :param dtype:
+        :return: Input
+        :rtype: Input
+        """
+        i = self.__aqueduct__.input(
+            message=message,
+            timeout_s=timeout_s,
+            pause_recipe=False,
+            input_type=input_type,
+            options=options,
+            rows=rows,
+            dtype=dtype,
+        )
+        await i
+        return i
+
+    async def setpoint(
+        self,
+        name: str,
+        value: Union[float, int, bool, str, datetime.datetime, list],
+        dtype: str = None,
+        on_change: Callable = None,
+        args: list = None,
+        kwargs: dict = None
+    ) -> Setpoint:
+        """
+        Create a Setpoint. See :py:func:`Aqueduct.setpoint`.
+
+        :return: Setpoint
+        :rtype: Setpoint
+        """
+        return self.__aqueduct__.setpoint(name, value, dtype, on_change=on_change, args=args, kwargs=kwargs)
+
+    async def recordable(
+        self,
+        name: str,
+        value: Union[float, int, bool, str, datetime.datetime, list],
+        dtype: str = None,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_OVERWRITE
+    ) -> Recordable:
+        """
+        Create a Recordable. See :py:func:`Aqueduct.recordable`.
+
+        :return: Recordable
+        :rtype: Recordable
+        """
+        return self.__aqueduct__.recordable(name, value, dtype, capacity=capacity, overflow=overflow)
+
+    @staticmethod
+    async def update(obj: Union[Setpoint, Recordable], value) -> None:
+        """
+        Update a Setpoint or Recordable and yield to the event loop.
+
+        Updates are coalesced and written by the Aqueduct update thread,
+        so this never blocks.
+
+        :param obj: the Setpoint or Recordable
+        :type obj: Setpoint, Recordable
+        :param value: the new value
+        :return: None
+        """
+        obj.update(value)
+        await asyncio.sleep(0)
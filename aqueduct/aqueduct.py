@@ -1,16 +1,31 @@
+import concurrent.futures
+import contextlib
 import datetime
 import io
+import os
+import sys
 import time
 import threading
+import weakref
 from types import ModuleType
-from typing import Union
-
-from .recordable import Recordable
-from .setpoint import Setpoint, ALLOWED_DTYPES
+from typing import Callable, Union
+
+from .aio import AsyncAqueduct
+from .buffer import DEFAULT_CAPACITY, OVERFLOW_OVERWRITE
+from .completion import Completion
+from .console import ConsoleWriter, STDERR
+from .log import DEFAULT_FLUSH_TIMEOUT_S, LogWriter
+from .recordable import Recordable, VectorRecordable
+from .setpoint import Setpoint
 from .user_prompt import Prompt
 from .user_input import Input, UserInputTypes
 
 
+LOG_DIR = os.path.join(os.path.expanduser('~'), 'aqueduct_app', 'temp')
+SAVED_LOG_DIR = os.path.join(os.path.expanduser('~'), 'aqueduct_app', 'logs')
+SAVED_LOG_EXTENSION = '.log'
+
+
 def private() -> None:
     return
 
@@ -63,8 +78,22 @@ class Aqueduct(object):
         self.__update_interval_s__: int = 1.
         self.__helper__ = None
         self.__print__ = None
-        self.__recordables__: dict = dict()
-        self.__setpoints__: dict = dict()
+        self.__recordables__: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self.__setpoints__: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self.__dirty__: dict = dict()
+        self.__completions__: list = []
+        self.__completions_lock__: threading.Lock = threading.Lock()
+        self.__dirty_lock__: threading.Lock = threading.Lock()
+        self.__batch_depth__: int = 0
+        self.__updater__: threading.Thread = None
+        self.__stopped__: threading.Event = threading.Event()
+        self.__aio__: AsyncAqueduct = None
+        self.__log_writer__: LogWriter = None
+        # number of log writer errors already reported
+        self.__log_errors__: int = 0
+        self.__console__: ConsoleWriter = None
+        self.__executor__: concurrent.futures.ThreadPoolExecutor = None
+        self.__scopes__: list = []
 
     def __is_lab_mode__(self) -> bool:
         if self.__user_id__ == getattr(self.__config__, 'LAB_MODE_USER_ID', None):
@@ -77,7 +106,9 @@ class Aqueduct(object):
         Method run just prior to execution of the Recipe code.
 
         Redefines builtin method `print` method based on the configuration to the direct the
-        output to a text file or memory.
+        output to a text file or memory. Printed text is queued in a bounded buffer and
+        written by a background thread, so `print` never blocks the Recipe. See
+        :class:`aqueduct.console.ConsoleWriter`.
 
         When run locally on a Hub, directs the output to the Aqueduct log file for a user
         located at ~/aqueduct_app/temp/__recipe__.XXX.log where XXX is the user_id.
@@ -89,22 +120,223 @@ class Aqueduct(object):
         :return: None
         """
 
-        def print(*s):
-            __builtins__.get('print')(*s, end='')
+        self.__console__ = ConsoleWriter(out=self.__out__, err=self.__err__)
+        print = self.__console__.print
 
         self.__print__ = print
 
         g['print'] = print
 
-        t = threading.Thread(target=self.__helper__.run, daemon=True)
-        t.start()
+        os.makedirs(LOG_DIR, exist_ok=True)
+        self.__log_writer__ = LogWriter(os.path.join(LOG_DIR, '__log__.{}'.format(self.__user_id__)))
+
+        if self.__helper__ is not None:
+            t = threading.Thread(target=self.__helper__.run, daemon=True)
+            t.start()
+
+        self.__stopped__.clear()
+        self.__updater__ = threading.Thread(target=self.__run_updater__, daemon=True)
+        self.__updater__.start()
 
     def __finish__(self) -> None:
         """
         Method run after Recipe code execution.
 
-        Marks the User's Recipe as complete in memory.
+        Writes any pending Setpoint and Recordable updates and marks the
+        User's Recipe as complete in memory.
 
+        :return: None
+        """
+        self.__stopped__.set()
+        self.flush()
+        if self.__log_writer__ is not None:
+            if not self.__log_writer__.close():
+                self.__warn__("The log writer did not finish, pending log records were not written.")
+            self.__check_log_errors__()
+        if self.__console__ is not None:
+            self.__console__.close()
+        if self.__executor__ is not None:
+            self.__executor__.shutdown(wait=False)
+        private()
+
+    def __warn__(self, message: str) -> None:
+        """
+        Private method to write a warning to standard error. Not for API use.
+
+        :param message: warning
+        :type message: str
+        :return: None
+        """
+        if self.__console__ is not None:
+            self.__console__.write(message + '\n', STDERR)
+        else:
+            sys.stderr.write(message + '\n')
+
+    def __check_log_errors__(self) -> None:
+        """
+        Private method to warn about log records lost since the last check. Not for API use.
+
+        :return: None
+        """
+        errors = self.__log_writer__.errors
+        if errors > self.__log_errors__:
+            self.__log_errors__ = errors
+            self.__warn__("Log records could not be written to disk: {}".format(self.__log_writer__.last_error))
+
+    def __run_updater__(self) -> None:
+        """
+        Target of the update thread started in `__start__`.
+
+        Flushes pending Setpoint and Recordable updates once every `__update_interval_s__`
+        seconds, unless a `batch` block is active, applies Setpoint edits made from the
+        Recipe Builder and signals any Prompts and Inputs that have been executed or
+        have timed-out.
+
+        :return: None
+        """
+        while not self.__stopped__.wait(self.__update_interval_s__):
+            # an error in one step must not stop the update thread
+            if self.__batch_depth__ == 0:
+                try:
+                    self.flush()
+                except Exception as e:  # noqa
+                    self.__warn__("Failed to flush updates: {}".format(e))
+            try:
+                self.__check_setpoints__()
+            except Exception as e:  # noqa
+                self.__warn__("Failed to check Setpoints: {}".format(e))
+            try:
+                self.__check_completions__()
+            except Exception as e:  # noqa
+                self.__warn__("Failed to check Prompts and Inputs: {}".format(e))
+
+    def __read_setpoints__(self) -> dict:
+        """
+        Private method to read the values of all Setpoints from memory in one operation. Not for API use.
+
+        :return: dictionary of Setpoint name: value
+        :rtype: dict
+        """
+        return {}
+
+    def __check_setpoints__(self) -> None:
+        """
+        Private method to apply Setpoint edits made from the Recipe Builder and dispatch the
+        `on_change` callbacks. Not for API use.
+
+        Setpoints with an update from the Recipe that has not been flushed yet are skipped,
+        so a stale value in memory never overwrites a newer local value.
+
+        :return: None
+        """
+        values = self.__read_setpoints__()
+        if not values:
+            return
+
+        with self.__dirty_lock__:
+            pending = set(self.__dirty__)
+
+        for name, value in values.items():
+            s = self.__setpoints__.get(name)
+            if s is None or s in pending:
+                continue
+            if s.__receive__(value) and s.on_change is not None:
+                self.__dispatch__(s.on_change, *s.args, **(s.kwargs or {}))
+
+    def __dispatch__(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Private method to run a callback on the callback executor, never on the helper thread. Not for API use.
+
+        :param fn: the callback
+        :type fn: Callable
+        :return: Future
+        """
+        if self.__executor__ is None:
+            self.__executor__ = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='aqueduct-callbacks',
+            )
+        return self.__executor__.submit(fn, *args, **kwargs)
+
+    def __check_completions__(self) -> None:
+        """
+        Private method to check pending Prompts and Inputs and drop the completed ones. Not for API use.
+
+        :return: None
+        """
+        with self.__completions_lock__:
+            pending = list(self.__completions__)
+        done = [c for c in pending if c.__check__()]
+        if done:
+            with self.__completions_lock__:
+                self.__completions__ = [c for c in self.__completions__ if not c.__event__.is_set()]
+
+    def __track_completion__(self, c: Completion) -> None:
+        """
+        Private method to register a Prompt or Input with the update thread. Not for API use.
+
+        :param c: the Prompt or Input
+        :return: None
+        """
+        c.__dispatch__ = self.__dispatch__
+        c.__updating__ = self.__is_updating__
+        with self.__completions_lock__:
+            self.__completions__.append(c)
+
+    def __is_updating__(self) -> bool:
+        return self.__updater__ is not None and self.__updater__.is_alive()
+
+    def __mark_dirty__(self, obj: Union[Setpoint, Recordable]) -> None:
+        """
+        Private method to queue a Setpoint or Recordable for the next flush. Not for API use.
+
+        Repeated updates of the same object between flushes are coalesced. If neither the
+        update thread nor a `batch` block is active, the update is written immediately.
+
+        :param obj: the updated Setpoint or Recordable
+        :return: None
+        """
+        with self.__dirty_lock__:
+            self.__dirty__[obj] = None
+            deferred = self.__batch_depth__ > 0
+
+        if not deferred and not self.__is_updating__():
+            self.flush()
+
+    def __register__(self, registry: weakref.WeakValueDictionary, obj: Union[Setpoint, Recordable]) -> None:
+        """
+        Private method to add a new Setpoint or Recordable to a registry and to the
+        innermost `recording_scope` block, if any. Not for API use.
+
+        :param registry: `__setpoints__` or `__recordables__`
+        :param obj: the new Setpoint or Recordable
+        :return: None
+        """
+        obj.__user_id__ = self.__user_id__
+        obj.__aqueduct__ = self
+        registry[obj.name] = obj
+        if self.__scopes__:
+            self.__scopes__[-1].append(obj.name)
+        self.__mark_dirty__(obj)
+
+    def __remove__(self, names: list) -> None:
+        """
+        Private method to remove released Setpoints and Recordables from
+        memory in one operation. Not for API use.
+
+        :param names: list of names
+        :type names: list
+        :return: None
+        """
+        private()
+
+    def __write__(self, entries: list) -> None:
+        """
+        Private method to write a batch of Setpoint and Recordable updates
+        to memory in one operation. Not for API use.
+
+        :param entries: list of update dictionaries
+        :type entries: list
         :return: None
         """
         private()
@@ -127,6 +359,32 @@ class Aqueduct(object):
         else:
             return None
 
+    @property
+    def aio(self) -> AsyncAqueduct:
+        """
+        The asyncio interface to this :class:`Aqueduct` instance.
+
+        Provides coroutine equivalents of `prompt`, `input`, `setpoint` and `recordable`,
+        awaitable Device proxies, and a `run` method to drive a Recipe's coroutines
+        on an event loop.
+
+        .. code-block:: python
+
+            async def main():
+                pp = aqueduct.aio.device(PPSIM)
+                await pp.start(mode="finite", rate_value=1., rate_units="ml_min",
+                               finite_value=2., finite_units="ml")
+                await aqueduct.aio.prompt(message="Dose complete")
+
+            aqueduct.aio.run(main())
+
+        :return: AsyncAqueduct
+        :rtype: AsyncAqueduct
+        """
+        if self.__aio__ is None:
+            self.__aio__ = AsyncAqueduct(self)
+        return self.__aio__
+
     def is_lab_mode(self) -> bool:
         """
         Helper method to check whether the Recipe is being run in Lab Mode or Sim Mode.
@@ -182,7 +440,16 @@ class Aqueduct(object):
 
             # this code will execute when the prompt has been executed or after 10 seconds
 
+        A Prompt can also be waited on without polling, or can run a callback when
+        it is dismissed or times-out.
+
+        .. code-block:: python
+
+            p = aqueduct.prompt(message="Continue?", timeout_s=60, pause_recipe=False)
+            p.add_callback(lambda prompt: print("timed out" if prompt.timed_out else "dismissed"))
 
+            # block for at most 5 seconds
+            p.wait(timeout=5)
 
         :param message: string to flash in the Prompt
         :type message: str
@@ -196,6 +463,9 @@ class Aqueduct(object):
         p = Prompt(message, timeout_s)
         p.__user_id__ = self.__user_id__
         private()
+        self.__track_completion__(p)
+        if pause_recipe:
+            p.wait()
         return p
 
     def input(
@@ -264,13 +534,78 @@ class Aqueduct(object):
         i.__user_id__ = self.__user_id__
 
         private()
+        self.__track_completion__(i)
+        if pause_recipe:
+            i.wait()
         return i
 
+    def flush(self) -> int:
+        """
+        Write all pending Setpoint and Recordable updates to memory in one operation.
+
+        Updates are flushed automatically every `__update_interval_s__` seconds while
+        a Recipe is running, so calling this method is only necessary when an
+        update must be visible in the user interface immediately.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+            r = aqueduct.recordable(name="counter", value=0, dtype="int")
+            r.update(1)
+            aqueduct.flush()
+
+        :return: number of Setpoints and Recordables written
+        :rtype: int
+        """
+        with self.__dirty_lock__:
+            dirty, self.__dirty__ = self.__dirty__, dict()
+
+        if not dirty:
+            return 0
+
+        entries = [obj.__entry__() for obj in dirty]
+        self.__write__(entries)
+        return len(entries)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager that defers Setpoint and Recordable writes until the block exits.
+
+        All updates made inside the block are coalesced and written in a single
+        flush when the outermost block exits. Blocks may be nested.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+            pressures = [aqueduct.recordable(name="P{}".format(i), value=0.) for i in range(12)]
+
+            with aqueduct.batch():
+                for r, p in zip(pressures, SCIPSIM.get_all_pressures()):
+                    r.update(p)
+            # all 12 values written here
+
+        :return: the Aqueduct instance
+        :rtype: Aqueduct
+        """
+        with self.__dirty_lock__:
+            self.__batch_depth__ += 1
+        try:
+            yield self
+        finally:
+            with self.__dirty_lock__:
+                self.__batch_depth__ -= 1
+                outermost = self.__batch_depth__ == 0
+            if outermost:
+                self.flush()
+
     def log(self, data: str) -> None:
         """
         Record data to the Aqueduct log file.
 
-        Prepends a timestamp with the ISO format 'YYYY-MM-DD HH:MM:SS.mmmmmm'.
+        Each record is stamped with a monotonic timestamp and queued for a background
+        writer, so logging does not block the Recipe on disk I/O. Saved log files
+        prepend a timestamp with the ISO format 'YYYY-MM-DDTHH:MM:SS.mmmmmm'.
 
         Only functions for a Hub installation deployment.
 
@@ -278,15 +613,18 @@ class Aqueduct(object):
         :type data: str
         :return: None
         """
-        string = datetime.datetime.now().isoformat() + ': ' + str(data)
+        if self.__log_writer__ is not None:
+            self.__log_writer__.write(data)
         private()
 
-
     def setpoint(
         self, 
         name: str, 
         value: Union[float, int, bool, str, datetime.datetime, list],
-        dtype: str = None
+        dtype: str = None,
+        on_change: Callable = None,
+        args: list = None,
+        kwargs: dict = None
     ) -> Setpoint:
         """
         Create a Setpoint.
@@ -302,24 +640,44 @@ class Aqueduct(object):
             print(sp.get())
             # prints 0
 
+        Set `on_change` to run a callable whenever the value is edited from the Recipe
+        Builder, instead of polling `get()`. The callable runs on a dedicated thread.
+
+        .. code-block:: python
+
+            sp = aqueduct.setpoint(name="rate", value=1., on_change=print, args=["rate changed"])
+
+        The Aqueduct only holds a weak reference to the Setpoint, so it is discarded
+        once the Recipe no longer references it.
+
         :param value: value to assign to the setpoint
         :param name: name to assign to the setpoint
         :param dtype: type of value
-        :type dtype: {"float", "int", "bool", "str", "datetime.datetime", "list"}
+        :type dtype: {"float", "int", "bool", "str", "datetime", "list", "array"}
+        :param on_change: callable to run when the value is edited from the Recipe Builder
+        :type on_change: Callable
+        :param args: positional arguments passed to `on_change`
+        :type args: list
+        :param kwargs: keyword arguments passed to `on_change`
+        :type kwargs: dict
         :return: Setpoint
         """
         s = Setpoint(name, value, dtype)
-        s.__user_id__ = self.__user_id__
-        s.__aqueduct__ = self
-        self.__setpoints__.update({name: s})
-        s.__update__()
+        s.on_change = on_change
+        if args:
+            s.args = tuple(args)
+        if kwargs:
+            s.kwargs = dict(kwargs)
+        self.__register__(self.__setpoints__, s)
         return s
 
     def recordable(
         self, 
         name: str, 
         value: Union[float, int, bool, str, datetime.datetime, list],
-        dtype: str = None
+        dtype: str = None,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_OVERWRITE
     ) -> Recordable:
         """
         Create a Recordable.
@@ -337,27 +695,211 @@ class Aqueduct(object):
             my_recordable.update(5)
             # records the value 5
 
+            # get the last 10 recorded samples
+            timestamps, values = my_recordable.last(10)
+
+        The history of each Recordable is held in a bounded buffer of `capacity` samples. When the
+        buffer is full, the `overflow` policy determines whether the oldest sample is overwritten,
+        the new sample is dropped, or an error is raised.
+
+        The Aqueduct only holds a weak reference to the Recordable, so it is discarded
+        once the Recipe no longer references it.
+
         :param value: value to assign to the setpoint
         :param name: name to assign to the setpoint
         :param dtype: type of value
-        :type dtype: {"float", "int", "bool", "str", "datetime.datetime", "list"}
+        :type dtype: {"float", "int", "bool", "str", "datetime", "list", "array"}
+        :param capacity: maximum number of samples kept in the Recordable's history
+        :type capacity: int
+        :param overflow: action taken when the history is full
+        :type overflow: {"overwrite", "drop", "raise"}
         :return: Setpoint
         """
-        r = Recordable(name, value, dtype)
-        r.__user_id__ = self.__user_id__
-        r.__aqueduct__ = self
-        self.__recordables__.update({name: r})
-        r.__update__()
+        r = Recordable(name, value, dtype, capacity=capacity, overflow=overflow)
+        self.__register__(self.__recordables__, r)
         return r
 
-    def save_log_file(self, filename: str, timestamp: bool = False, overwrite: bool = False) -> None:
+    def vector_recordable(
+        self,
+        name: str,
+        value: Union[list, tuple],
+        channels: list = None,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_OVERWRITE
+    ) -> VectorRecordable:
+        """
+        Create a multi-channel Recordable.
+
+        Records a fixed-width vector of numeric values per timestamp, such as a
+        snapshot of all channels of a Device, with a single update.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+            weights = aqueduct.vector_recordable(
+                name="weights",
+                value=OHSASIM.get_all_weights(),
+                channels=["W1", "W2", "W3", "W4"],
+            )
+
+            weights.update(OHSASIM.get_all_weights())
+
+        :param name: name to assign to the Recordable
+        :param value: initial vector, its length sets the number of channels
+        :type value: list, tuple, array.array
+        :param channels: names of the channels
+        :type channels: list
+        :param capacity: maximum number of samples kept in the Recordable's history
+        :type capacity: int
+        :param overflow: action taken when the history is full
+        :type overflow: {"overwrite", "drop", "raise"}
+        :return: VectorRecordable
+        """
+        r = VectorRecordable(name, value, channels=channels, capacity=capacity, overflow=overflow)
+        self.__register__(self.__recordables__, r)
+        return r
+
+    def release(self, *names: str) -> int:
+        """
+        Release Setpoints and Recordables by name.
+
+        Pending updates are written, the objects are removed from the user interface
+        and the Aqueduct drops every reference it holds to them. A released object can
+        still be read, but its updates are no longer recorded.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+            r = aqueduct.recordable(name="pressure", value=0.)
+            r.update(1.)
+            aqueduct.release("pressure")
+
+        :param names: names of the Setpoints and Recordables to release
+        :type names: str
+        :return: number of Setpoints and Recordables released
+        :rtype: int
+        """
+        released = []
+        for name in names:
+            for registry in (self.__setpoints__, self.__recordables__):
+                obj = registry.pop(name, None)
+                if obj is not None:
+                    released.append(obj)
+
+        if not released:
+            return 0
+
+        with self.__dirty_lock__:
+            pending = [obj for obj in released if self.__dirty__.pop(obj, False) is None]
+
+        if pending:
+            self.__write__([obj.__entry__() for obj in pending])
+
+        for obj in released:
+            obj.__aqueduct__ = None
+
+        self.__remove__([obj.name for obj in released])
+        return len(released)
+
+    @contextlib.contextmanager
+    def recording_scope(self):
+        """
+        Context manager that releases every Setpoint and Recordable created inside
+        the block when the block exits. Blocks may be nested.
+
+        Use in loops that create many Recordables, such as parameter sweeps, so that
+        memory use does not grow with the number of iterations.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+
+            for rate in (1., 2., 5., 10.):
+                with aqueduct.recording_scope():
+                    r = aqueduct.recordable(name="pressure @ {}".format(rate), value=0.)
+                    # run the step and record data...
+                # "pressure @ <rate>" is released here
+
+        :return: the Aqueduct instance
+        :rtype: Aqueduct
+        """
+        scope = []
+        self.__scopes__.append(scope)
+        try:
+            yield self
+        finally:
+            self.__scopes__.pop()
+            self.release(*scope)
+
+    def transaction(self, timeout: Union[float, int, None] = None):
+        """
+        Context manager that collects the commands sent to Devices inside the block and
+        sends them to the device workers as one message when the block exits, so that
+        several Devices start with minimal skew. If the block raises, no command is sent.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+
+            with aqueduct.transaction():
+                PP.start(...)
+                SV.set_port(...)
+                PV.set_position(...)
+            # the three commands are sent here
+
+        :param timeout: maximum time in seconds to wait for the acknowledgement, None to wait indefinitely
+        :type timeout: float, int, None
+        :return: the transaction
+        :rtype: devices.base.obj.Transaction
+        """
+        import devices.base.obj
+        return devices.base.obj.transaction(timeout)
+
+    def save_log_file(
+        self,
+        filename: str,
+        timestamp: bool = False,
+        overwrite: bool = False,
+        start: Union[float, datetime.datetime] = None,
+        end: Union[float, datetime.datetime] = None
+    ) -> None:
         """
         Save the recipe log file permanently.
 
+        Set `start` and/or `end` to save only the records logged in that range. Only the
+        parts of the log that cover the range are read.
+
+        .. code-block:: python
+
+            aqueduct = Aqueduct(...) # create the Aqueduct instance
+            t0 = datetime.datetime.now()
+            # ... run and log a process step
+            aqueduct.save_log_file("step_1", timestamp=True, start=t0)
+
         :param filename: assign a filename to the log file
         :param timestamp: if set to True, append a timestamp to the filename
         :param overwrite: if set to True, will overwrite an existing filename with the same filename, otherwise
             will append an incrementing number to make the filename unique
+        :param start: POSIX timestamp or datetime of the first record to save, defaults to the start of the log
+        :type start: float, datetime.datetime, None
+        :param end: POSIX timestamp or datetime of the last record to save, defaults to the end of the log
+        :type end: float, datetime.datetime, None
         :return: None
         """
+        if self.__log_writer__ is not None:
+            if timestamp:
+                filename += datetime.datetime.now().strftime('_%Y%m%d_%H%M%S')
+
+            os.makedirs(SAVED_LOG_DIR, exist_ok=True)
+            path = os.path.join(SAVED_LOG_DIR, filename + SAVED_LOG_EXTENSION)
+
+            n = 1
+            while not overwrite and os.path.exists(path):
+                path = os.path.join(SAVED_LOG_DIR, '{}_{}{}'.format(filename, n, SAVED_LOG_EXTENSION))
+                n += 1
+
+            if not self.__log_writer__.flush(DEFAULT_FLUSH_TIMEOUT_S):
+                self.__warn__("The log writer did not finish, pending log records were not saved.")
+            self.__log_writer__.export(path, start=start, end=end, timeout=0)
+            self.__check_log_errors__()
         private()
@@ -0,0 +1,332 @@
+import array
+import datetime
+import threading
+from typing import Iterator, Tuple, Union
+
+
+OVERFLOW_OVERWRITE = 'overwrite'
+OVERFLOW_DROP = 'drop'
+OVERFLOW_RAISE = 'raise'
+
+OVERFLOW_POLICIES = (
+    OVERFLOW_OVERWRITE,
+    OVERFLOW_DROP,
+    OVERFLOW_RAISE,
+)
+
+# one day of samples at 1 Hz, 16 bytes per numeric sample
+DEFAULT_CAPACITY = 86400
+
+TIMESTAMP_TYPECODE = 'd'
+
+
+def to_timestamp(t: Union[float, int, datetime.datetime, None]) -> Union[float, None]:
+    """
+    Convert a `datetime.datetime` or number-like value to
+    a POSIX timestamp in seconds.
+
+    :param t: time to convert
+    :type t: float, int, datetime.datetime, None
+    :return: timestamp
+    :rtype: float, None
+    """
+    if t is None:
+        return None
+    if isinstance(t, datetime.datetime):
+        return t.timestamp()
+    return float(t)
+
+
+class RingBuffer(object):
+    """
+    A bounded, columnar buffer of (timestamp, value) samples.
+
+    Timestamps are stored in a typed `array.array` and values are stored in a typed
+    `array.array` for numeric dtypes (see `aqueduct.dtypes.DTYPES`) or in a `list` otherwise.
+    Storage grows as samples are appended and never exceeds `capacity` samples,
+    after which the buffer behaves as a ring and appends are O(1).
+
+    When the buffer is full, the `overflow` policy determines what happens to a new sample:
+
+    =================  ==========================================
+        overflow                       action
+    =================  ==========================================
+      'overwrite'        replace the oldest sample (default)
+      'drop'             discard the new sample
+      'raise'            raise a `BufferError`
+    =================  ==========================================
+
+    All read methods return `(timestamps, values)` copies of the requested range only.
+    Appends and reads hold a short lock, so a read from another thread is consistent
+    with the samples it returns.
+
+    If `width` is set, each sample is a fixed-width vector. The vectors are stored
+    contiguously in a single typed array and `values` is returned flattened, so
+    the value of channel `c` of sample `k` is `values[k * width + c]`.
+
+    :param capacity: maximum number of samples held in the buffer
+    :type capacity: int
+    :param typecode: `array.array` typecode of the value column, set to None to store values in a list
+    :type typecode: str, None
+    :param overflow: overflow policy
+    :type overflow: {'overwrite', 'drop', 'raise'}
+    :param width: number of values per sample, None for scalar samples, requires a `typecode`
+    :type width: int, None
+    """
+
+    __slots__ = (
+        'capacity',
+        'typecode',
+        'overflow',
+        'width',
+        'dropped',
+        '_timestamps',
+        '_values',
+        '_head',
+        '_count',
+        '_lock',
+    )
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        typecode: str = None,
+        overflow: str = OVERFLOW_OVERWRITE,
+        width: int = None
+    ):
+        """
+        Constructor method.
+        """
+        capacity = int(capacity)
+
+        if width is not None:
+            width = int(width)
+            if width < 1 or typecode is None:
+                raise ValueError("Invalid buffer width: {}".format(width))
+
+        if capacity < 1:
+            raise ValueError("Invalid buffer capacity: {}".format(capacity))
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("Invalid buffer overflow policy: {}".format(overflow))
+
+        self.capacity: int = capacity
+        self.typecode: str = typecode
+        self.overflow: str = overflow
+        self.width: int = width
+        self.dropped: int = 0
+
+        self._timestamps = array.array(TIMESTAMP_TYPECODE)
+        self._values = array.array(typecode) if typecode is not None else []
+        self._head: int = 0
+        self._count: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def count(self) -> int:
+        """
+        Total number of samples appended since the buffer was created or cleared,
+        including any samples that have since been overwritten.
+
+        :return: count
+        :rtype: int
+        """
+        return self._count
+
+    def append(self, timestamp: float, value) -> bool:
+        """
+        Append a sample to the buffer.
+
+        :param timestamp: POSIX timestamp of the sample in seconds
+        :type timestamp: float
+        :param value: value of the sample, an `array.array` of `width` values if `width` is set
+        :return: True if the sample was stored, False if it was dropped
+        :rtype: bool
+        """
+        w = self.width
+
+        if w is not None and len(value) != w:
+            raise ValueError("Expected {} values, got {}".format(w, len(value)))
+
+        with self._lock:
+            size = len(self._timestamps)
+
+            # the value is stored first, a value rejected by the typed array leaves the buffer unchanged
+            if size < self.capacity:
+                if w is None:
+                    self._values.append(value)
+                else:
+                    self._values.extend(value)
+                self._timestamps.append(timestamp)
+
+            elif self.overflow == OVERFLOW_OVERWRITE:
+                i = self._head
+                if w is None:
+                    self._values[i] = value
+                else:
+                    self._values[i * w:(i + 1) * w] = value
+                self._timestamps[i] = timestamp
+                self._head = (i + 1) % self.capacity
+                self.dropped += 1
+
+            elif self.overflow == OVERFLOW_DROP:
+                self.dropped += 1
+                return False
+
+            else:
+                raise BufferError("Buffer capacity of {} samples exceeded".format(self.capacity))
+
+            self._count += 1
+            return True
+
+    def clear(self) -> None:
+        """
+        Remove all samples from the buffer and release the storage.
+
+        :return: None
+        """
+        with self._lock:
+            self._timestamps = array.array(TIMESTAMP_TYPECODE)
+            self._values = array.array(self.typecode) if self.typecode is not None else []
+            self._head = 0
+            self._count = 0
+            self.dropped = 0
+
+    def _physical(self, i: int) -> int:
+        return (self._head + i) % len(self._timestamps)
+
+    def _segments(self, lo: int, hi: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the physical (start, stop) index pairs covering the logical range [lo, hi).
+        """
+        if hi <= lo:
+            return
+        size = len(self._timestamps)
+        a = self._physical(lo)
+        n = hi - lo
+        if a + n <= size:
+            yield a, a + n
+        else:
+            yield a, size
+            yield 0, a + n - size
+
+    def _slice(self, lo: int, hi: int, step: int = 1) -> tuple:
+        timestamps = array.array(TIMESTAMP_TYPECODE)
+        values = array.array(self.typecode) if self.typecode is not None else []
+        w = self.width
+        offset = 0
+        for a, b in self._segments(lo, hi):
+            timestamps.extend(self._timestamps[a + offset:b:step])
+            if w is None:
+                values.extend(self._values[a + offset:b:step])
+            elif step == 1:
+                values.extend(self._values[a * w:b * w])
+            else:
+                for i in range(a + offset, b, step):
+                    values.extend(self._values[i * w:(i + 1) * w])
+            offset = (step - (b - a - offset) % step) % step
+        return timestamps, values
+
+    def _bisect(self, t: float) -> int:
+        """
+        Return the logical index of the first sample with a timestamp >= `t`.
+        """
+        lo, hi = 0, len(self._timestamps)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamps[self._physical(mid)] < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisect_right(self, t: float) -> int:
+        """
+        Return the logical index of the first sample with a timestamp > `t`.
+        """
+        lo, hi = 0, len(self._timestamps)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if t < self._timestamps[self._physical(mid)]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _range(self, start: float = None, end: float = None) -> Tuple[int, int]:
+        lo = 0 if start is None else self._bisect(start)
+        hi = len(self._timestamps) if end is None else self._bisect_right(end)
+        return lo, max(lo, hi)
+
+    def last(self, n: int = 1) -> tuple:
+        """
+        Get the most recent `n` samples, oldest first.
+
+        :param n: number of samples
+        :type n: int
+        :return: (timestamps, values)
+        :rtype: tuple
+        """
+        with self._lock:
+            size = len(self._timestamps)
+            return self._slice(max(0, size - int(n)), size)
+
+    def since(self, count: int, end: int = None) -> tuple:
+        """
+        Get the samples appended after the buffer's `count` reached the given value,
+        and before it reached `end`.
+
+        Samples that have already been overwritten are not returned.
+
+        :param count: value of `count` at the previous read
+        :type count: int
+        :param end: value of `count` at this read, None for the current value
+        :type end: int, None
+        :return: (timestamps, values)
+        :rtype: tuple
+        """
+        with self._lock:
+            total = self._count
+            size = len(self._timestamps)
+            end = total if end is None else min(int(end), total)
+            return self._slice(max(0, size - (total - int(count))), max(0, size - (total - end)))
+
+    def window(self, start: float = None, end: float = None) -> tuple:
+        """
+        Get the samples with timestamps in the closed interval [`start`, `end`].
+
+        Timestamps are expected to be non-decreasing, the range is located with a binary search.
+
+        :param start: POSIX timestamp of the start of the window, None for the oldest sample
+        :type start: float, None
+        :param end: POSIX timestamp of the end of the window, None for the newest sample
+        :type end: float, None
+        :return: (timestamps, values)
+        :rtype: tuple
+        """
+        with self._lock:
+            return self._slice(*self._range(start, end))
+
+    def downsample(self, max_points: int, start: float = None, end: float = None) -> tuple:
+        """
+        Get at most `max_points` evenly strided samples from the window [`start`, `end`].
+
+        :param max_points: maximum number of samples to return
+        :type max_points: int
+        :param start: POSIX timestamp of the start of the window, None for the oldest sample
+        :type start: float, None
+        :param end: POSIX timestamp of the end of the window, None for the newest sample
+        :type end: float, None
+        :return: (timestamps, values)
+        :rtype: tuple
+        """
+        max_points = int(max_points)
+        if max_points < 1:
+            raise ValueError("Invalid number of points: {}".format(max_points))
+        with self._lock:
+            lo, hi = self._range(start, end)
+            step = max(1, -(-(hi - lo) // max_points))
+            return self._slice(lo, hi, step)
@@ -0,0 +1,216 @@
+import asyncio
+import datetime
+import threading
+import time
+from typing import Callable, Union
+
+
+class Completion(object):
+    """
+    Base class for User interactions, such as Prompts and Inputs, that complete
+    when a User executes them or when they time-out.
+
+    Completion is signalled with a `threading.Event`, so waiting costs no CPU
+    and a pending truthiness test blocks briefly on the Event instead of spinning.
+    A Completion can be waited
+    on with :py:func:`wait`, awaited in a coroutine, or can trigger callbacks.
+    Callbacks of a Completion created by Aqueduct run on its callback executor,
+    never on the update thread.
+
+    :param timeout_s: the length of time in seconds before the Completion
+        expires, set to None to disable a time-out, should be number-like
+    :type timeout_s: float, int, str, None, optional
+    """
+
+    __slots__ = (
+        'start_time',
+        'timeout_s',
+        'timed_out',
+        '__event__',
+        '__lock__',
+        '__callbacks__',
+        '__deadline__',
+        '__dispatch__',
+        '__updating__',
+        '__weakref__',
+    )
+
+    start_time: datetime.datetime
+    timeout_s: Union[int, float, str, None]
+    timed_out: bool
+
+    __POLL_S = 0.5
+
+    # time a truthiness test of a pending Completion blocks on the Event,
+    # so `while p:` loops do not spin
+    __PENDING_S = 0.01
+
+    def __init__(self, timeout_s: Union[int, float, str, None] = None):
+        """
+        Constructor method.
+        """
+        self.start_time = datetime.datetime.now()
+        self.timeout_s = timeout_s
+        self.timed_out = False
+        self.__event__ = threading.Event()
+        self.__lock__ = threading.Lock()
+        self.__callbacks__ = []
+        self.__deadline__ = None if timeout_s is None else time.monotonic() + float(timeout_s)
+        # runs the callbacks, None to run them on the completing thread
+        self.__dispatch__: Union[Callable, None] = None
+        # returns whether the update thread checks the Completion, None if it is not tracked
+        self.__updating__: Union[Callable, None] = None
+
+    def __bool__(self):
+        """
+        Override the built-in truth value testing.
+
+        Returns `True` when a truthiness test is performed until the
+        Completion has been executed by a User or has timed-out. The state is
+        updated by the update thread; when the update thread is not running, the
+        test checks the state itself. A pending test blocks on the Event for up
+        to `__PENDING_S` seconds, so a `while p:` loop does not spin.
+
+        :return: pending
+        :rtype: bool
+        """
+        if self.__event__.is_set():
+            return False
+
+        updating = self.__updating__
+        if (updating is None or not updating()) and self.__check__():
+            return False
+
+        return not self.__event__.wait(self.__PENDING_S)
+
+    def __await__(self):
+        """
+        Allow the Completion to be awaited in a coroutine.
+
+        .. code-block:: python
+
+            p = aqueduct.prompt(message="Continue?", pause_recipe=False)
+            await p
+
+        :return: the Completion
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def resolve(future_):
+            if not future_.done():
+                future_.set_result(self)
+
+        self.add_callback(lambda c: loop.call_soon_threadsafe(resolve, future))
+        return (yield from future)
+
+    def __poll__(self) -> bool:
+        """
+        Private method to read whether the User has executed the Completion
+        from memory. Not for API use.
+
+        :return: executed
+        :rtype: bool
+        """
+        return True
+
+    def __check__(self) -> bool:
+        """
+        Private method to update the completion state. Called by the helper
+        thread. Not for API use.
+
+        :return: done
+        :rtype: bool
+        """
+        if self.__event__.is_set():
+            return True
+
+        if self.__poll__():
+            self.__complete__(timed_out=False)
+        elif self.__deadline__ is not None and time.monotonic() >= self.__deadline__:
+            self.__complete__(timed_out=True)
+
+        return self.__event__.is_set()
+
+    def __complete__(self, timed_out: bool = False) -> None:
+        """
+        Private method to mark the Completion as done and run the callbacks. Not for API use.
+
+        :param timed_out: whether the Completion expired
+        :type timed_out: bool
+        :return: None
+        """
+        with self.__lock__:
+            if self.__event__.is_set():
+                return
+            self.timed_out = timed_out
+            self.__event__.set()
+            callbacks, self.__callbacks__ = self.__callbacks__, []
+
+        dispatch = self.__dispatch__
+        for callback in callbacks:
+            if dispatch is None:
+                callback(self)
+            else:
+                dispatch(callback, self)
+
+    def done(self) -> bool:
+        """
+        Check whether the Completion has been executed or has timed-out.
+
+        :return: done
+        :rtype: bool
+        """
+        return self.__check__()
+
+    def wait(self, timeout: Union[int, float, None] = None) -> bool:
+        """
+        Block until the Completion has been executed or has timed-out.
+
+        .. code-block:: python
+
+            p = aqueduct.prompt(message="Continue?", pause_recipe=False)
+            if not p.wait(timeout=30):
+                print("Still waiting...")
+
+        :param timeout: maximum time to block in seconds, None to block indefinitely
+        :type timeout: int, float, None
+        :return: done
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self.__check__():
+            step = self.__POLL_S
+            if deadline is not None:
+                step = min(step, deadline - time.monotonic())
+                if step <= 0:
+                    return False
+            self.__event__.wait(step)
+
+        return True
+
+    def add_callback(self, callback: Callable) -> None:
+        """
+        Register a callable to run when the Completion has been executed or has timed-out.
+
+        The callable is passed the Completion as its only argument. If the Completion
+        is already done, the callable runs immediately.
+
+        .. code-block:: python
+
+            p = aqueduct.prompt(message="Continue?", pause_recipe=False)
+            p.add_callback(lambda c: print("timed out" if c.timed_out else "dismissed"))
+
+        :param callback: callable taking the Completion as its argument
+        :type callback: Callable
+        :return: None
+        """
+        self.__check__()
+
+        with self.__lock__:
+            if not self.__event__.is_set():
+                self.__callbacks__.append(callback)
+                return
+
+        callback(self)
@@ -0,0 +1,231 @@
+import builtins
+import collections
+import sys
+import threading
+import time
+from typing import Union
+
+
+# maximum number of pending writes held in memory...
+DEFAULT_MAX_PENDING = 10000
+
+# ...and maximum number of pending characters, whichever is reached first
+DEFAULT_MAX_PENDING_CHARS = 1024 * 1024
+
+# sustained number of writes per second accepted from the Recipe...
+DEFAULT_RATE_LIMIT = 1000.
+
+# ...and number of writes accepted in a burst above that rate
+DEFAULT_BURST = 2000
+
+DEFAULT_FLUSH_INTERVAL_S = 0.1
+
+STDOUT = 0
+STDERR = 1
+
+
+class ConsoleWriter(object):
+    """
+    A bounded, non-blocking replacement for the Recipe's `print`.
+
+    Calls to :py:func:`print` format the text on the calling thread and append it to an
+    in-memory queue. A background thread drains the queue every `flush_interval_s` seconds
+    and writes the text to the `out` and `err` streams in one operation per stream, so a
+    slow consumer of the streams never blocks the Recipe.
+
+    Memory is bounded by `max_pending` writes and `max_pending_chars` characters. Writes
+    are rate limited with a token bucket of `rate_limit` writes per second and a burst of
+    `burst` writes. Writes that are rejected are counted in `dropped` and `rate_limited`
+    and a notice with the number of missing writes is written in their place.
+
+    :param out: stream for standard output, None to use `sys.stdout` at write time
+    :type out: io.TextIOWrapper, None
+    :param err: stream for standard error, None to use `sys.stderr` at write time
+    :type err: io.TextIOWrapper, None
+    :param max_pending: maximum number of pending writes
+    :type max_pending: int
+    :param max_pending_chars: maximum number of pending characters
+    :type max_pending_chars: int
+    :param rate_limit: sustained writes per second, None to disable rate limiting
+    :type rate_limit: float, None
+    :param burst: writes accepted in a burst above `rate_limit`
+    :type burst: int
+    :param flush_interval_s: interval in seconds between writes to the streams
+    :type flush_interval_s: float
+    """
+
+    def __init__(
+        self,
+        out=None,
+        err=None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_pending_chars: int = DEFAULT_MAX_PENDING_CHARS,
+        rate_limit: Union[float, None] = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_BURST,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S
+    ):
+        """
+        Constructor method.
+        """
+        self.out = out
+        self.err = err
+        self.max_pending: int = max_pending
+        self.max_pending_chars: int = max_pending_chars
+        self.rate_limit: Union[float, None] = rate_limit
+        self.burst: int = burst
+        self.flush_interval_s: float = flush_interval_s
+
+        self.dropped: int = 0
+        self.rate_limited: int = 0
+
+        self.__pending__ = collections.deque()
+        self.__pending_chars__: int = 0
+        self.__missed__: int = 0
+        self.__lock__ = threading.Lock()
+        self.__wake__ = threading.Event()
+        self.__closed__: bool = False
+        self.__tokens__: float = float(burst)
+        self.__last_refill__: float = time.monotonic()
+
+        self.__thread__ = threading.Thread(target=self.__run__, daemon=True)
+        self.__thread__.start()
+
+    def print(self, *s, sep: str = ' ', end: str = '', file=None, flush: bool = False) -> None:
+        """
+        Drop-in replacement for the builtin `print`. Never blocks on the output streams.
+
+        Unlike the builtin, `end` defaults to an empty string. Output to `sys.stderr` is
+        directed to the `err` stream, output to any other `file` is written directly.
+
+        :param s: objects to print
+        :param sep: string inserted between the objects
+        :type sep: str
+        :param end: string appended after the last object
+        :type end: str
+        :param file: stream, None for standard output
+        :param flush: wake the writer thread immediately
+        :type flush: bool
+        :return: None
+        """
+        if file is None or file is sys.stdout or file is self.out:
+            stream = STDOUT
+        elif file is sys.stderr or file is self.err:
+            stream = STDERR
+        else:
+            builtins.print(*s, sep=sep, end=end, file=file, flush=flush)
+            return
+
+        self.write((sep if sep is not None else ' ').join(map(str, s)) + (end if end is not None else ''), stream)
+        if flush:
+            self.__wake__.set()
+
+    def write(self, text: str, stream: int = STDOUT) -> bool:
+        """
+        Queue text for a stream. Never blocks on the output streams.
+
+        :param text: text to write
+        :type text: str
+        :param stream: `STDOUT` or `STDERR`
+        :type stream: int
+        :return: True if the text was queued, False if it was dropped
+        :rtype: bool
+        """
+        with self.__lock__:
+            if self.rate_limit is not None:
+                now = time.monotonic()
+                self.__tokens__ = min(
+                    float(self.burst),
+                    self.__tokens__ + (now - self.__last_refill__) * self.rate_limit
+                )
+                self.__last_refill__ = now
+                if self.__tokens__ < 1.:
+                    self.rate_limited += 1
+                    self.__missed__ += 1
+                    return False
+                self.__tokens__ -= 1.
+
+            if (
+                len(self.__pending__) >= self.max_pending
+                or self.__pending_chars__ + len(text) > self.max_pending_chars
+            ):
+                self.dropped += 1
+                self.__missed__ += 1
+                return False
+
+            self.__pending__.append((stream, text))
+            self.__pending_chars__ += len(text)
+
+        return True
+
+    def flush(self, timeout: Union[int, float, None] = None) -> bool:
+        """
+        Block until every write queued before the call has been written to the streams.
+
+        :param timeout: maximum time to block in seconds, None to block indefinitely
+        :type timeout: int, float, None
+        :return: True if all writes were written
+        :rtype: bool
+        """
+        if self.__closed__:
+            return True
+        marker = threading.Event()
+        with self.__lock__:
+            self.__pending__.append((None, marker))
+        self.__wake__.set()
+        return marker.wait(timeout)
+
+    def close(self, timeout: Union[int, float, None] = None) -> None:
+        """
+        Write all pending text and stop the writer thread.
+
+        :param timeout: maximum time to wait for pending text in seconds, None to wait indefinitely
+        :type timeout: int, float, None
+        :return: None
+        """
+        if self.__closed__:
+            return
+        self.flush(timeout)
+        self.__closed__ = True
+        self.__wake__.set()
+        self.__thread__.join(timeout)
+
+    def __write_pending__(self) -> None:
+        with self.__lock__:
+            pending, self.__pending__ = self.__pending__, collections.deque()
+            self.__pending_chars__ = 0
+            missed, self.__missed__ = self.__missed__, 0
+
+        if not pending and not missed:
+            return
+
+        chunks = ([], [])
+        markers = []
+
+        for stream, item in pending:
+            if stream is None:
+                markers.append(item)
+            else:
+                chunks[stream].append(item)
+
+        if missed:
+            chunks[STDERR].append('\n[{} lines of output dropped]\n'.format(missed))
+
+        for stream, text in ((self.out or sys.stdout, chunks[STDOUT]), (self.err or sys.stderr, chunks[STDERR])):
+            if not text:
+                continue
+            try:
+                stream.write(''.join(text))
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+
+        for marker in markers:
+            marker.set()
+
+    def __run__(self) -> None:
+        while True:
+            self.__wake__.wait(self.flush_interval_s)
+            self.__wake__.clear()
+            self.__write_pending__()
+            if self.__closed__ and not self.__pending__:
+                break
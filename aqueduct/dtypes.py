@@ -0,0 +1,198 @@
+import array
+import datetime
+from typing import Callable, Union
+
+
+DTYPE_INT = int.__name__
+DTYPE_FLOAT = float.__name__
+DTYPE_BOOL = bool.__name__
+DTYPE_LIST = list.__name__
+DTYPE_DATETIME = datetime.datetime.__name__
+DTYPE_STR = str.__name__
+DTYPE_ARRAY = 'array'
+
+# typecode of the values of an 'array' dtype
+ARRAY_TYPECODE = 'd'
+
+# range of the 'q' typecode storing 'int' values
+INT_MIN = -(1 << 63)
+INT_MAX = (1 << 63) - 1
+
+
+def _to_int(value) -> int:
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError("{} is not an integer".format(value))
+    value = int(value)
+    if not INT_MIN <= value <= INT_MAX:
+        raise ValueError("{} is out of the range of a 64-bit integer".format(value))
+    return value
+
+
+def _to_float(value) -> float:
+    if value is None:
+        raise ValueError("None is not a float")
+    return float(value)
+
+
+def _to_array_value(value) -> float:
+    # NaN marks a missing value of a vector
+    if value is None:
+        return float('nan')
+    return float(value)
+
+
+def _to_bool(value) -> bool:
+    if isinstance(value, str):
+        v = value.strip().lower()
+        if v in ('true', '1'):
+            return True
+        if v in ('false', '0', ''):
+            return False
+        raise ValueError("{} is not a boolean".format(value))
+    return bool(value)
+
+
+def _to_list(value) -> list:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, (str, bytes, dict)):
+        raise ValueError("{} is not a list".format(value))
+    return list(value)
+
+
+def _to_datetime(value) -> datetime.datetime:
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.datetime.fromtimestamp(value)
+    raise ValueError("{} is not a datetime".format(value))
+
+
+def _to_array(value) -> array.array:
+    if isinstance(value, array.array) and value.typecode == ARRAY_TYPECODE:
+        return array.array(ARRAY_TYPECODE, value)
+    if isinstance(value, (str, bytes, dict)):
+        raise ValueError("{} is not a numeric array".format(value))
+    return array.array(ARRAY_TYPECODE, [_to_array_value(v) for v in value])
+
+
+class DType(object):
+    """
+    An entry of the dtype registry.
+
+    :param name: name of the dtype, as assigned to `Setpoint.dtype` and `Recordable.dtype`
+    :type name: str
+    :param coerce: callable that validates a value and returns it normalized
+        to the dtype, raises `ValueError` or `TypeError` for invalid values
+    :type coerce: Callable
+    :param typecode: `array.array` typecode used to store scalar values of the dtype
+        in a Recordable's history, None to store values in a `list`
+    :type typecode: str, None
+    """
+
+    __slots__ = (
+        'name',
+        'coerce',
+        'typecode',
+    )
+
+    def __init__(self, name: str, coerce: Callable, typecode: Union[str, None] = None):
+        """
+        Constructor method.
+        """
+        self.name = name
+        self.coerce = coerce
+        self.typecode = typecode
+
+
+DTYPES = {
+    d.name: d for d in (
+        DType(DTYPE_INT, _to_int, 'q'),
+        DType(DTYPE_FLOAT, _to_float, 'd'),
+        DType(DTYPE_BOOL, _to_bool, 'b'),
+        DType(DTYPE_LIST, _to_list),
+        DType(DTYPE_DATETIME, _to_datetime),
+        DType(DTYPE_STR, str),
+        DType(DTYPE_ARRAY, _to_array),
+    )
+}
+
+ALLOWED_DTYPES = frozenset(DTYPES)
+
+# alternative names accepted for the `dtype` argument
+DTYPE_ALIASES = {
+    'datetime.datetime': DTYPE_DATETIME,
+    'ndarray': DTYPE_ARRAY,
+}
+
+# dtype of a value, looked up by the exact type of the value
+PYTHON_TYPES = {
+    int: DTYPE_INT,
+    float: DTYPE_FLOAT,
+    bool: DTYPE_BOOL,
+    list: DTYPE_LIST,
+    datetime.datetime: DTYPE_DATETIME,
+    str: DTYPE_STR,
+    array.array: DTYPE_ARRAY,
+}
+
+
+def get_dtype(name: str) -> DType:
+    """
+    Get the registry entry of a dtype.
+
+    :param name: name or alias of the dtype
+    :type name: str
+    :return: DType
+    :rtype: DType
+    :raises ValueError: if the dtype is not allowed
+    """
+    d = DTYPES.get(DTYPE_ALIASES.get(name, name))
+    if d is None:
+        raise ValueError("dtype {} is not allowed, must be one of {}".format(name, sorted(ALLOWED_DTYPES)))
+    return d
+
+
+def infer_dtype(value) -> DType:
+    """
+    Get the registry entry of the dtype of a value.
+
+    The exact type of the value is looked up first, subclasses (for instance
+    a `numpy.float64`) fall back to the first matching type.
+
+    :param value: value
+    :return: DType
+    :rtype: DType
+    :raises ValueError: if the type of the value is not allowed
+    """
+    name = PYTHON_TYPES.get(type(value))
+    if name is None:
+        for t, n in PYTHON_TYPES.items():
+            if isinstance(value, t):
+                name = n
+                break
+        else:
+            if type(value).__name__ == 'ndarray':
+                name = DTYPE_ARRAY
+            else:
+                raise ValueError("Object of type {} is not allowed".format(type(value).__name__))
+    return DTYPES[name]
+
+
+def resolve(value, dtype: Union[str, None] = None) -> DType:
+    """
+    Get the registry entry for a value and an optional dtype name, inferring
+    the dtype from the value if `dtype` is None.
+
+    :param value: value
+    :param dtype: name or alias of the dtype
+    :type dtype: str, None
+    :return: DType
+    :rtype: DType
+    :raises ValueError: if the dtype is not allowed
+    """
+    if dtype is None:
+        return infer_dtype(value)
+    return get_dtype(dtype)
@@ -0,0 +1,430 @@
+import bisect
+import collections
+import datetime
+import json
+import os
+import threading
+import time
+from typing import List, Tuple, Union
+
+from .buffer import to_timestamp
+
+
+LOG_FORMAT_VERSION = 1
+
+LOG_FILE_EXTENSION = '.ndjson'
+
+# rotate to a new segment after this many bytes...
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# ...or after this many seconds, whichever comes first
+DEFAULT_MAX_AGE_S = 24 * 60 * 60
+
+DEFAULT_FLUSH_INTERVAL_S = 0.5
+
+# segments kept on disk for a log path, older segments are deleted
+DEFAULT_MAX_SEGMENTS = 32
+
+# number of records between entries in a segment's seek index
+INDEX_INTERVAL = 256
+
+# wake the writer thread early once this many records are pending
+WAKE_THRESHOLD = 4096
+
+# records pending above this number are dropped
+DEFAULT_MAX_PENDING = 1000000
+
+# maximum time in seconds `close` and `export` wait for the writer thread
+DEFAULT_FLUSH_TIMEOUT_S = 10.
+
+
+def _segment_files(path: str) -> List[Tuple[int, str]]:
+    # (index, path) of the segments of the log at `path` on disk, in index order
+    directory, base = os.path.split(path)
+    prefix = base + '.'
+    try:
+        names = os.listdir(directory or '.')
+    except OSError:
+        return []
+    files = []
+    for name in names:
+        if name.startswith(prefix) and name.endswith(LOG_FILE_EXTENSION):
+            index = name[len(prefix):-len(LOG_FILE_EXTENSION)]
+            if index.isdigit():
+                files.append((int(index), os.path.join(directory, name)))
+    return sorted(files)
+
+
+class LogSegment(object):
+    """
+    A single rotated file of a :class:`LogWriter` and its sparse seek index.
+
+    :param path: path of the segment file
+    :type path: str
+    """
+
+    def __init__(self, path: str):
+        """
+        Constructor method.
+        """
+        self.path: str = path
+        self.first_t: float = None
+        self.last_t: float = None
+        self.created: float = time.monotonic()
+        self.size: int = 0
+        self.records: int = 0
+        self.index_t: List[float] = []
+        self.index_offset: List[int] = []
+
+    def seek_offset(self, t: Union[float, None]) -> int:
+        """
+        Get a byte offset at or before the first record with a timestamp >= `t`.
+
+        :param t: monotonic timestamp, None for the start of the segment
+        :type t: float, None
+        :return: offset
+        :rtype: int
+        """
+        if t is None or not self.index_t:
+            return 0
+        i = bisect.bisect_left(self.index_t, t) - 1
+        return self.index_offset[i] if i >= 0 else 0
+
+
+class LogWriter(object):
+    """
+    A buffered, structured log sink.
+
+    Calls to :py:func:`write` only append the record to an in-memory queue. A background
+    thread serializes pending records as newline-delimited JSON and writes them to disk
+    in one operation every `flush_interval_s` seconds, or sooner when many records are pending.
+    At most `max_pending` records are queued, records written above the limit are counted
+    in `dropped` and a record with the number of missing records is written in their place.
+    Data that cannot be serialized as JSON is written as its `str`. A batch that fails to be
+    written to disk is counted in `errors` and the writer continues with a new segment.
+
+    Each line is a record of the form `{"t": <monotonic timestamp>, "d": <data>}`. The first
+    line of every file is a header that anchors the monotonic clock to wall-clock time.
+
+    Files are rotated after `max_bytes` bytes or `max_age_s` seconds. Segment numbers continue
+    from the segments already on disk, so a new run never overwrites the log of a previous
+    run, and only the newest `max_segments` segments are kept. Each segment keeps a
+    sparse index of record offsets, so :py:func:`export` can seek directly to the start of a
+    time range instead of reading the log from the beginning.
+
+    :param path: base path of the log, segments are written to `<path>.<n>.ndjson`
+    :type path: str
+    :param max_bytes: size in bytes after which a new segment is started
+    :type max_bytes: int
+    :param max_age_s: age in seconds after which a new segment is started
+    :type max_age_s: float
+    :param flush_interval_s: interval in seconds between writes to disk
+    :type flush_interval_s: float
+    :param max_pending: maximum number of pending records
+    :type max_pending: int
+    :param max_segments: number of segments kept on disk, including those of previous runs
+    :type max_segments: int
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_segments: int = DEFAULT_MAX_SEGMENTS
+    ):
+        """
+        Constructor method.
+        """
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self.max_age_s: float = max_age_s
+        self.flush_interval_s: float = flush_interval_s
+        self.max_pending: int = max_pending
+        self.max_segments: int = max(1, max_segments)
+        self.dropped: int = 0
+        # number of batches lost to I/O errors, and the last error
+        self.errors: int = 0
+        self.last_error: Union[BaseException, None] = None
+        self.segments: List[LogSegment] = []
+
+        # offset to convert monotonic timestamps to POSIX timestamps
+        self.__clock_offset__: float = time.time() - time.monotonic()
+
+        self.__pending__ = collections.deque()
+        self.__missed__: int = 0
+        self.__wake__ = threading.Event()
+        self.__closed__: bool = False
+        self.__file__ = None
+        existing = _segment_files(path)
+        self.__next_index__: int = existing[-1][0] + 1 if existing else 0
+
+        self.__thread__ = threading.Thread(target=self.__run__, daemon=True)
+        self.__thread__.start()
+
+    def write(self, data) -> bool:
+        """
+        Queue a record. Never blocks on disk I/O.
+
+        :param data: data to log, must be JSON serializable or convertible with `str`
+        :return: True if the record was queued, False if it was dropped
+        :rtype: bool
+        """
+        n = len(self.__pending__)
+        if n >= self.max_pending:
+            self.dropped += 1
+            self.__missed__ += 1
+            self.__wake__.set()
+            return False
+        self.__pending__.append((time.monotonic(), data))
+        if n + 1 >= WAKE_THRESHOLD:
+            self.__wake__.set()
+        return True
+
+    def flush(self, timeout: Union[int, float, None] = None) -> bool:
+        """
+        Block until every record queued before the call has been written to disk.
+
+        :param timeout: maximum time to block in seconds, None to block indefinitely
+        :type timeout: int, float, None
+        :return: True if all records were written, False on timeout or if the writer thread has stopped
+        :rtype: bool
+        """
+        if self.__closed__:
+            return not self.__thread__.is_alive()
+        if not self.__thread__.is_alive():
+            return False
+        marker = threading.Event()
+        self.__pending__.append(marker)
+        self.__wake__.set()
+        return marker.wait(timeout)
+
+    def close(self, timeout: Union[int, float, None] = DEFAULT_FLUSH_TIMEOUT_S) -> bool:
+        """
+        Write all pending records and stop the writer thread.
+
+        :param timeout: maximum time to wait for pending records in seconds, None to wait indefinitely
+        :type timeout: int, float, None
+        :return: True if all records were written and the writer thread has stopped
+        :rtype: bool
+        """
+        if self.__closed__:
+            return not self.__thread__.is_alive()
+        written = self.flush(timeout)
+        self.__closed__ = True
+        self.__wake__.set()
+        self.__thread__.join(timeout)
+        return written and not self.__thread__.is_alive()
+
+    def to_timestamp(self, t: float) -> float:
+        """
+        Convert a monotonic record timestamp to a POSIX timestamp.
+
+        :param t: monotonic timestamp
+        :type t: float
+        :return: POSIX timestamp
+        :rtype: float
+        """
+        return t + self.__clock_offset__
+
+    def to_monotonic(self, t: Union[float, datetime.datetime, None]) -> Union[float, None]:
+        """
+        Convert a POSIX timestamp or datetime to the monotonic clock used by the records.
+
+        :param t: POSIX timestamp or datetime
+        :type t: float, datetime.datetime, None
+        :return: monotonic timestamp
+        :rtype: float, None
+        """
+        t = to_timestamp(t)
+        return None if t is None else t - self.__clock_offset__
+
+    def export(
+        self,
+        destination: str,
+        start: Union[float, datetime.datetime] = None,
+        end: Union[float, datetime.datetime] = None,
+        raw: bool = False,
+        timeout: Union[int, float, None] = DEFAULT_FLUSH_TIMEOUT_S
+    ) -> int:
+        """
+        Write the records between `start` and `end` to `destination`.
+
+        Only the segments that overlap the range are opened and each is read from
+        the indexed offset closest to `start`.
+
+        By default records are written as text lines with the ISO format
+        'YYYY-MM-DDTHH:MM:SS.mmmmmm: data'. Set `raw` to True to copy the JSON records.
+
+        Pending records are written first, records still pending after `timeout` are not exported.
+
+        :param destination: path of the exported file
+        :type destination: str
+        :param start: POSIX timestamp or datetime of the start of the range, None for the first record
+        :type start: float, datetime.datetime, None
+        :param end: POSIX timestamp or datetime of the end of the range, None for the last record
+        :type end: float, datetime.datetime, None
+        :param raw: copy the JSON records instead of formatting text lines
+        :type raw: bool
+        :param timeout: maximum time to wait for pending records in seconds, None to wait indefinitely
+        :type timeout: int, float, None
+        :return: number of records exported
+        :rtype: int
+        """
+        self.flush(timeout)
+
+        start_t, end_t = self.to_monotonic(start), self.to_monotonic(end)
+        count = 0
+
+        with open(destination, 'wb') as out:
+            for segment in list(self.segments):
+                if segment.first_t is None:
+                    continue
+                if start_t is not None and segment.last_t < start_t:
+                    continue
+                if end_t is not None and segment.first_t > end_t:
+                    break
+
+                with open(segment.path, 'rb') as f:
+                    f.seek(segment.seek_offset(start_t))
+                    for line in f:
+                        record = json.loads(line)
+                        t = record.get('t')
+                        if t is None or (start_t is not None and t < start_t):
+                            continue
+                        if end_t is not None and t > end_t:
+                            break
+                        if raw:
+                            out.write(line)
+                        else:
+                            iso = datetime.datetime.fromtimestamp(self.to_timestamp(t)).isoformat()
+                            out.write((iso + ': ' + str(record.get('d')) + '\n').encode())
+                        count += 1
+
+        return count
+
+    def __open_segment__(self) -> None:
+        if self.__file__ is not None:
+            self.__file__.close()
+
+        segment = LogSegment('{}.{}{}'.format(self.path, self.__next_index__, LOG_FILE_EXTENSION))
+        self.__next_index__ += 1
+        self.__file__ = open(segment.path, 'wb')
+        header = self.__encode__(dict(v=LOG_FORMAT_VERSION, clock_offset=self.__clock_offset__))
+        self.__file__.write(header)
+        segment.size = len(header)
+        self.segments.append(segment)
+        self.__prune__()
+
+    def __prune__(self) -> None:
+        # delete the oldest segments on disk above `max_segments`
+        removed = set()
+        for _, path in _segment_files(self.path)[:-self.max_segments]:
+            try:
+                os.remove(path)
+                removed.add(path)
+            except OSError:
+                pass
+        if removed:
+            self.segments = [s for s in self.segments if s.path not in removed]
+
+    def __needs_rotation__(self) -> bool:
+        segment = self.segments[-1]
+        return segment.size >= self.max_bytes or time.monotonic() - segment.created >= self.max_age_s
+
+    @staticmethod
+    def __encode__(record: dict) -> bytes:
+        try:
+            line = json.dumps(record, separators=(',', ':'), default=str)
+        except (TypeError, ValueError):
+            # for instance non-str keys or circular references, keep the timestamps as numbers
+            line = json.dumps(
+                {k: v if isinstance(v, (int, float)) else str(v) for k, v in record.items()},
+                separators=(',', ':')
+            )
+        return (line + '\n').encode()
+
+    def __write_pending__(self) -> None:
+        pending = self.__pending__
+        n = len(pending)
+        missed, self.__missed__ = self.__missed__, 0
+        if n == 0 and not missed:
+            return
+
+        items = [pending.popleft() for _ in range(n)]
+        if missed:
+            # in place of the dropped records, which followed the records of the batch
+            t = max((item[0] for item in items if not isinstance(item, threading.Event)), default=time.monotonic())
+            items.append((t, '[{} log records dropped]'.format(missed)))
+
+        markers = [item for item in items if isinstance(item, threading.Event)]
+        try:
+            self.__write_items__(items)
+        except Exception as e:  # noqa
+            self.errors += 1
+            self.last_error = e
+            # continue with a new segment
+            file, self.__file__ = self.__file__, None
+            if file is not None:
+                try:
+                    file.close()
+                except Exception:  # noqa
+                    pass
+        finally:
+            for marker in markers:
+                marker.set()
+
+    def __write_items__(self, items: list) -> None:
+        lines = []
+
+        for item in items:
+            if isinstance(item, threading.Event):
+                continue
+
+            if self.__file__ is None or self.__needs_rotation__():
+                if lines:
+                    self.__file__.write(b''.join(lines))
+                    lines = []
+                self.__open_segment__()
+
+            segment = self.segments[-1]
+            t, data = item
+            line = self.__encode__(dict(t=t, d=data))
+
+            if segment.records % INDEX_INTERVAL == 0:
+                segment.index_t.append(t)
+                segment.index_offset.append(segment.size)
+
+            if segment.first_t is None:
+                segment.first_t = t
+            segment.last_t = t
+            segment.records += 1
+            segment.size += len(line)
+            lines.append(line)
+
+        if lines:
+            self.__file__.write(b''.join(lines))
+        if self.__file__ is not None:
+            self.__file__.flush()
+
+    def __run__(self) -> None:
+        while True:
+            self.__wake__.wait(self.flush_interval_s)
+            self.__wake__.clear()
+            try:
+                self.__write_pending__()
+            except Exception as e:  # noqa
+                self.errors += 1
+                self.last_error = e
+            if self.__closed__ and not self.__pending__:
+                break
+
+        if self.__file__ is not None:
+            try:
+                self.__file__.close()
+            except OSError as e:
+                self.errors += 1
+                self.last_error = e
+            self.__file__ = None
@@ -1,57 +1,103 @@
 import datetime
-from typing import Union
+import time
+from typing import List, Union
 
-from .setpoint import ALLOWED_DTYPES
+from .buffer import RingBuffer, DEFAULT_CAPACITY, OVERFLOW_OVERWRITE, to_timestamp
+from .dtypes import ARRAY_TYPECODE, DTYPE_ARRAY, get_dtype, resolve
 
 
 class Recordable(object):
     """
     The `Recordable` class allows you to log timestamped data.
 
+    Each Recordable keeps its history in a bounded :class:`aqueduct.buffer.RingBuffer` of
+    (timestamp, value) samples. Numeric dtypes are stored in typed arrays, so memory use
+    is fixed by `capacity` regardless of how long the Recipe runs.
 
     :param name: name of the Recordable, will be displayed on the UI, should be unique
     :type name: str, required
     :param value: value to be assigned to the Setpoint on creating
-    :type value: float, int, bool, str, datetime.datetime, list, required
+    :type value: float, int, bool, str, datetime.datetime, list, array.array, required
     :param dtype: specify the type of value, used to ensure that Users cannot
         enter an invalid value
-    :type dtype: {'int', 'float', 'bool', 'list', 'datetime', 'str'}, optional
+    :type dtype: {'int', 'float', 'bool', 'list', 'datetime', 'str', 'array'}, optional
+    :param capacity: maximum number of samples kept in the Recordable's history
+    :type capacity: int, optional
+    :param overflow: action taken when the history is full
+    :type overflow: {'overwrite', 'drop', 'raise'}, defaults to 'overwrite'
     """
 
-    name: str = None
-    value: Union[float, int, bool, str, datetime.datetime, list] = None
-    dtype: str = None
-    timestamp = None
+    __slots__ = (
+        'name',
+        'value',
+        'dtype',
+        'timestamp',
+        '__user_id__',
+        '__aqueduct__',
+        '__buffer__',
+        '__coercer__',
+        '__flushed__',
+        '__weakref__',
+    )
 
-    __user_id__: str = None
-    __aqueduct__: "Aqueduct" = None
+    name: str
+    value: Union[float, int, bool, str, datetime.datetime, list]
+    dtype: str
+    timestamp: float
 
-    def __init__(self, name: str, value: Union[float, int, bool, str, datetime.datetime, list], dtype: str = None):
+    __user_id__: str
+    __aqueduct__: "Aqueduct"
+    __buffer__: RingBuffer
+    __flushed__: int
+
+    def __init__(
+        self,
+        name: str,
+        value: Union[float, int, bool, str, datetime.datetime, list],
+        dtype: str = None,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_OVERWRITE
+    ):
         """
         Constructor method.
         """
-
-        if dtype is None:
-            try:
-                dtype = type(value).__name__
-                if dtype not in ALLOWED_DTYPES:
-                    raise ValueError("Object of type {} is not allowed as a Recordable".format({dtype}))
-            except Exception:
-                raise ValueError("Invalid Aqueduct Recordable")
+        try:
+            d = resolve(value, dtype)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError("Invalid Aqueduct Recordable: {}".format(e))
 
         self.name = name
-        self.value = value
-        self.dtype = dtype
+        self.dtype = d.name
+        self.__user_id__ = None
+        self.__aqueduct__ = None
+        self.__flushed__ = 0
+
+        self.__coercer__ = d.coerce
+        self.__buffer__ = RingBuffer(capacity=capacity, typecode=d.typecode, overflow=overflow)
+        self.__record__(value)
 
-    def __del__(self):
+    def __record__(self, value) -> bool:
         """
-        Destructor method.
+        Private method to store a new sample in the history. Not for API use.
+
+        `value` and `timestamp` are only set if the sample was stored, a sample dropped
+        by the 'drop' overflow policy leaves them unchanged.
+
+        :param value: value of the sample
+        :return: True if the sample was stored, False if it was dropped
+        :rtype: bool
+        :raises ValueError: if the value is not valid for the Recordable's `dtype`
         """
-        if self.__aqueduct__ is not None:
-            try:
-                self.__aqueduct__.__recordables__.pop(self.name)
-            except KeyError:
-                pass
+        try:
+            value = self.__coercer__(value)
+            timestamp = time.time()
+            stored = self.__buffer__.append(timestamp, value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError("Invalid value for Recordable {}: {}".format(self.name, e))
+        if stored:
+            self.value = value
+            self.timestamp = timestamp
+        return stored
 
     def __update__(self) -> None:
         """
@@ -61,7 +107,238 @@ class Recordable(object):
         """
         return
 
+    def __entry__(self) -> dict:
+        """
+        Private method to collect the samples recorded since the last flush. Not for API use.
+
+        :return: update dictionary
+        :rtype: dict
+        """
+        # samples recorded while the entry is built are left for the next flush
+        count = self.__buffer__.count
+        timestamps, values = self.__buffer__.since(self.__flushed__, count)
+        self.__flushed__ = count
+        return dict(
+            name=self.name,
+            dtype=self.dtype,
+            timestamps=timestamps,
+            values=values,
+        )
+
     def update(self, value):
+        """
+        Record a new value.
+
+        The value is validated and normalized to the Recordable's `dtype`. If the
+        history is full and the `overflow` policy is 'drop', the value is discarded
+        and `value` keeps the last stored sample.
+
+        :param value: the new value
+        :return: None
+        :raises ValueError: if the value is not valid for the Recordable's `dtype`
+        """
+        if not self.__record__(value):
+            return
+        if self.__aqueduct__ is not None:
+            self.__aqueduct__.__mark_dirty__(self)
+        else:
+            self.__update__()
+
+    def __len__(self) -> int:
+        return len(self.__buffer__)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Maximum number of samples kept in the Recordable's history.
+
+        :return: capacity
+        :rtype: int
+        """
+        return self.__buffer__.capacity
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of samples that were overwritten or discarded because the history was full.
+
+        :return: dropped
+        :rtype: int
+        """
+        return self.__buffer__.dropped
+
+    def last(self, n: int = 1) -> tuple:
+        """
+        Get the most recent `n` samples.
+
+        .. code-block:: python
+
+            r = aqueduct.recordable(name="pressure", value=0.)
+            timestamps, values = r.last(100)
+
+        :param n: number of samples
+        :type n: int
+        :return: (timestamps, values), oldest first
+        :rtype: tuple
+        """
+        return self.__buffer__.last(n)
+
+    def window(
+        self,
+        start: Union[float, datetime.datetime] = None,
+        end: Union[float, datetime.datetime] = None
+    ) -> tuple:
+        """
+        Get the samples recorded between `start` and `end`, inclusive.
+
+        .. code-block:: python
+
+            r = aqueduct.recordable(name="pressure", value=0.)
+            # the samples from the last 5 minutes
+            timestamps, values = r.window(start=time.time() - 300)
+
+        :param start: POSIX timestamp or datetime of the start of the window, None for the oldest sample
+        :type start: float, datetime.datetime, None
+        :param end: POSIX timestamp or datetime of the end of the window, None for the newest sample
+        :type end: float, datetime.datetime, None
+        :return: (timestamps, values), oldest first
+        :rtype: tuple
+        """
+        return self.__buffer__.window(to_timestamp(start), to_timestamp(end))
+
+    def downsample(
+        self,
+        max_points: int,
+        start: Union[float, datetime.datetime] = None,
+        end: Union[float, datetime.datetime] = None
+    ) -> tuple:
+        """
+        Get at most `max_points` evenly spaced samples recorded between `start` and `end`.
 
-        self.value = value
-        self.__update__()
\ No newline at end of file
+        Useful for plotting long histories.
+
+        :param max_points: maximum number of samples to return
+        :type max_points: int
+        :param start: POSIX timestamp or datetime of the start of the window, None for the oldest sample
+        :type start: float, datetime.datetime, None
+        :param end: POSIX timestamp or datetime of the end of the window, None for the newest sample
+        :type end: float, datetime.datetime, None
+        :return: (timestamps, values), oldest first
+        :rtype: tuple
+        """
+        return self.__buffer__.downsample(max_points, to_timestamp(start), to_timestamp(end))
+
+    def clear(self) -> None:
+        """
+        Clear the Recordable's history. The current value is kept.
+
+        :return: None
+        """
+        self.__buffer__.clear()
+        self.__flushed__ = 0
+
+
+class VectorRecordable(Recordable):
+    """
+    A multi-channel Recordable that stores one timestamp and a fixed-width
+    vector of numeric values per sample.
+
+    Use to record the values returned by multi-channel Devices, such as
+    `SCIP.get_all_pressures()` or `PH3.get_all_values()`, with a single
+    update instead of one Recordable per channel.
+
+    .. code-block:: python
+
+        pressures = aqueduct.vector_recordable(
+            name="pressures",
+            value=SCIPSIM.get_all_pressures(),
+            channels=["P1", "P2", "P3"],
+        )
+        pressures.update(SCIPSIM.get_all_pressures())
+
+        timestamps, values = pressures.last(10)
+        # values of "P2"
+        p2 = values[1::pressures.width]
+
+    The history is held in a single contiguous `array.array('d')`. `None` values
+    are recorded as NaN. Read methods return flattened values, the value of
+    channel `c` of sample `k` is `values[k * width + c]`.
+
+    :param name: name of the Recordable, will be displayed on the UI, should be unique
+    :type name: str, required
+    :param value: initial vector, its length sets the number of channels
+    :type value: list, tuple, array.array, required
+    :param channels: names of the channels, defaults to None
+    :type channels: list, optional
+    :param capacity: maximum number of samples kept in the Recordable's history
+    :type capacity: int, optional
+    :param overflow: action taken when the history is full
+    :type overflow: {'overwrite', 'drop', 'raise'}, defaults to 'overwrite'
+    """
+
+    __slots__ = (
+        'channels',
+    )
+
+    channels: List[str]
+
+    def __init__(
+        self,
+        name: str,
+        value: Union[list, tuple],
+        channels: List[str] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_OVERWRITE
+    ):
+        """
+        Constructor method.
+        """
+        d = get_dtype(DTYPE_ARRAY)
+
+        try:
+            value = d.coerce(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError("Invalid Aqueduct Recordable: {}".format(e))
+
+        if not value:
+            raise ValueError("Invalid Aqueduct Recordable: vector must have at least one channel")
+
+        if channels is not None and len(channels) != len(value):
+            raise ValueError("Expected {} channel names, got {}".format(len(value), len(channels)))
+
+        self.name = name
+        self.dtype = d.name
+        self.channels = list(channels) if channels is not None else None
+        self.__user_id__ = None
+        self.__aqueduct__ = None
+        self.__flushed__ = 0
+
+        self.__coercer__ = d.coerce
+        self.__buffer__ = RingBuffer(
+            capacity=capacity,
+            typecode=ARRAY_TYPECODE,
+            overflow=overflow,
+            width=len(value),
+        )
+        self.__record__(value)
+
+    def __entry__(self) -> dict:
+        """
+        Private method to collect the samples recorded since the last flush. Not for API use.
+
+        :return: update dictionary
+        :rtype: dict
+        """
+        entry = super().__entry__()
+        entry.update(width=self.width, channels=self.channels)
+        return entry
+
+    @property
+    def width(self) -> int:
+        """
+        Number of channels.
+
+        :return: width
+        :rtype: int
+        """
+        return self.__buffer__.width
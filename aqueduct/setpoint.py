@@ -1,19 +1,8 @@
 import datetime
-import io
 import time
-import threading
-from types import ModuleType
 from typing import Union, Callable
 
-
-ALLOWED_DTYPES = [
-    int.__name__, 
-    float.__name__, 
-    bool.__name__, 
-    list.__name__, 
-    datetime.__name__, 
-    str.__name__
-]
+from .dtypes import ALLOWED_DTYPES, resolve
 
 
 class Setpoint(object):
@@ -27,46 +16,75 @@ class Setpoint(object):
     :type value: float, int, bool, str, datetime.datetime, list, required
     :param dtype: specify the type of value, used to ensure that Users cannot
         enter an invalid value
-    :type dtype: {'int', 'float', 'bool', 'list', 'datetime', 'str'}, optional
-    """
+    :type dtype: {'int', 'float', 'bool', 'list', 'datetime', 'str', 'array'}, optional
+
+    When the value of a Setpoint is edited from the Recipe Builder, the helper thread
+    applies the new value, increments `version` and, if set, calls `on_change(*args, **kwargs)`
+    on a dedicated executor thread.
+
+    .. code-block:: python
 
-    name: str = None
-    value: Union[float, int, bool, str, datetime.datetime, list] = None
-    dtype: str = None
-    timestamp = None
-    on_change: Callable = None
-    args: list = []
-    kwargs: dict = {}
+        def on_rate_change(pump):
+            pump.change_speed(rate_value=rate.get(), rate_units="ml_min")
+
+        rate = aqueduct.setpoint(name="rate", value=1., on_change=on_rate_change, args=[PPSIM])
+
+        version = rate.version
+        while True:
+            if rate.changed_since(version):
+                version = rate.version
+                print(rate.get())
+    """
 
-    __user_id__: str = None
-    __aqueduct__: "Aqueduct" = None
+    __slots__ = (
+        'name',
+        'value',
+        'dtype',
+        'timestamp',
+        'version',
+        'on_change',
+        'args',
+        'kwargs',
+        '__user_id__',
+        '__aqueduct__',
+        '__coercer__',
+        '__weakref__',
+    )
+
+    name: str
+    value: Union[float, int, bool, str, datetime.datetime, list]
+    dtype: str
+    timestamp: float
+    version: int
+    on_change: Callable
+    args: tuple
+    kwargs: Union[dict, None]
+
+    __user_id__: str
+    __aqueduct__: "Aqueduct"
 
     def __init__(self, name: str, value: Union[float, int, bool, str, datetime.datetime, list], dtype: str = None):
         """
         Constructor method.
         """
 
-        if dtype is None:
-            try:
-                dtype = type(value).__name__
-                if dtype not in ALLOWED_DTYPES:
-                    raise ValueError("Object of type {} is not allowed as a Setpoint".format({dtype}))
-            except Exception:
-                raise ValueError("Invalid Aqueduct Setpoint")
+        try:
+            d = resolve(value, dtype)
+            value = d.coerce(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError("Invalid Aqueduct Setpoint: {}".format(e))
 
         self.name = name
         self.value = value
-        self.dtype = dtype
-
-    def __del__(self):
-        """
-        Destructor method.
-        """
-        if self.__aqueduct__ is not None:
-            try:
-                self.__aqueduct__.__setpoints__.pop(self.name)
-            except KeyError:
-                pass
+        self.dtype = d.name
+        self.__coercer__ = d.coerce
+        self.timestamp = time.time()
+        self.version = 0
+        self.on_change = None
+        self.args = ()
+        self.kwargs = None
+        self.__user_id__ = None
+        self.__aqueduct__ = None
 
     def __update__(self) -> None:
         """
@@ -76,11 +94,73 @@ class Setpoint(object):
         """
         return
 
+    def __entry__(self) -> dict:
+        """
+        Private method to collect the current value for a flush. Not for API use.
+
+        :return: update dictionary
+        :rtype: dict
+        """
+        return dict(
+            name=self.name,
+            dtype=self.dtype,
+            value=self.value,
+            timestamp=self.timestamp,
+        )
+
+    def __receive__(self, value) -> bool:
+        """
+        Private method to apply a value edited from the Recipe Builder. Not for API use.
+
+        :param value: value read from memory
+        :return: True if the value changed
+        :rtype: bool
+        """
+        try:
+            value = self.__coercer__(value)
+        except (TypeError, ValueError, OverflowError):
+            return False
+        if value == self.value:
+            return False
+        self.value = value
+        self.timestamp = time.time()
+        self.version += 1
+        return True
+
+    def changed_since(self, version: int) -> bool:
+        """
+        Check whether the value has changed since the Setpoint had the given `version`.
+
+        :param version: a previously read value of `version`
+        :type version: int
+        :return: changed
+        :rtype: bool
+        """
+        return self.version != version
+
     def get(self):
 
         return self.value
 
     def update(self, value):
+        """
+        Update the value of the Setpoint.
+
+        The value is validated and normalized to the Setpoint's `dtype`.
+
+        :param value: the new value
+        :return: None
+        :raises ValueError: if the value is not valid for the Setpoint's `dtype`
+        """
+        try:
+            value = self.__coercer__(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError("Invalid value for Setpoint {}: {}".format(self.name, e))
 
         self.value = value
-        self.__update__()
\ No newline at end of file
+        self.timestamp = time.time()
+        self.version += 1
+        if self.__aqueduct__ is not None:
+            self.__aqueduct__.__mark_dirty__(self)
+        else:
+            self.__update__()
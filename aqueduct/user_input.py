@@ -1,8 +1,8 @@
-import datetime
-import time
 from enum import Enum
 from typing import Union
 
+from .completion import Completion
+
 
 class UserInputTypes(Enum):
     DROPDOWN = 'dropdown'
@@ -12,11 +12,15 @@ class UserInputTypes(Enum):
     CSV_UPLOAD = 'csv'
 
 
-class Input(object):
+class Input(Completion):
     """
     A class to provide simple User Input interaction
     during a Recipe.
 
+    An Input completes when a value is entered by a User or when it times-out. Use
+    :py:func:`wait`, :py:func:`add_callback` or `await` to act on completion
+    without polling.
+
     :param message: string to flash in the Input
     :type message: str, required
     :param timeout_s: the length of time in seconds before the Recipe
@@ -34,16 +38,21 @@ class Input(object):
     :type dtype: {'int', 'float', 'bool', 'list', 'datetime', 'str'}, optional
     """
 
-    message = None
-    timeout_s = None
-    start_time = None
-    input_type = None
-    options = []
-    rows = []
-    dtype = None
-    __user_id__ = None
-
-    __DELAY_S = 0.5
+    __slots__ = (
+        'message',
+        'input_type',
+        'options',
+        'rows',
+        'dtype',
+        '__user_id__',
+    )
+
+    message: str
+    input_type: str
+    options: list
+    rows: list
+    dtype: str
+    __user_id__: str
 
     def __init__(
         self, 
@@ -63,26 +72,13 @@ class Input(object):
         if rows is None:
             rows = []
 
-        self.start_time = datetime.datetime.now()
+        super().__init__(timeout_s)
         self.message = message
-        self.timeout_s = timeout_s
         self.input_type = input_type
         self.options = options
         self.rows = rows
         self.dtype = dtype
-
-    def __bool__(self):
-        """
-        Override the built-in truth value testing.
-
-        A prompt will return `True` when a truthiness
-        test is performed until it has been dismissed by a
-        User.
-
-        :return: None
-        """
-        time.sleep(self.__DELAY_S)        
-        return False
+        self.__user_id__ = None
 
     def is_set(self) -> bool:
         """
@@ -94,7 +90,7 @@ class Input(object):
         :return: truthiness for whether the Input has been set or not
         :rtype: bool
         """
-        return False
+        return self.done() and not self.timed_out
 
     def get_value(self, delete_if_set: bool = True):
         """
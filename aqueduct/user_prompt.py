@@ -1,12 +1,16 @@
-import datetime
-import time
 from typing import Union
 
+from .completion import Completion
 
-class Prompt(object):
+
+class Prompt(Completion):
     """
     A class to provide simple creation of User Prompts.
 
+    A Prompt completes when it is dismissed by a User or when it times-out. Use
+    :py:func:`wait`, :py:func:`add_callback` or `await` to act on completion
+    without polling.
+
     :param message: string to flash in the Message
     :type message: str, required
     :param timeout_s: the length of time in seconds before the Recipe
@@ -14,31 +18,18 @@ class Prompt(object):
         or leave blank to disable a time-out, should be number-like
     :type timeout_s: float, int, str, None, optional
     """
-    message = None
-    timeout_s = None
-    start_time = None
-    __user_id__ = None
+    __slots__ = (
+        'message',
+        '__user_id__',
+    )
 
-    __DELAY_S = 0.5
+    message: str
+    __user_id__: str
 
     def __init__(self, message: str, timeout_s: Union[int, str]):
         """
         Constructor method.
         """
-        self.start_time = datetime.datetime.now()
+        super().__init__(timeout_s)
         self.message = message
-        self.timeout_s = timeout_s
-
-    def __bool__(self):
-        """
-        Override the built-in truth value testing.
-
-        A prompt will return `True` when a truthiness
-        test is performed until it has been dismissed by a
-        User.
-
-        :return: None
-        """
-        # add a small time delay to avoid continually hitting memory
-        time.sleep(self.__DELAY_S)
-        return False
\ No newline at end of file
+        self.__user_id__ = None
@@ -1,25 +1,3 @@
-import devices.aqueduct.dobt.constants
-import devices.aqueduct.eust.constants
-import devices.aqueduct.mfpp.constants
-import devices.aqueduct.ohsa.constants
-import devices.aqueduct.ohsc.constants
-import devices.aqueduct.ph.constants
-import devices.aqueduct.pp.constants
-import devices.aqueduct.pv.constants
-import devices.aqueduct.scip.constants
-import devices.aqueduct.sv.constants
-import devices.aqueduct.syrp.constants
-import devices.aqueduct.trcx.constants
-
-import devices.aqueduct.dobt.obj
-import devices.aqueduct.eust.obj
-import devices.aqueduct.mfpp.obj
-import devices.aqueduct.ohsa.obj
-import devices.aqueduct.ohsc.obj
-import devices.aqueduct.ph.obj
-import devices.aqueduct.pp.obj
-import devices.aqueduct.pv.obj
-import devices.aqueduct.scip.obj
-import devices.aqueduct.sv.obj
-import devices.aqueduct.syrp.obj
-import devices.aqueduct.trcx.obj
\ No newline at end of file
+# Device modules are imported on first use, see devices.aqueduct
+import devices.aqueduct
+from devices.base.obj import batch, pipeline, transaction
@@ -0,0 +1,108 @@
+"""
+Lazy registry of the Aqueduct Device types.
+
+Device modules are imported on first use, so a Recipe only pays the import
+cost (including building the `BASE` and `BASE_DTYPES` tables of the constants
+modules) for the Device types in its setup.
+
+.. code-block:: python
+
+    import devices.aqueduct
+
+    pp = devices.aqueduct.instantiate_device(d_device, setup)
+
+    # Device packages are also imported on attribute access
+    devices.aqueduct.pp.obj.PP
+"""
+
+import importlib
+from typing import Callable
+
+
+DEVICE_TYPES = (
+    "DLS",
+    "DOBT",
+    "EUST",
+    "MFM",
+    "MFPP",
+    "OHSA",
+    "OHSC",
+    "PH",
+    "PH3",
+    "PP",
+    "PP12",
+    "PP6",
+    "PV",
+    "SCIP",
+    "SV",
+    "SYRP",
+    "TRBD",
+    "TRCX",
+)
+
+_INSTANTIATORS = dict()
+
+
+def module_name(device_type: str, submodule: str = "obj") -> str:
+    """
+    Get the name of a module of a Device type.
+
+    :param device_type: Device type, for instance "PP"
+    :type device_type: str
+    :param submodule: "obj" or "constants"
+    :type submodule: str
+    :return: module name
+    :rtype: str
+    :raises KeyError: if the Device type is unknown
+    """
+    if device_type not in DEVICE_TYPES:
+        raise KeyError("Unknown Device type: {}".format(device_type))
+    return "{}.{}.{}".format(__name__, device_type.lower(), submodule)
+
+
+def get_instantiator(device_type: str) -> Callable:
+    """
+    Get the `instantiate_device` function of a Device type, importing the
+    Device module on first use.
+
+    :param device_type: Device type, for instance "PP"
+    :type device_type: str
+    :return: instantiate_device
+    :rtype: Callable
+    :raises KeyError: if the Device type is unknown
+    """
+    fn = _INSTANTIATORS.get(device_type)
+    if fn is None:
+        fn = importlib.import_module(module_name(device_type)).instantiate_device
+        _INSTANTIATORS[device_type] = fn
+    return fn
+
+
+def instantiate_device(d_device: dict, setup):
+    """
+    Instantiate a Device from its description, importing the Device module on first use.
+
+    :param d_device: Device description, the `type` key selects the Device type
+    :type d_device: dict
+    :param setup: the setup the Device belongs to
+    :return: Device
+    :rtype: devices.base.obj.Device
+    :raises KeyError: if the Device type is unknown
+    """
+    return get_instantiator(d_device.get("type"))(d_device, setup)
+
+
+def __getattr__(name: str):
+    """
+    Import Device packages on attribute access (PEP 562).
+    """
+    device_type = name.upper()
+    if device_type not in DEVICE_TYPES or name != device_type.lower():
+        raise AttributeError("module {} has no attribute {}".format(__name__, name))
+    importlib.import_module(module_name(device_type, "constants"))
+    importlib.import_module(module_name(device_type, "obj"))
+    return importlib.import_module("{}.{}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + [t.lower() for t in DEVICE_TYPES])
@@ -1,4 +1,5 @@
 import devices.base.constants
+import devices.base.wire
 
 
 NUMBER_INPUTS: int = 4
@@ -13,6 +14,14 @@ EFFECTOR_ANGLE_SUFFIX = '_effec_ang_deg'
 TARGET_AXIS_SUFFIX = '_target'
 RAW_AXIS_SUFFIX = '_raw'
 AXES = (X_AXIS_SUFFIX, Y_AXIS_SUFFIX, Z_AXIS_SUFFIX, EFFECTOR_ANGLE_SUFFIX)
+TARGET_X_AXIS_SUFFIX = TARGET_AXIS_SUFFIX + X_AXIS_SUFFIX
+TARGET_Y_AXIS_SUFFIX = TARGET_AXIS_SUFFIX + Y_AXIS_SUFFIX
+TARGET_Z_AXIS_SUFFIX = TARGET_AXIS_SUFFIX + Z_AXIS_SUFFIX
+TARGET_EFFECTOR_ANGLE_SUFFIX = TARGET_AXIS_SUFFIX + EFFECTOR_ANGLE_SUFFIX
+TARGET_AXES = (TARGET_X_AXIS_SUFFIX, TARGET_Y_AXIS_SUFFIX, TARGET_Z_AXIS_SUFFIX, TARGET_EFFECTOR_ANGLE_SUFFIX)
+RAW_X_AXIS_SUFFIX = RAW_AXIS_SUFFIX + X_AXIS_SUFFIX
+RAW_Y_AXIS_SUFFIX = RAW_AXIS_SUFFIX + Y_AXIS_SUFFIX
+RAW_Z_AXIS_SUFFIX = RAW_AXIS_SUFFIX + Z_AXIS_SUFFIX
 THETA_SUFFIX = '_theta'
 DELTA_X_SUFFIX = '_dx'
 DELTA_Y_SUFFIX = '_dy'
@@ -53,41 +62,65 @@ BASE_DTYPES.update({
     SUCTION_STATUS_KEY: int.__name__,
 })
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=INPUT_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        X_AXIS_SUFFIX,
+        Y_AXIS_SUFFIX,
+        Z_AXIS_SUFFIX,
+        EFFECTOR_ANGLE_SUFFIX,
+        TARGET_X_AXIS_SUFFIX,
+        TARGET_Y_AXIS_SUFFIX,
+        TARGET_Z_AXIS_SUFFIX,
+        TARGET_EFFECTOR_ANGLE_SUFFIX,
+    ),
+    local_suffixes=(
+        RAW_X_AXIS_SUFFIX,
+        RAW_Y_AXIS_SUFFIX,
+        RAW_Z_AXIS_SUFFIX,
+        THETA_SUFFIX,
+        DELTA_X_SUFFIX,
+        DELTA_Y_SUFFIX,
+        Z_OFFSET_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + X_AXIS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + Y_AXIS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + Z_AXIS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + EFFECTOR_ANGLE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + X_AXIS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + Y_AXIS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + Z_AXIS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + EFFECTOR_ANGLE_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + RAW_AXIS_SUFFIX + X_AXIS_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + RAW_AXIS_SUFFIX + Y_AXIS_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + RAW_AXIS_SUFFIX + Z_AXIS_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + THETA_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + DELTA_X_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + DELTA_Y_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + DELTA_Y_SUFFIX: 0,
-        INPUT_PREFIX + str(i) + Z_OFFSET_SUFFIX: 0,
+        KEYS[i, X_AXIS_SUFFIX]: 0,
+        KEYS[i, Y_AXIS_SUFFIX]: 0,
+        KEYS[i, Z_AXIS_SUFFIX]: 0,
+        KEYS[i, EFFECTOR_ANGLE_SUFFIX]: 0,
+        KEYS[i, TARGET_X_AXIS_SUFFIX]: 0,
+        KEYS[i, TARGET_Y_AXIS_SUFFIX]: 0,
+        KEYS[i, TARGET_Z_AXIS_SUFFIX]: 0,
+        KEYS[i, TARGET_EFFECTOR_ANGLE_SUFFIX]: 0,
+        KEYS[i, RAW_X_AXIS_SUFFIX]: 0,
+        KEYS[i, RAW_Y_AXIS_SUFFIX]: 0,
+        KEYS[i, RAW_Z_AXIS_SUFFIX]: 0,
+        KEYS[i, THETA_SUFFIX]: 0,
+        KEYS[i, DELTA_X_SUFFIX]: 0,
+        KEYS[i, DELTA_Y_SUFFIX]: 0,
+        KEYS[i, DELTA_Y_SUFFIX]: 0,
+        KEYS[i, Z_OFFSET_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + X_AXIS_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + Y_AXIS_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + Z_AXIS_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + EFFECTOR_ANGLE_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + X_AXIS_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + Y_AXIS_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + Z_AXIS_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + INPUT_PREFIX + str(i) + TARGET_AXIS_SUFFIX + EFFECTOR_ANGLE_SUFFIX: str.__name__,
-        INPUT_PREFIX + str(i) + RAW_AXIS_SUFFIX + X_AXIS_SUFFIX: str.__name__,
-        INPUT_PREFIX + str(i) + RAW_AXIS_SUFFIX + Y_AXIS_SUFFIX: str.__name__,
-        INPUT_PREFIX + str(i) + RAW_AXIS_SUFFIX + Z_AXIS_SUFFIX: str.__name__,
-        INPUT_PREFIX + str(i) + THETA_SUFFIX: float.__name__,
-        INPUT_PREFIX + str(i) + DELTA_X_SUFFIX: float.__name__,
-        INPUT_PREFIX + str(i) + DELTA_Y_SUFFIX: float.__name__,
-        INPUT_PREFIX + str(i) + Z_OFFSET_SUFFIX: float.__name__,
+        KEYS[i, X_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, Y_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, Z_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, EFFECTOR_ANGLE_SUFFIX]: str.__name__,
+        KEYS[i, TARGET_X_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, TARGET_Y_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, TARGET_Z_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, TARGET_EFFECTOR_ANGLE_SUFFIX]: str.__name__,
+        KEYS[i, RAW_X_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, RAW_Y_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, RAW_Z_AXIS_SUFFIX]: str.__name__,
+        KEYS[i, THETA_SUFFIX]: float.__name__,
+        KEYS[i, DELTA_X_SUFFIX]: float.__name__,
+        KEYS[i, DELTA_Y_SUFFIX]: float.__name__,
+        KEYS[i, Z_OFFSET_SUFFIX]: float.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
@@ -144,3 +177,8 @@ DEFAULT_DELTA_X = 0
 DEFAULT_DELTA_Y = 0
 
 del i
+
+# opcode table of the binary command encoding, append new commands only
+WIRE = devices.base.wire.Codec((
+    ('move', devices.base.wire.MOVE_COMMAND),
+))
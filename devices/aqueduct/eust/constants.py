@@ -1,4 +1,5 @@
 import devices.base.constants
+import devices.base.wire
 from enum import Enum
 
 
@@ -39,22 +40,37 @@ BASE_DTYPES = dict(
     _number_mixer_inputs=int.__name__,
 )
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=NODE_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        RPM_SUFFIX,
+        DIRECTION_SUFFIX,
+        TORQUE_SUFFIX,
+        TEMP_VALUE_SUFFIX,
+        TEMP_UNITS_SUFFIX,
+    ),
+    local_suffixes=(
+        SERIES_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        NODE_PREFIX + str(i) + SERIES_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RPM_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + DIRECTION_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + TORQUE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + TEMP_VALUE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + TEMP_UNITS_SUFFIX: "C",
+        KEYS[i, SERIES_SUFFIX]: 0,
+        KEYS[i, RPM_SUFFIX]: 0,
+        KEYS[i, DIRECTION_SUFFIX]: 0,
+        KEYS[i, TORQUE_SUFFIX]: 0,
+        KEYS[i, TEMP_VALUE_SUFFIX]: 0,
+        KEYS[i, TEMP_UNITS_SUFFIX]: "C",
     })
     BASE_DTYPES.update({
-        NODE_PREFIX + str(i) + SERIES_SUFFIX: MixerSeries._60.value,  # noqa
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RPM_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + DIRECTION_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + TORQUE_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + TEMP_VALUE_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + TEMP_UNITS_SUFFIX: str.__name__,
+        KEYS[i, SERIES_SUFFIX]: MixerSeries._60.value,  # noqa
+        KEYS[i, RPM_SUFFIX]: str.__name__,
+        KEYS[i, DIRECTION_SUFFIX]: str.__name__,
+        KEYS[i, TORQUE_SUFFIX]: str.__name__,
+        KEYS[i, TEMP_VALUE_SUFFIX]: str.__name__,
+        KEYS[i, TEMP_UNITS_SUFFIX]: str.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
@@ -71,3 +87,8 @@ CATEGORY = "Mixers"
 NO_INPUT_FLOAT_VALUE = "---.--"
 NO_INPUT_INT_VALUE = "---"
 
+# opcode table of the binary command encoding, append new commands only
+WIRE = devices.base.wire.Codec((
+    ('start_mixers', devices.base.wire.MIXER_COMMAND),
+    ('stop_mixers', devices.base.wire.CHANNEL),
+))
@@ -1,12 +1,52 @@
 import devices.base.constants
 from enum import Enum
-from devices.aqueduct.ohsa.constants import Active, ACTIVE_KEY
 
-Active # noqa, avoid unused param
 
 NUMBER_INPUTS: int = 4
+ACTIVE_KEY = "active"
 
 TRANSDUCER_PREFIX = "txdcr_"
+CONNECTION_PREFIX = '_connection_'
+INPUT_PREFIX = '_input_'
+MF_VALUE_SUFFIX = '_mf_value'
+MF_UNITS_SUFFIX = '_mf_units'
+LENGTH_MM_SUFFIX = '_length_mm'
+ID_MM_SUFFIX = '_id_mm'
+MATERIAL_SUFFIX = '_material'
+ACTIVE_SUFFIX = '_active'
+
+
+class Active(Enum):
+    NOT_ACTIVE = 0
+    IS_ACTIVE = 1
+
+
+TRANSDUCER_KEYS = devices.base.constants.KeyTable(
+    node_prefix=TRANSDUCER_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        MF_VALUE_SUFFIX,
+        MF_UNITS_SUFFIX,
+    ),
+)
+
+CONNECTION_KEYS = devices.base.constants.KeyTable(
+    node_prefix=CONNECTION_PREFIX,
+    channels=NUMBER_INPUTS,
+    local_suffixes=(
+        LENGTH_MM_SUFFIX,
+        ID_MM_SUFFIX,
+        MATERIAL_SUFFIX,
+    ),
+)
+
+INPUT_KEYS = devices.base.constants.KeyTable(
+    node_prefix=INPUT_PREFIX,
+    channels=NUMBER_INPUTS,
+    local_suffixes=(
+        ACTIVE_SUFFIX,
+    ),
+)
 
 BASE = dict(
     type="MFM",
@@ -28,26 +68,26 @@ BASE_DTYPES.update({
 
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + TRANSDUCER_PREFIX + str(i) + '_mf_value': 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + TRANSDUCER_PREFIX + str(i) + '_mf_units': "ml/min",
-        '_connection_' + str(i) + '_length_mm': 30,
-        '_connection_' + str(i) + '_id_mm': 6,
-        '_connection_' + str(i) + '_material': 'polysulfone',
+        TRANSDUCER_KEYS[i, MF_VALUE_SUFFIX]: 0,
+        TRANSDUCER_KEYS[i, MF_UNITS_SUFFIX]: "ml/min",
+        CONNECTION_KEYS[i, LENGTH_MM_SUFFIX]: 30,
+        CONNECTION_KEYS[i, ID_MM_SUFFIX]: 6,
+        CONNECTION_KEYS[i, MATERIAL_SUFFIX]: 'polysulfone',
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + TRANSDUCER_PREFIX + str(i) + '_mf_value': float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + TRANSDUCER_PREFIX + str(i) + '_mf_units': str.__name__,
-        '_connection_' + str(i) + '_length_mm': float.__name__,
-        '_connection_' + str(i) + '_id_mm': float.__name__,
-        '_connection_' + str(i) + '_material': str.__name__,
+        TRANSDUCER_KEYS[i, MF_VALUE_SUFFIX]: float.__name__,
+        TRANSDUCER_KEYS[i, MF_UNITS_SUFFIX]: str.__name__,
+        CONNECTION_KEYS[i, LENGTH_MM_SUFFIX]: float.__name__,
+        CONNECTION_KEYS[i, ID_MM_SUFFIX]: float.__name__,
+        CONNECTION_KEYS[i, MATERIAL_SUFFIX]: str.__name__,
     })
 
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        '_input_' + str(i) + '_active': 0,
+        INPUT_KEYS[i, ACTIVE_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        '_input_' + str(i) + '_active': int.__name__,
+        INPUT_KEYS[i, ACTIVE_SUFFIX]: int.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
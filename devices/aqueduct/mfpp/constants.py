@@ -4,6 +4,20 @@ MODE_NOT_SET = -1
 MODE_CONTINUOUS = 0
 MODE_FINITE = 1
 
+MODE_MAPPING = dict(
+    continuous=MODE_CONTINUOUS,
+    c=MODE_CONTINUOUS,
+    finite=MODE_FINITE,
+    f=MODE_FINITE,
+)
+
+MODE_MAPPING.update({
+    str(MODE_CONTINUOUS): MODE_CONTINUOUS,
+    str(MODE_FINITE): MODE_FINITE,
+    MODE_FINITE: MODE_FINITE,
+    MODE_CONTINUOUS: MODE_CONTINUOUS,
+})
+
 BASE = dict(
     type="MFPP",
     number_ports=2,
@@ -42,6 +56,12 @@ BASE_DTYPES = dict(
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
 
+ML_MIN_KEY = devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + 'ml_min'
+
+MAX_RATE_KEY = '_max_ml_min'
+
+VALID_RATE_UNITS = tuple(BASE.get('_valid_rate_units'))
+
 DEVICE_TYPE = BASE.get('type')
 
 DISPLAY_NAME = "MasterFlex Pump (" + DEVICE_TYPE + ")"
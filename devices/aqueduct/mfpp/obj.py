@@ -1,6 +1,9 @@
-from typing import Union
+import array
+from typing import Iterable, Union
 
+import devices.base.calibration
 import devices.base.obj
+import devices.base.profile
 from devices.aqueduct.mfpp.constants import *
 
 
@@ -12,6 +15,11 @@ class MFPP(devices.base.obj.Device):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.__calibration__ = devices.base.calibration.CalibrationCache(1, self.__calibrate__)
+
+    def __calibrate__(self, channel: int) -> devices.base.calibration.Calibration:
+        # no rpm calibration, the pump is driven in mL/min
+        return devices.base.calibration.Calibration(None)
 
     CONTINUOUS = MODE_CONTINUOUS
     FINITE = MODE_FINITE
@@ -94,10 +102,16 @@ class MFPP(devices.base.obj.Device):
         :type wait_for_complete: 
             | bool
 
-        :return: command dictionary
-        :rtype: dict
+        :return: command dictionary, or for a finite-mode operation, a
+            :class:`devices.base.obj.CompletionFuture` that resolves when the operation ends
+        :rtype: dict, devices.base.obj.CompletionFuture
         """
-        return {}
+        content = {}
+        completions = devices.base.obj.finite_completions(
+            vars(self), content, ({'mode': mode, 'finite_value': finite_value},),
+            MODE_MAPPING, MODE_FINITE, wait_for_complete
+        )
+        return content if completions is None else completions[0]
 
     def stop(self) -> dict:
         """Stop the pump.
@@ -160,6 +174,46 @@ class MFPP(devices.base.obj.Device):
         """
         return {}
 
+    def change_speed_profile(self, profile: devices.base.profile.RateProfile, tolerance: float = 0.) -> dict:
+        """Change the speed of a running pump following a rate profile. The whole profile is
+        sent in one command and played by the device worker with its own timer, replacing a
+        loop of :py:func:`change_speed` calls.
+
+        :Example: ramp from 1 to 10 ml_min over 60 s, then hold
+
+        .. code-block:: python
+
+            import devices.base.profile
+
+            ramp = devices.base.profile.RateProfile.piecewise_linear(((0., 1.), (60., 10.)), units="ml_min")
+            MFPPSIM.change_speed_profile(ramp)
+
+        :param profile: rate profile, in one of `"ml_min"`
+        :type profile: devices.base.profile.RateProfile
+        :param tolerance:
+            | points within `tolerance` of the profile, in the rate units, are dropped before sending
+            | Defaults to 0
+        :type tolerance: float
+        :return: command dictionary
+        :rtype: dict
+        :raises ValueError: for invalid rate units, or a rate above the maximum rate of the pump
+        """
+        if profile.units not in VALID_RATE_UNITS:
+            raise ValueError("Invalid rate units {}, should be one of {}".format(profile.units, VALID_RATE_UNITS))
+        max_rate = self.__store__.read(MAX_RATE_KEY) if self.__store__ is not None else BASE.get(MAX_RATE_KEY)
+        peak = max(map(abs, profile.rates))
+        if peak > max_rate:
+            raise ValueError("The profile exceeds the maximum rate of {} ml_min".format(max_rate))
+        return self.__send_speed_profile__(**profile.simplified(tolerance)._to_command())
+
+    @devices.base.obj.command(name='change_speed_profile')
+    def __send_speed_profile__(self, units: str, interpolation: str, times_s: list, rates: list) -> dict:
+        """Send a validated rate profile, see :py:func:`change_speed_profile`.
+
+        :return: command dictionary
+        :rtype: dict
+        """
+
     def clear_recorded(self):
         """Clear the recorded data for the MFPP device. The recordable data includes:
 
@@ -215,10 +269,16 @@ class MFPP(devices.base.obj.Device):
             f = MFPPSIM.get_flow_rate()
             print(f) # prints 10.232
 
+        :param units: rate units of the result, one of `"ul_min"`, `"ul_hr"`, `"ml_min"` or `"ml_hr"`
+        :type units: str
         :return: current rate of the pump, always positive
         :rtype: float
         """
-        return float(10)
+        ml_min = float(10)
+        if self.__store__ is not None:
+            ml_min = self.__store__.read(ML_MIN_KEY)
+            ml_min = 0. if ml_min != ml_min else abs(ml_min)
+        return self.__calibration__.get().convert(ml_min, "ml_min", units)
 
     def internal_volume_ml(self) -> float:
         """Get the internal volume in mL of the pump. Useful when planning prime and
@@ -236,3 +296,56 @@ class MFPP(devices.base.obj.Device):
         """
         return float(3)
 
+    @devices.base.obj.command(after=lambda self: self.__calibration__.invalidate())
+    def set_config(self, name: str = None) -> dict:
+        """Set the configuration of the pump, for instance the tubing. The cached rate
+        calibration is rebuilt from the new configuration on next use.
+
+        :param name: name of the configuration
+        :type name: str
+        :return: command dictionary
+        :rtype: dict
+        """
+
+    def calibration(self) -> devices.base.calibration.Calibration:
+        """Get the rate calibration of the pump, volumetric units only, as
+        the pump has no rpm calibration.
+
+        :return: calibration
+        :rtype: devices.base.calibration.Calibration
+        """
+        return self.__calibration__.get()
+
+    def convert_rate(self, rate_value: Union[float, int], from_units: str, to_units: str) -> float:
+        """Convert a rate between `"ul_min"`, `"ul_hr"`, `"ml_min"` and `"ml_hr"`.
+
+        :Example:
+
+        .. code-block:: python
+
+            ul_min = MFPPSIM.convert_rate(1., "ml_min", "ul_min")
+
+        :param rate_value: rate in `from_units`
+        :type rate_value: float, int
+        :param from_units: rate units of `rate_value`
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: rate in `to_units`
+        :rtype: float
+        """
+        return self.__calibration__.get().convert(rate_value, from_units, to_units)
+
+    def convert_rates(self, rate_values: Iterable[Union[float, int]], from_units: str, to_units: str) -> array.array:
+        """Convert a sequence of rates, for instance the steps of a ramp, in one call.
+
+        :param rate_values: rates in `from_units`
+        :type rate_values: Iterable[float]
+        :param from_units: rate units of `rate_values`
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: rates in `to_units`
+        :rtype: array.array('d')
+        """
+        return self.__calibration__.get().convert_many(rate_values, from_units, to_units)
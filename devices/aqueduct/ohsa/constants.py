@@ -18,14 +18,23 @@ BASE_DTYPES = dict(
     _number_balance_inputs=int.__name__,
 )
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=BALANCE_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        VALUE_SUFFIX,
+        UNITS_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + BALANCE_PREFIX + str(i) + '_value': 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + BALANCE_PREFIX + str(i) + '_units': "g",
+        KEYS[i, VALUE_SUFFIX]: 0,
+        KEYS[i, UNITS_SUFFIX]: "g",
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + BALANCE_PREFIX + str(i) + '_value': str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + BALANCE_PREFIX + str(i) + '_units': str.__name__,
+        KEYS[i, VALUE_SUFFIX]: str.__name__,
+        KEYS[i, UNITS_SUFFIX]: str.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
@@ -33,12 +33,20 @@ BASE_DTYPES.update({
     PERIOD_MS_KEY: int.__name__,
 })
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=NODE_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        PH_VALUE_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + PH_VALUE_SUFFIX: 0,
+        KEYS[i, PH_VALUE_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + PH_VALUE_SUFFIX: str.__name__,
+        KEYS[i, PH_VALUE_SUFFIX]: str.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
@@ -45,6 +45,7 @@ class PH(devices.base.obj.Device):
         """
         return {}
 
+    @devices.base.obj.command
     def stop(self):
         """Stop receiving data from the PH device.
 
@@ -63,9 +64,6 @@ class PH(devices.base.obj.Device):
         :return: command dictionary
         :rtype: dict
         """
-        content = devices.base.obj.add_object_info_to_content(vars(self), locals(), 'stop')
-        devices.base.obj.enqueue_and_pause(vars(self), content)
-        return content
 
     def clear_recorded(self):
         """Clear the recorded data for the PH device. The recordable data includes:
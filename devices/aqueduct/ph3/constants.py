@@ -21,17 +21,28 @@ BASE_DTYPES.update({
     STATUS_KEY: int.__name__,
 })
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=NODE_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        PH_VALUE_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + PH_VALUE_SUFFIX: 0,
+        KEYS[i, PH_VALUE_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + PH_VALUE_SUFFIX: str.__name__,
+        KEYS[i, PH_VALUE_SUFFIX]: str.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
 
+# pH values are reported as text, so they are not stored as a column
+STORE_COLUMNS = ()
+
 DEVICE_TYPE = BASE.get("type", "")
 
 DISPLAY_NAME = "3 x pH Probe (" + DEVICE_TYPE + ")"
@@ -8,6 +8,15 @@ def instantiate_device(d_device, setup):
     return PH3(**d_device)
 
 
+def _parse_value(value: str) -> Union[float, None]:
+    if value == NO_INPUT_VALUE or value == '':
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 class PH3(devices.base.obj.Device):
 
     def __init__(self, **kwargs):
@@ -114,6 +123,8 @@ class PH3(devices.base.obj.Device):
         :return: value, in pH
         :rtype: float, None
         """
+        if self.__store__ is not None:
+            return _parse_value(self.__store__.read(KEYS[index, PH_VALUE_SUFFIX]))
         return float(7)
 
 
@@ -160,6 +171,8 @@ class PH3(devices.base.obj.Device):
         :return: pH values
         :rtype: list
         """
+        if self.__store__ is not None:
+            return tuple(_parse_value(self.__store__.read(k)) for k in KEYS.column(PH_VALUE_SUFFIX))
         return (7.0, 7.0, 7.0)
 
     def set_sim_value(self, value: float, index: int = 0):
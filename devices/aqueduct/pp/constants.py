@@ -42,6 +42,15 @@ BASE_DTYPES = dict(
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
 
+STORE_COLUMNS = ()
+
+RPM_KEY = devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + 'rpm'
+
+# revolutions per mL, the rate calibration of the pump with its tubing
+REV_PER_ML_KEY = '_rev_per_ml'
+
+MAX_RATE_KEY = '_max_rpm'
+
 DEVICE_TYPE = BASE.get('type')
 
 DISPLAY_NAME = "Peristaltic Pump (" + DEVICE_TYPE + ")"
@@ -52,6 +61,20 @@ MODE_NOT_SET = -1
 MODE_CONTINUOUS = 0
 MODE_FINITE = 1
 
+MODE_MAPPING = dict(
+    continuous=MODE_CONTINUOUS,
+    c=MODE_CONTINUOUS,
+    finite=MODE_FINITE,
+    f=MODE_FINITE,
+)
+
+MODE_MAPPING.update({
+    str(MODE_CONTINUOUS): MODE_CONTINUOUS,
+    str(MODE_FINITE): MODE_FINITE,
+    MODE_FINITE: MODE_FINITE,
+    MODE_CONTINUOUS: MODE_CONTINUOUS,
+})
+
 DIRECTION_FORWARD = 0
 DIRECTION_REVERSE = 1
 
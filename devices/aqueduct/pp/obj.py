@@ -1,7 +1,10 @@
 import datetime
-from typing import Union
+import array
+from typing import Iterable, Union
 
+import devices.base.calibration
 import devices.base.obj
+import devices.base.profile
 from devices.aqueduct.pp.constants import *
 
 
@@ -13,6 +16,12 @@ class PP(devices.base.obj.Device):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.__calibration__ = devices.base.calibration.CalibrationCache(1, self.__calibrate__)
+
+    def __calibrate__(self, channel: int) -> devices.base.calibration.Calibration:
+        if self.__store__ is not None:
+            return devices.base.calibration.Calibration(self.__store__.read(REV_PER_ML_KEY))
+        return devices.base.calibration.Calibration(BASE.get(REV_PER_ML_KEY))
 
     CONTINUOUS = MODE_CONTINUOUS
     FINITE = MODE_FINITE
@@ -82,10 +91,16 @@ class PP(devices.base.obj.Device):
             Defaults to `True`
         :type wait_for_complete: bool
 
-        :return: command dictionary
-        :rtype: dict
+        :return: command dictionary, or for a finite-mode operation, a
+            :class:`devices.base.obj.CompletionFuture` that resolves when the operation ends
+        :rtype: dict, devices.base.obj.CompletionFuture
         """
-        return {}
+        content = {}
+        completions = devices.base.obj.finite_completions(
+            vars(self), content, ({'mode': mode, 'finite_value': finite_value},),
+            MODE_MAPPING, MODE_FINITE, wait_for_complete
+        )
+        return content if completions is None else completions[0]
 
     def stop(self) -> dict:
         """Stop the pump.
@@ -95,6 +110,7 @@ class PP(devices.base.obj.Device):
         """
         return {}
 
+    @devices.base.obj.command
     def pause(self) -> dict:
         """Pause the pump. If the pump was performing a finite-duration operation, the
         operation can be resumed using the `resume` command.
@@ -102,9 +118,6 @@ class PP(devices.base.obj.Device):
         :return: command dictionary
         :rtype: dict
         """
-        content = devices.base.obj.add_object_info_to_content(vars(self), locals(), 'pause')
-        devices.base.obj.enqueue_and_pause(vars(self), content)
-        return content
 
     def resume(self, wait_for_complete: bool = True) -> dict:
         """Resume a finite-duration operation. Has no effect if the pump was paused or stopped
@@ -148,6 +161,46 @@ class PP(devices.base.obj.Device):
         """
         return {}
 
+    def change_speed_profile(self, profile: devices.base.profile.RateProfile, tolerance: float = 0.) -> dict:
+        """Change the speed of a running pump following a rate profile. The whole profile is
+        sent in one command and played by the device worker with its own timer, replacing a
+        loop of :py:func:`change_speed` calls.
+
+        :Example: ramp from 10 to 100 rpm over 60 s, then hold
+
+        .. code-block:: python
+
+            import devices.base.profile
+
+            ramp = devices.base.profile.RateProfile.piecewise_linear(((0., 10.), (60., 100.)), units="rpm")
+            PPSIM.change_speed_profile(ramp)
+
+        :param profile: rate profile, in one of `"rpm"` or `"ml_min"`
+        :type profile: devices.base.profile.RateProfile
+        :param tolerance:
+            | points within `tolerance` of the profile, in the rate units, are dropped before sending
+            | Defaults to 0
+        :type tolerance: float
+        :return: command dictionary
+        :rtype: dict
+        :raises ValueError: for invalid rate units, or a rate above the maximum rate of the pump
+        """
+        if profile.units not in VALID_RATE_UNITS:
+            raise ValueError("Invalid rate units {}, should be one of {}".format(profile.units, VALID_RATE_UNITS))
+        max_rate = self.__store__.read(MAX_RATE_KEY) if self.__store__ is not None else BASE.get(MAX_RATE_KEY)
+        peak = max(map(abs, profile.rates))
+        if self.__calibration__.get().convert(peak, profile.units, devices.base.calibration.RPM) > max_rate:
+            raise ValueError("The profile exceeds the maximum rate of {} rpm".format(max_rate))
+        return self.__send_speed_profile__(**profile.simplified(tolerance)._to_command())
+
+    @devices.base.obj.command(name='change_speed_profile')
+    def __send_speed_profile__(self, units: str, interpolation: str, times_s: list, rates: list) -> dict:
+        """Send a validated rate profile, see :py:func:`change_speed_profile`.
+
+        :return: command dictionary
+        :rtype: dict
+        """
+
     def clear_recorded(self):
         """Clear the recorded data for the PP device. The recordable data includes:
 
@@ -216,6 +269,9 @@ class PP(devices.base.obj.Device):
         :return: current rpm of the pump, always positive
         :rtype: float
         """
+        if self.__store__ is not None:
+            rpm = self.__store__.read(RPM_KEY)
+            return 0. if rpm != rpm else abs(rpm)
         return float(100)
 
     def internal_volume_ml(self) -> float:
@@ -250,4 +306,56 @@ class PP(devices.base.obj.Device):
         """
         return float(20)
 
+    @devices.base.obj.command(after=lambda self: self.__calibration__.invalidate())
+    def set_config(self, name: str = None) -> dict:
+        """Set the configuration of the pump, for instance the tubing. The cached rate
+        calibration is rebuilt from the new configuration on next use.
+
+        :param name: name of the configuration
+        :type name: str
+        :return: command dictionary
+        :rtype: dict
+        """
+
+    def calibration(self) -> devices.base.calibration.Calibration:
+        """Get the rate calibration of the pump, computed once from its `rev_per_ml`
+        and cached until the configuration changes.
+
+        :return: calibration
+        :rtype: devices.base.calibration.Calibration
+        """
+        return self.__calibration__.get()
+
+    def convert_rate(self, rate_value: Union[float, int], from_units: str, to_units: str) -> float:
+        """Convert a rate between `"rpm"`, `"ul_min"` and `"ml_min"`.
 
+        :Example:
+
+        .. code-block:: python
+
+            rpm = PPSIM.convert_rate(1., "ml_min", "rpm")
+
+        :param rate_value: rate in `from_units`
+        :type rate_value: float, int
+        :param from_units: rate units of `rate_value`
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: rate in `to_units`
+        :rtype: float
+        """
+        return self.__calibration__.get().convert(rate_value, from_units, to_units)
+
+    def convert_rates(self, rate_values: Iterable[Union[float, int]], from_units: str, to_units: str) -> array.array:
+        """Convert a sequence of rates, for instance the steps of a ramp, in one call.
+
+        :param rate_values: rates in `from_units`
+        :type rate_values: Iterable[float]
+        :param from_units: rate units of `rate_values`
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: rates in `to_units`
+        :rtype: array.array('d')
+        """
+        return self.__calibration__.get().convert_many(rate_values, from_units, to_units)
@@ -1,4 +1,7 @@
 import devices.base.constants
+import devices.base.predicate
+import devices.base.status
+import devices.base.wire
 
 from enum import Enum
 
@@ -15,6 +18,32 @@ TUBING_MATERIAL_SUFFIX = '_tubing_material'
 BLOCKING_SUFFIX = '_blocking'
 BLOCKING_INTERVAL_KEY = 'blocking_interval_s'
 
+GLOBAL_SUFFIXES = (
+    MODE_SUFFIX,
+    STEPS_DONE_SUFFIX,
+    RPM_SUFFIX,
+)
+
+LOCAL_SUFFIXES = (
+    REV_PER_ML_SUFFIX,
+    TUBING_LENGTH_MM_SUFFIX,
+    TUBING_ID_MM_SUFFIX,
+    TUBING_MATERIAL_SUFFIX,
+    BLOCKING_SUFFIX,
+)
+
+
+def key_table(number_pumps: int) -> devices.base.constants.KeyTable:
+    return devices.base.constants.KeyTable(
+        node_prefix=NODE_PREFIX,
+        channels=number_pumps,
+        global_suffixes=GLOBAL_SUFFIXES,
+        local_suffixes=LOCAL_SUFFIXES,
+    )
+
+
+KEYS = key_table(NUMBER_PUMPS)
+
 ALL_STOPPED = 0x00
 ALL_PAUSED = 0xFF
 
@@ -43,33 +72,33 @@ def update_base_common(base: dict, base_dtypes: dict):
     })
 
 
-def update_base(base: dict, base_dtypes: dict, number_pumps: int) -> None:
+def update_base(base: dict, base_dtypes: dict, keys: devices.base.constants.KeyTable) -> None:
 
-    for i in range(0, number_pumps):
+    for i in range(0, keys.channels):
         base.update({
-            devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + MODE_SUFFIX: 0,
-            devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + STEPS_DONE_SUFFIX: 0,
-            devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RPM_SUFFIX: 0,
-            NODE_PREFIX + str(i) + REV_PER_ML_SUFFIX: 24,
-            NODE_PREFIX + str(i) + TUBING_LENGTH_MM_SUFFIX: 121.5,
-            NODE_PREFIX + str(i) + TUBING_ID_MM_SUFFIX: 1.,
-            NODE_PREFIX + str(i) + TUBING_MATERIAL_SUFFIX: "pharmaline",
-            NODE_PREFIX + str(i) + BLOCKING_SUFFIX: 0,
+            keys[i, MODE_SUFFIX]: 0,
+            keys[i, STEPS_DONE_SUFFIX]: 0,
+            keys[i, RPM_SUFFIX]: 0,
+            keys[i, REV_PER_ML_SUFFIX]: 24,
+            keys[i, TUBING_LENGTH_MM_SUFFIX]: 121.5,
+            keys[i, TUBING_ID_MM_SUFFIX]: 1.,
+            keys[i, TUBING_MATERIAL_SUFFIX]: "pharmaline",
+            keys[i, BLOCKING_SUFFIX]: 0,
         })
         base_dtypes.update({
-            devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + MODE_SUFFIX: int.__name__,
-            devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + STEPS_DONE_SUFFIX: int.__name__,
-            devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RPM_SUFFIX: float.__name__,
-            NODE_PREFIX + str(i) + REV_PER_ML_SUFFIX: float.__name__,
-            NODE_PREFIX + str(i) + TUBING_LENGTH_MM_SUFFIX: float.__name__,
-            NODE_PREFIX + str(i) + TUBING_ID_MM_SUFFIX: float.__name__,
-            NODE_PREFIX + str(i) + TUBING_MATERIAL_SUFFIX: str.__name__,
-            NODE_PREFIX + str(i) + BLOCKING_SUFFIX: int.__name__,
+            keys[i, MODE_SUFFIX]: int.__name__,
+            keys[i, STEPS_DONE_SUFFIX]: int.__name__,
+            keys[i, RPM_SUFFIX]: float.__name__,
+            keys[i, REV_PER_ML_SUFFIX]: float.__name__,
+            keys[i, TUBING_LENGTH_MM_SUFFIX]: float.__name__,
+            keys[i, TUBING_ID_MM_SUFFIX]: float.__name__,
+            keys[i, TUBING_MATERIAL_SUFFIX]: str.__name__,
+            keys[i, BLOCKING_SUFFIX]: int.__name__,
         })
 
 
 update_base_common(BASE, BASE_DTYPES)
-update_base(BASE, BASE_DTYPES, NUMBER_PUMPS)
+update_base(BASE, BASE_DTYPES, KEYS)
 
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
@@ -136,6 +165,15 @@ RATE_UNIT_MAPPING.update({
 
 VALID_RATE_UNITS = set(RATE_UNIT_MAPPING.keys())
 
+# rate unit: name of the unit in `devices.base.calibration`
+RATE_UNIT_NAMES = {
+    RPM: 'rpm',
+    UL_MIN: 'ul_min',
+    UL_HR: 'ul_hr',
+    ML_MIN: 'ml_min',
+    ML_HR: 'ml_hr',
+}
+
 MODE_NOT_SET = -1
 MODE_CONTINUOUS = 0
 MODE_FINITE = 1
@@ -196,11 +234,25 @@ FINITE_UNIT_MAPPING.update({
 
 VALID_FINITE_UNITS = set(FINITE_UNIT_MAPPING.keys())
 
-AUTO_STOP_EXPR_STR = ""
-for i in range(0, NUMBER_PUMPS):
-    prepend = "" if i == 0 else " and "
-    AUTO_STOP_EXPR_STR += "{}((int(S)>>(2*{}))&3) == {}".format(prepend, i, STATUS_STOPPED)
+# states of a pump input whose operation is complete
+COMPLETE_STATES = (STATUS_STOPPED,)
+
+# auto-stop condition, compiled to bitmask comparisons, evaluate with `AUTO_STOP(S)`
+AUTO_STOP = devices.base.predicate.all_in(COMPLETE_STATES, range(0, NUMBER_PUMPS))
+
+# the same condition as a Python expression of `S`
+AUTO_STOP_EXPR_STR = AUTO_STOP.expression
 
 AUTO_STOP_EXPR_CONSTANT = "S"
 
-del i
\ No newline at end of file
+# states of an active pump input
+ACTIVE_STATES = (STATUS_CLOCKWISE, STATUS_COUNTERCLOCKWISE)
+
+# decoder of the status word into per-input states
+STATUS_DECODER = devices.base.status.StatusDecoder(NUMBER_PUMPS, ACTIVE_STATES)
+
+# opcode table of the binary command encoding, append new commands only
+WIRE = devices.base.wire.Codec((
+    ('start', devices.base.wire.PUMP_COMMAND),
+    ('stop', devices.base.wire.CHANNEL),
+))
@@ -1,6 +1,9 @@
-from typing import Union
+import array
+from typing import Iterable, Tuple, Union
 
+import devices.base.calibration
 import devices.base.obj
+import devices.base.schedule
 from devices.aqueduct.pp12.constants import *
 
 
@@ -8,6 +11,10 @@ def instantiate_device(d_device, setup):
     return PP12(**d_device)
 
 
+def _rate_unit(units: Union[int, str]) -> str:
+    return RATE_UNIT_NAMES.get(RATE_UNIT_MAPPING.get(units), units)
+
+
 class PumpCommand(object):
     mode: Union[int, str]
     direction: Union[int, str]
@@ -24,6 +31,7 @@ class PumpCommand(object):
         self.rate_units = ML_MIN
         self.finite_value = None
         self.finite_units = None
+        self.wait_for_complete = None
 
         for k, v in kwargs.items():
             if k in self.__dict__.keys():
@@ -48,6 +56,13 @@ class PP12(devices.base.obj.Device):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.__calibration__ = devices.base.calibration.CalibrationCache(NUMBER_PUMPS, self.__calibrate__)
+
+    def __calibrate__(self, pump: int) -> devices.base.calibration.Calibration:
+        key = KEYS[pump, REV_PER_ML_SUFFIX]
+        if self.__store__ is not None:
+            return devices.base.calibration.Calibration(self.__store__.read(key))
+        return devices.base.calibration.Calibration(BASE.get(key))
 
     forward: int = STATUS_CLOCKWISE
     reverse: int = STATUS_COUNTERCLOCKWISE
@@ -206,10 +221,21 @@ class PP12(devices.base.obj.Device):
             | Defaults to 1
         :type update_interval_s: PumpCommand, dict, None, required
 
-        :return: tx_params
-        :rtype: dict
+        :return: tx_params, or if any pump input runs a finite-mode operation, a tuple with a
+            :class:`devices.base.obj.CompletionFuture` per pump input, None for inputs without
+            a finite-mode operation
+        :rtype: dict, tuple
         """
-        return {}
+        commands = (
+            pump0, pump1, pump2, pump3, pump4, pump5,
+            pump6, pump7, pump8, pump9, pump10, pump11,
+        )
+        content = devices.base.obj.send_commands(vars(self), WIRE, 'start', commands, PumpCommand)
+        completions = devices.base.obj.finite_completions(
+            vars(self), content, commands,
+            MODE_MAPPING, MODE_FINITE, wait_for_complete
+        )
+        return content if completions is None else completions
 
     def stop(
             self,
@@ -300,6 +326,127 @@ class PP12(devices.base.obj.Device):
         """
         return {}
 
+    def get_status(self) -> Tuple[bool]:
+        """Get the status of each pump input. A pump input is considered active if it is rotating.
+
+        This will return a :class:`tuple` of boolean values:
+
+        :Example:
+
+        .. code-block:: python
+
+            # check whether pump0 OR pump2 is active
+            status = PP12SIM.get_status()
+            is_active = status[0] or status[2]
+
+        :return: active flag of each pump input
+        :rtype: tuple
+        """
+        if self.__store__ is not None:
+            return STATUS_DECODER.active(self.__store__.read(STATUS_KEY))
+        return NUMBER_PUMPS * (True,)
+
+    def scheduler(self, tick_s: float = devices.base.schedule.DEFAULT_TICK_S) -> devices.base.schedule.DoseScheduler:
+        """Get a scheduler of per-input dose timelines. Doses due in the same tick are started
+        with one `start` command and doses ending in the same tick are stopped with one `stop` command.
+
+        :Example:
+
+        .. code-block:: python
+
+            schedule = PP12SIM.scheduler()
+            fill = PP12SIM.make_command(mode="finite", direction="forward", rate_value=10.,
+                rate_units="ml_min", finite_value=2., finite_units="ml")
+
+            # fill with inputs 0 and 1 at t = 0 s, then with input 0 again once both are complete
+            first = (schedule.add(0, fill), schedule.add(1, fill))
+            schedule.add(0, fill, after=first)
+
+            schedule.start()
+            schedule.wait()
+
+        :param tick_s:
+            | resolution of the schedule in seconds
+            | Defaults to 0.05
+        :type tick_s: float
+        :return: scheduler
+        :rtype: devices.base.schedule.DoseScheduler
+        """
+        return devices.base.schedule.DoseScheduler(self, NUMBER_PUMPS, tick_s)
+
+    @devices.base.obj.command(after=lambda self: self.__calibration__.invalidate())
+    def set_config(self, name: str = None) -> dict:
+        """Set the configuration of the pump, for instance the tubing of each input. The
+        cached rate calibrations are rebuilt from the new configuration on next use.
+
+        :param name: name of the configuration
+        :type name: str
+        :return: command dictionary
+        :rtype: dict
+        """
+
+    def calibration(self, pump: int = 0) -> devices.base.calibration.Calibration:
+        """Get the rate calibration of a pump input, computed once from its `rev_per_ml`
+        and cached until the configuration changes.
+
+        :param pump: pump input index
+        :type pump: int
+        :return: calibration
+        :rtype: devices.base.calibration.Calibration
+        """
+        return self.__calibration__.get(pump)
+
+    def convert_rate(
+            self,
+            rate_value: Union[float, int],
+            from_units: Union[int, str],
+            to_units: Union[int, str],
+            pump: int = 0
+    ) -> float:
+        """Convert a rate of a pump input between `rpm`, `ul_min`, `ul_hr`, `ml_min` and `ml_hr`.
+
+        :Example:
+
+        .. code-block:: python
+
+            # rpm of pump input 3 for 1 mL/min
+            rpm = PP12SIM.convert_rate(1., PP12.ml_min, PP12.rpm, pump=3)
+
+        :param rate_value: rate in `from_units`
+        :type rate_value: float, int
+        :param from_units: rate units of `rate_value`
+        :type from_units: int, str
+        :param to_units: rate units of the result
+        :type to_units: int, str
+        :param pump: pump input index
+        :type pump: int
+        :return: rate in `to_units`
+        :rtype: float
+        """
+        return self.__calibration__.get(pump).convert(rate_value, _rate_unit(from_units), _rate_unit(to_units))
+
+    def convert_rates(
+            self,
+            rate_values: Iterable[Union[float, int]],
+            from_units: Union[int, str],
+            to_units: Union[int, str],
+            pump: int = 0
+    ) -> array.array:
+        """Convert a sequence of rates of a pump input, for instance the steps of a ramp, in one call.
+
+        :param rate_values: rates in `from_units`
+        :type rate_values: Iterable[float]
+        :param from_units: rate units of `rate_values`
+        :type from_units: int, str
+        :param to_units: rate units of the result
+        :type to_units: int, str
+        :param pump: pump input index
+        :type pump: int
+        :return: rates in `to_units`
+        :rtype: array.array('d')
+        """
+        return self.__calibration__.get(pump).convert_many(rate_values, _rate_unit(from_units), _rate_unit(to_units))
+
     def clear_recorded(self):
         """Clear the recorded data for the PP12 device. The recordable data includes:
 
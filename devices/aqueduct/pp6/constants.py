@@ -1,8 +1,13 @@
 import devices.base.constants
+import devices.base.predicate
+import devices.base.status
+import devices.base.wire
 from devices.aqueduct.pp12.constants import *
 
 NUMBER_PUMPS: int = 6
 
+KEYS = key_table(NUMBER_PUMPS)
+
 BASE = dict(
     type="PP6",
     number_ports=2*NUMBER_PUMPS,
@@ -15,7 +20,7 @@ BASE_DTYPES = dict(
 )
 
 update_base_common(BASE, BASE_DTYPES)
-update_base(BASE, BASE_DTYPES, NUMBER_PUMPS)
+update_base(BASE, BASE_DTYPES, KEYS)
 
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
@@ -23,11 +28,25 @@ BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
 DEVICE_TYPE = BASE.get('type')
 DISPLAY_NAME = "6 x Peristaltic Pump (" + DEVICE_TYPE + ")"
 
-AUTO_STOP_EXPR_STR = ""
-for i in range(0, NUMBER_PUMPS):
-    prepend = "" if i == 0 else " and "
-    AUTO_STOP_EXPR_STR += "{}((int(S)>>(2*{}))&3) == {}".format(prepend, i, STATUS_STOPPED)
+# states of a pump input whose operation is complete
+COMPLETE_STATES = (STATUS_STOPPED,)
+
+# auto-stop condition, compiled to bitmask comparisons, evaluate with `AUTO_STOP(S)`
+AUTO_STOP = devices.base.predicate.all_in(COMPLETE_STATES, range(0, NUMBER_PUMPS))
+
+# the same condition as a Python expression of `S`
+AUTO_STOP_EXPR_STR = AUTO_STOP.expression
 
 AUTO_STOP_EXPR_CONSTANT = "S"
 
-del i
\ No newline at end of file
+# states of an active pump input
+ACTIVE_STATES = (STATUS_CLOCKWISE, STATUS_COUNTERCLOCKWISE)
+
+# decoder of the status word into per-input states
+STATUS_DECODER = devices.base.status.StatusDecoder(NUMBER_PUMPS, ACTIVE_STATES)
+
+# opcode table of the binary command encoding, append new commands only
+WIRE = devices.base.wire.Codec((
+    ('start', devices.base.wire.PUMP_COMMAND),
+    ('stop', devices.base.wire.CHANNEL),
+))
@@ -1,10 +1,46 @@
-import config
 import devices.base.constants
 
 NUMBER_INPUTS: int = 4
 NUMBER_TRANSDUCERS_PER_INPUT: int = 3
 NUMBER_TRANSDUCERS: int = NUMBER_INPUTS * NUMBER_TRANSDUCERS_PER_INPUT
 
+TRANSDUCER_PREFIX = 'txdcr_'
+CONNECTION_PREFIX = '_connection_'
+INPUT_PREFIX = '_input_'
+PRESSURE_VALUE_SUFFIX = '_pressure_value'
+PRESSURE_UNITS_SUFFIX = '_pressure_units'
+LENGTH_MM_SUFFIX = '_length_mm'
+ID_MM_SUFFIX = '_id_mm'
+MATERIAL_SUFFIX = '_material'
+ACTIVE_SUFFIX = '_active'
+
+TRANSDUCER_KEYS = devices.base.constants.KeyTable(
+    node_prefix=TRANSDUCER_PREFIX,
+    channels=NUMBER_TRANSDUCERS,
+    global_suffixes=(
+        PRESSURE_VALUE_SUFFIX,
+        PRESSURE_UNITS_SUFFIX,
+    ),
+)
+
+CONNECTION_KEYS = devices.base.constants.KeyTable(
+    node_prefix=CONNECTION_PREFIX,
+    channels=NUMBER_TRANSDUCERS,
+    local_suffixes=(
+        LENGTH_MM_SUFFIX,
+        ID_MM_SUFFIX,
+        MATERIAL_SUFFIX,
+    ),
+)
+
+INPUT_KEYS = devices.base.constants.KeyTable(
+    node_prefix=INPUT_PREFIX,
+    channels=NUMBER_INPUTS,
+    local_suffixes=(
+        ACTIVE_SUFFIX,
+    ),
+)
+
 BASE = dict(
     type="SCIP",
     number_icons=NUMBER_TRANSDUCERS,
@@ -17,31 +53,36 @@ BASE_DTYPES = dict(
 
 for i in range(0, NUMBER_TRANSDUCERS):
     BASE.update({
-        config.DEVICE_GLOBAL_PARAM_PREFIX + 'txdcr_' + str(i) + '_pressure_value': 0,
-        config.DEVICE_GLOBAL_PARAM_PREFIX + 'txdcr_' + str(i) + '_pressure_units': "psi",
-        '_connection_' + str(i) + '_length_mm': 30,
-        '_connection_' + str(i) + '_id_mm': 6,
-        '_connection_' + str(i) + '_material': 'polysulfone',
+        TRANSDUCER_KEYS[i, PRESSURE_VALUE_SUFFIX]: 0,
+        TRANSDUCER_KEYS[i, PRESSURE_UNITS_SUFFIX]: "psi",
+        CONNECTION_KEYS[i, LENGTH_MM_SUFFIX]: 30,
+        CONNECTION_KEYS[i, ID_MM_SUFFIX]: 6,
+        CONNECTION_KEYS[i, MATERIAL_SUFFIX]: 'polysulfone',
     })
     BASE_DTYPES.update({
-        config.DEVICE_GLOBAL_PARAM_PREFIX + 'txdcr_' + str(i) + '_pressure_value': float.__name__,
-        config.DEVICE_GLOBAL_PARAM_PREFIX + 'txdcr_' + str(i) + '_pressure_units': str.__name__,
-        '_connection_' + str(i) + '_length_mm': float.__name__,
-        '_connection_' + str(i) + '_id_mm': float.__name__,
-        '_connection_' + str(i) + '_material': str.__name__,
+        TRANSDUCER_KEYS[i, PRESSURE_VALUE_SUFFIX]: float.__name__,
+        TRANSDUCER_KEYS[i, PRESSURE_UNITS_SUFFIX]: str.__name__,
+        CONNECTION_KEYS[i, LENGTH_MM_SUFFIX]: float.__name__,
+        CONNECTION_KEYS[i, ID_MM_SUFFIX]: float.__name__,
+        CONNECTION_KEYS[i, MATERIAL_SUFFIX]: str.__name__,
     })
 
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        '_input_' + str(i) + '_active': 0,
+        INPUT_KEYS[i, ACTIVE_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        '_input_' + str(i) + '_active': int.__name__,
+        INPUT_KEYS[i, ACTIVE_SUFFIX]: int.__name__,
     })
 
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
 
+# per-channel parameters laid out contiguously in a `devices.base.store.DeviceStateStore`
+STORE_COLUMNS = (
+    TRANSDUCER_KEYS.column(PRESSURE_VALUE_SUFFIX),
+)
+
 DEVICE_TYPE = BASE.get('type')
 
 DISPLAY_NAME = "Parker SciPres (" + DEVICE_TYPE + ")"
@@ -130,6 +130,12 @@ class SCIP(devices.base.obj.Device):
             raise ValueError("Invalid Pressure Reading input index: {}".format(input_num))
         if txdcr_num >= NUMBER_TRANSDUCERS_PER_INPUT:
             raise ValueError("Invalid Pressure Reading transducer index: {}".format(txdcr_num))
+        if self.__store__ is not None:
+            value = self.__store__.read(
+                TRANSDUCER_KEYS[input_num * NUMBER_TRANSDUCERS_PER_INPUT + txdcr_num, PRESSURE_VALUE_SUFFIX]
+            )
+            # NaN marks an absent transducer
+            return None if value != value else value
         return float(5)
 
     def get_all_pressures(self, units: str = "psi") -> List[float]:
@@ -170,6 +176,10 @@ class SCIP(devices.base.obj.Device):
         :return: pressure values
         :rtype: list
         """
+        if self.__store__ is not None:
+            return tuple(
+                None if v != v else v for v in self.__store__.read_vector(STORE_COLUMNS[0])
+            )
         return (NUMBER_TRANSDUCERS * (float(5),))
 
     def set_sim_pressure(self, value: float = 0., input_num: int = 0, txdcr_num: int = 0) -> None:
@@ -1,4 +1,7 @@
 import devices.base.constants
+import devices.base.predicate
+import devices.base.status
+import devices.base.wire
 
 NUMBER_INPUTS: int = 4
 NODE_PREFIX: str = 'pump_'
@@ -43,34 +46,55 @@ BASE_DTYPES.update({
     BLOCKING_INTERVAL_KEY: float.__name__
 })
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=NODE_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        MODE_SUFFIX,
+        RATE_VALUE_SUFFIX,
+        RATE_UNITS_SUFFIX,
+        FINITE_VALUE_SUFFIX,
+        FINITE_UNITS_SUFFIX,
+        VOLUME_INFUSED_SUFFIX,
+        VOLUME_WITHDRAWN_SUFFIX,
+        VOLUME_DISPLACED_UNITS_SUFFIX,
+    ),
+    local_suffixes=(
+        SYRINGE_LENGTH_SUFFIX,
+        SYRINGE_DIAM_SUFFIX,
+        SYRINGE_MATERIAL_SUFFIX,
+        BLOCKING_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + MODE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_VALUE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_UNITS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_VALUE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_UNITS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VOLUME_INFUSED_SUFFIX: str(0),
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VOLUME_WITHDRAWN_SUFFIX: str(0),
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VOLUME_DISPLACED_UNITS_SUFFIX: 0,
-        NODE_PREFIX + str(i) + SYRINGE_LENGTH_SUFFIX: 75,
-        NODE_PREFIX + str(i) + SYRINGE_DIAM_SUFFIX: 25,
-        NODE_PREFIX + str(i) + SYRINGE_MATERIAL_SUFFIX: "glass",
-        NODE_PREFIX + str(i) + BLOCKING_SUFFIX: 0,
+        KEYS[i, MODE_SUFFIX]: 0,
+        KEYS[i, RATE_VALUE_SUFFIX]: 0,
+        KEYS[i, RATE_UNITS_SUFFIX]: 0,
+        KEYS[i, FINITE_VALUE_SUFFIX]: 0,
+        KEYS[i, FINITE_UNITS_SUFFIX]: 0,
+        KEYS[i, VOLUME_INFUSED_SUFFIX]: str(0),
+        KEYS[i, VOLUME_WITHDRAWN_SUFFIX]: str(0),
+        KEYS[i, VOLUME_DISPLACED_UNITS_SUFFIX]: 0,
+        KEYS[i, SYRINGE_LENGTH_SUFFIX]: 75,
+        KEYS[i, SYRINGE_DIAM_SUFFIX]: 25,
+        KEYS[i, SYRINGE_MATERIAL_SUFFIX]: "glass",
+        KEYS[i, BLOCKING_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + MODE_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_VALUE_SUFFIX: float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_UNITS_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_VALUE_SUFFIX: float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_UNITS_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VOLUME_INFUSED_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VOLUME_WITHDRAWN_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VOLUME_DISPLACED_UNITS_SUFFIX: int.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_LENGTH_SUFFIX: float.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_DIAM_SUFFIX: float.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_MATERIAL_SUFFIX: str.__name__,
-        NODE_PREFIX + str(i) + BLOCKING_SUFFIX: int.__name__,
+        KEYS[i, MODE_SUFFIX]: int.__name__,
+        KEYS[i, RATE_VALUE_SUFFIX]: float.__name__,
+        KEYS[i, RATE_UNITS_SUFFIX]: int.__name__,
+        KEYS[i, FINITE_VALUE_SUFFIX]: float.__name__,
+        KEYS[i, FINITE_UNITS_SUFFIX]: int.__name__,
+        KEYS[i, VOLUME_INFUSED_SUFFIX]: str.__name__,
+        KEYS[i, VOLUME_WITHDRAWN_SUFFIX]: str.__name__,
+        KEYS[i, VOLUME_DISPLACED_UNITS_SUFFIX]: int.__name__,
+        KEYS[i, SYRINGE_LENGTH_SUFFIX]: float.__name__,
+        KEYS[i, SYRINGE_DIAM_SUFFIX]: float.__name__,
+        KEYS[i, SYRINGE_MATERIAL_SUFFIX]: str.__name__,
+        KEYS[i, BLOCKING_SUFFIX]: int.__name__,
     })
 
 
@@ -169,13 +193,27 @@ MODE_MAPPING.update({
     MODE_CONTINUOUS: MODE_CONTINUOUS,
 })
 
-AUTO_STOP_EXPR_STR = ""
-for i in range(0, NUMBER_INPUTS):
-    prepend = "" if i == 0 else " and "
-    AUTO_STOP_EXPR_STR += "{}((int(S)>>(2*{}))&3) in ({},{})".format(prepend, i, STATUS_STOPPED, STATUS_PAUSED)
+# states of a pump input whose operation is complete
+COMPLETE_STATES = (STATUS_STOPPED, STATUS_PAUSED)
+
+# auto-stop condition, compiled to bitmask comparisons, evaluate with `AUTO_STOP(S)`
+AUTO_STOP = devices.base.predicate.all_in(COMPLETE_STATES, range(0, NUMBER_INPUTS))
+
+# the same condition as a Python expression of `S`
+AUTO_STOP_EXPR_STR = AUTO_STOP.expression
 
 AUTO_STOP_EXPR_CONSTANT = "S"
 
-del i
+# states of an active pump input
+ACTIVE_STATES = (STATUS_INFUSING, STATUS_WITHDRAWING)
 
+# decoder of the status word into per-input states
+STATUS_DECODER = devices.base.status.StatusDecoder(NUMBER_INPUTS, ACTIVE_STATES)
+
+del i
 
+# opcode table of the binary command encoding, append new commands only
+WIRE = devices.base.wire.Codec((
+    ('pump', devices.base.wire.PUMP_COMMAND),
+    ('stop', devices.base.wire.CHANNEL),
+))
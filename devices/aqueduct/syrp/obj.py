@@ -25,6 +25,7 @@ class PumpCommand(object):
         self.rate_units = ML_MIN
         self.finite_value = None
         self.finite_units = None
+        self.wait_for_complete = None
 
         for k, v in kwargs.items():
             if k in self.__dict__.keys():
@@ -64,15 +65,23 @@ class SYRP(devices.base.obj.Device):
     ml: int = ML
     ul: int = UL
 
+    @devices.base.obj.command
     def get_config(self):
-        content = devices.base.obj.add_object_info_to_content(vars(self), locals(), 'get_config')
-        devices.base.obj.enqueue_and_pause(vars(self), content)
-        return content
+        """Get the configuration of the pump.
 
+        :return: command dictionary
+        :rtype: dict
+        """
+
+    @devices.base.obj.command
     def set_config(self, name: str = None):
-        content = devices.base.obj.add_object_info_to_content(vars(self), locals(), 'set_config')
-        devices.base.obj.enqueue_and_pause(vars(self), content)
-        return content
+        """Set the configuration of the pump.
+
+        :param name: name of the configuration
+        :type name: str
+        :return: command dictionary
+        :rtype: dict
+        """
 
     def pump(self,
              pump0: Union[PumpCommand, None] = None,
@@ -180,10 +189,18 @@ class SYRP(devices.base.obj.Device):
             | Defaults to False
         :type record: bool
 
-        :return: tx_params
-        :rtype: dict
+        :return: tx_params, or if any pump input runs a finite-mode operation, a tuple with a
+            :class:`devices.base.obj.CompletionFuture` per pump input, None for inputs without
+            a finite-mode operation
+        :rtype: dict, tuple
         """
-        return {}
+        commands = (pump0, pump1, pump2, pump3)
+        content = devices.base.obj.send_commands(vars(self), WIRE, 'pump', commands, PumpCommand)
+        completions = devices.base.obj.finite_completions(
+            vars(self), content, commands,
+            MODE_MAPPING, MODE_FINITE, wait_for_complete
+        )
+        return content if completions is None else completions
 
     def stop(self,
              pump0: Union[int, str, bool, None] = None,
@@ -1,4 +1,7 @@
 import devices.base.constants
+import devices.base.predicate
+import devices.base.status
+import devices.base.wire
 from enum import Enum
 
 # Valve / Port Scheme
@@ -80,54 +83,88 @@ BASE_DTYPES.update({
     BLOCKING_INTERVAL_KEY: float.__name__
 })
 
+KEYS = devices.base.constants.KeyTable(
+    node_prefix=NODE_PREFIX,
+    channels=NUMBER_INPUTS,
+    global_suffixes=(
+        MODE_SUFFIX,
+        UL_MIN_SUFFIX,
+        RATE_VALUE_SUFFIX,
+        RATE_UNITS_SUFFIX,
+        FINITE_VALUE_SUFFIX,
+        FINITE_UNITS_SUFFIX,
+        FINITE_UL_TARGET_SUFFIX,
+        UL_INFUSED_SUFFIX,
+        UL_WITHDRAWN_SUFFIX,
+        POSITION_INCREMENTS_SUFFIX,
+        VALVE_POSITION_SUFFIX,
+    ),
+    local_suffixes=(
+        SYRINGE_LENGTH_SUFFIX,
+        SYRINGE_DIAM_SUFFIX,
+        SYRINGE_MATERIAL_SUFFIX,
+        SYRINGE_VOLUME_UL_SUFFIX,
+        PUMP_CONFIG_SUFFIX,
+        PUMP_SERIES_SUFFIX,
+        PLUNGER_MODE_SUFFIX,
+        BLOCKING_SUFFIX,
+    ),
+)
+
 for i in range(0, NUMBER_INPUTS):
     BASE.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + MODE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + UL_MIN_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_VALUE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_UNITS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_VALUE_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_UNITS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_UL_TARGET_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + UL_INFUSED_SUFFIX: str(0),
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + UL_WITHDRAWN_SUFFIX: str(0),
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + POSITION_INCREMENTS_SUFFIX: 0,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VALVE_POSITION_SUFFIX: 1,
-        NODE_PREFIX + str(i) + SYRINGE_LENGTH_SUFFIX: 75,
-        NODE_PREFIX + str(i) + SYRINGE_DIAM_SUFFIX: 25,
-        NODE_PREFIX + str(i) + SYRINGE_MATERIAL_SUFFIX: "glass",
-        NODE_PREFIX + str(i) + SYRINGE_VOLUME_UL_SUFFIX: 500.,
-        NODE_PREFIX + str(i) + PUMP_CONFIG_SUFFIX: PumpConfiguration.NO_PUMP.value,
-        NODE_PREFIX + str(i) + PUMP_SERIES_SUFFIX: PumpSeries.CX6000.value,
-        NODE_PREFIX + str(i) + PLUNGER_MODE_SUFFIX: PumpMode.N0.value,
-        NODE_PREFIX + str(i) + BLOCKING_SUFFIX: 0,
+        KEYS[i, MODE_SUFFIX]: 0,
+        KEYS[i, UL_MIN_SUFFIX]: 0,
+        KEYS[i, RATE_VALUE_SUFFIX]: 0,
+        KEYS[i, RATE_UNITS_SUFFIX]: 0,
+        KEYS[i, FINITE_VALUE_SUFFIX]: 0,
+        KEYS[i, FINITE_UNITS_SUFFIX]: 0,
+        KEYS[i, FINITE_UL_TARGET_SUFFIX]: 0,
+        KEYS[i, UL_INFUSED_SUFFIX]: str(0),
+        KEYS[i, UL_WITHDRAWN_SUFFIX]: str(0),
+        KEYS[i, POSITION_INCREMENTS_SUFFIX]: 0,
+        KEYS[i, VALVE_POSITION_SUFFIX]: 1,
+        KEYS[i, SYRINGE_LENGTH_SUFFIX]: 75,
+        KEYS[i, SYRINGE_DIAM_SUFFIX]: 25,
+        KEYS[i, SYRINGE_MATERIAL_SUFFIX]: "glass",
+        KEYS[i, SYRINGE_VOLUME_UL_SUFFIX]: 500.,
+        KEYS[i, PUMP_CONFIG_SUFFIX]: PumpConfiguration.NO_PUMP.value,
+        KEYS[i, PUMP_SERIES_SUFFIX]: PumpSeries.CX6000.value,
+        KEYS[i, PLUNGER_MODE_SUFFIX]: PumpMode.N0.value,
+        KEYS[i, BLOCKING_SUFFIX]: 0,
     })
     BASE_DTYPES.update({
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + MODE_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + UL_MIN_SUFFIX: float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_VALUE_SUFFIX: float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + RATE_UNITS_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_VALUE_SUFFIX: float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_UNITS_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + FINITE_UL_TARGET_SUFFIX: float.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + UL_INFUSED_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + UL_WITHDRAWN_SUFFIX: str.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + POSITION_INCREMENTS_SUFFIX: int.__name__,
-        devices.base.constants.DEVICE_GLOBAL_PARAM_PREFIX + NODE_PREFIX + str(i) + VALVE_POSITION_SUFFIX: int.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_LENGTH_SUFFIX: float.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_DIAM_SUFFIX: float.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_MATERIAL_SUFFIX: str.__name__,
-        NODE_PREFIX + str(i) + SYRINGE_VOLUME_UL_SUFFIX: float.__name__,
-        NODE_PREFIX + str(i) + PUMP_CONFIG_SUFFIX: type(PumpConfiguration.NO_PUMP.value).__name__,
-        NODE_PREFIX + str(i) + PUMP_SERIES_SUFFIX: type(PumpSeries.CX6000.value).__name__,
-        NODE_PREFIX + str(i) + PLUNGER_MODE_SUFFIX: type(PumpMode.N0.value).__name__,
-        NODE_PREFIX + str(i) + BLOCKING_SUFFIX: int.__name__,
+        KEYS[i, MODE_SUFFIX]: int.__name__,
+        KEYS[i, UL_MIN_SUFFIX]: float.__name__,
+        KEYS[i, RATE_VALUE_SUFFIX]: float.__name__,
+        KEYS[i, RATE_UNITS_SUFFIX]: int.__name__,
+        KEYS[i, FINITE_VALUE_SUFFIX]: float.__name__,
+        KEYS[i, FINITE_UNITS_SUFFIX]: int.__name__,
+        KEYS[i, FINITE_UL_TARGET_SUFFIX]: float.__name__,
+        KEYS[i, UL_INFUSED_SUFFIX]: str.__name__,
+        KEYS[i, UL_WITHDRAWN_SUFFIX]: str.__name__,
+        KEYS[i, POSITION_INCREMENTS_SUFFIX]: int.__name__,
+        KEYS[i, VALVE_POSITION_SUFFIX]: int.__name__,
+        KEYS[i, SYRINGE_LENGTH_SUFFIX]: float.__name__,
+        KEYS[i, SYRINGE_DIAM_SUFFIX]: float.__name__,
+        KEYS[i, SYRINGE_MATERIAL_SUFFIX]: str.__name__,
+        KEYS[i, SYRINGE_VOLUME_UL_SUFFIX]: float.__name__,
+        KEYS[i, PUMP_CONFIG_SUFFIX]: type(PumpConfiguration.NO_PUMP.value).__name__,
+        KEYS[i, PUMP_SERIES_SUFFIX]: type(PumpSeries.CX6000.value).__name__,
+        KEYS[i, PLUNGER_MODE_SUFFIX]: type(PumpMode.N0.value).__name__,
+        KEYS[i, BLOCKING_SUFFIX]: int.__name__,
     })
 
 
 BASE = {**devices.base.constants.BASE, **BASE}
 BASE_DTYPES = {**devices.base.constants.BASE_DTYPES, **BASE_DTYPES}
 
+# per-channel parameters laid out contiguously in a `devices.base.store.DeviceStateStore`
+STORE_COLUMNS = (
+    KEYS.column(POSITION_INCREMENTS_SUFFIX),
+    KEYS.column(PLUNGER_MODE_SUFFIX),
+)
+
 DEVICE_TYPE = BASE.get('type')
 
 DISPLAY_NAME = "Tricontinent C(X) Syringe Pump" + " (" + DEVICE_TYPE + ")"
@@ -227,11 +264,28 @@ MODE_MAPPING.update({
     MODE_CONTINUOUS: MODE_CONTINUOUS,
 })
 
-AUTO_STOP_EXPR_STR = ""
-for i in range(0, NUMBER_INPUTS):
-    prepend = "" if i == 0 else " and "
-    AUTO_STOP_EXPR_STR += "{}((int(S)>>(2*{}))&3) in ({},{})".format(prepend, i, STATUS_STOPPED, STATUS_PAUSED)
+# states of a pump input whose operation is complete
+COMPLETE_STATES = (STATUS_STOPPED, STATUS_PAUSED)
+
+# auto-stop condition, compiled to bitmask comparisons, evaluate with `AUTO_STOP(S)`
+AUTO_STOP = devices.base.predicate.all_in(COMPLETE_STATES, range(0, NUMBER_INPUTS))
+
+# the same condition as a Python expression of `S`
+AUTO_STOP_EXPR_STR = AUTO_STOP.expression
 
 AUTO_STOP_EXPR_CONSTANT = "S"
 
-del i
\ No newline at end of file
+# states of an active pump input
+ACTIVE_STATES = (STATUS_INFUSING, STATUS_WITHDRAWING)
+
+# decoder of the status word into per-input states
+STATUS_DECODER = devices.base.status.StatusDecoder(NUMBER_INPUTS, ACTIVE_STATES)
+
+del i
+
+# opcode table of the binary command encoding, append new commands only
+WIRE = devices.base.wire.Codec((
+    ('pump', devices.base.wire.PUMP_COMMAND),
+    ('stop', devices.base.wire.CHANNEL),
+    ('set_valves', devices.base.wire.VALVE_COMMAND),
+))
@@ -24,6 +24,7 @@ class PumpCommand(object):
         self.rate_units = ML_MIN
         self.finite_value = None
         self.finite_units = None
+        self.wait_for_complete = None
 
         for k, v in kwargs.items():
             if k in self.__dict__.keys():
@@ -364,11 +365,21 @@ class TRCX(devices.base.obj.Device):
             | Defaults to False
         :type record: bool
 
-        :return: tx_params
-        :rtype: dict
+        :return: tx_params, or if any pump input runs a finite-mode operation, a tuple with a
+            :class:`devices.base.obj.CompletionFuture` per pump input, None for inputs without
+            a finite-mode operation
+        :rtype: dict, tuple
         """
-
-        return {}
+        commands = (
+            pump0, pump1, pump2, pump3, pump4, pump5,
+            pump6, pump7, pump8, pump9, pump10, pump11,
+        )
+        content = devices.base.obj.send_commands(vars(self), WIRE, 'pump', commands, PumpCommand)
+        completions = devices.base.obj.finite_completions(
+            vars(self), content, commands,
+            MODE_MAPPING, MODE_FINITE, wait_for_complete
+        )
+        return content if completions is None else completions
 
     def stop(
             self,
@@ -706,7 +717,10 @@ class TRCX(devices.base.obj.Device):
         :return: any of the targeted inputs is active
         :rtype: bool
         """
-
+        if self.__store__ is not None:
+            status = self.get_status()
+            pumps = (pump0, pump1, pump2, pump3, pump4, pump5, pump6, pump7, pump8, pump9, pump10, pump11)
+            return any(status[i] for i, p in enumerate(pumps) if p)
         return True
 
     def get_status(self) -> Tuple[bool]:
@@ -723,6 +737,8 @@ class TRCX(devices.base.obj.Device):
         :return: any of the targeted inputs is active
         :rtype: bool
         """
+        if self.__store__ is not None:
+            return STATUS_DECODER.active(self.__store__.read(STATUS_KEY))
         return NUMBER_INPUTS * (True,)
 
     def get_plunger_positions(self, include_status: bool, include_resolution: bool) -> Tuple[Tuple[int, any, any]]:
@@ -751,6 +767,16 @@ class TRCX(devices.base.obj.Device):
         :return: a tuple of all the pump inputs plunger positions
         :rtype: tuple
         """
+        if self.__store__ is not None:
+            store = self.__store__
+            positions, resolutions = store.vector(STORE_COLUMNS[0]), store.vector(STORE_COLUMNS[1])
+            # positions, status and resolutions from a single update of the worker
+            positions, status, resolutions = store.lock.read(
+                lambda: (tuple(positions), store.read(STATUS_KEY), tuple(resolutions))
+            )
+            status = STATUS_DECODER.decode(status) if include_status else NUMBER_INPUTS * (None,)
+            resolutions = resolutions if include_resolution else NUMBER_INPUTS * (None,)
+            return tuple(zip(positions, status, resolutions))
         if include_status and include_resolution:            
             return NUMBER_INPUTS * ((1000, 1, 1),)
         elif include_status:
@@ -0,0 +1,199 @@
+"""
+Cached flow-rate calibrations of peristaltic pumps.
+
+The conversion of a rate between `rpm`, `ml_min` and `ul_min` depends on the
+calibration of the pump channel, `_rev_per_ml`, measured with its tubing. A :py:class:`Calibration`
+precomputes the coefficient of every pair of rate units once, and a
+:py:class:`CalibrationCache` keeps one calibration per channel until the configuration
+of the Device changes.
+
+.. code-block:: python
+
+    cal = PP12SIM.calibration(pump=3)
+
+    cal.convert(10., "ml_min", "rpm")
+    # 240.0, with 24 revolutions per mL
+
+    # a ramp of 10,000 steps in one call
+    rpm = cal.convert_many(ramp_ml_min, "ml_min", "rpm")
+"""
+
+import array
+from typing import Callable, Dict, Iterable, Tuple, Union
+
+
+RPM = 'rpm'
+
+# mL/min per unit of each volumetric rate unit
+ML_MIN_PER_UNIT = {
+    'ml_min': 1.,
+    'ml_hr': 1. / 60.,
+    'ul_min': 1e-3,
+    'ul_hr': 1e-3 / 60.,
+}
+
+RATE_UNITS = (RPM,) + tuple(ML_MIN_PER_UNIT)
+
+# other spellings of the rate units
+UNIT_ALIASES = {
+    'ml/min': 'ml_min',
+    'ml/hr': 'ml_hr',
+    'ul/min': 'ul_min',
+    'ul/hr': 'ul_hr',
+}
+
+
+def unit_name(units: str) -> str:
+    """
+    Get the canonical name of a rate unit.
+
+    :param units: rate unit, for instance "ml_min" or "ml/min"
+    :type units: str
+    :return: one of `RATE_UNITS`
+    :rtype: str
+    :raises ValueError: for an unknown unit
+    """
+    name = UNIT_ALIASES.get(units, units)
+    if name not in RATE_UNITS:
+        raise ValueError("Invalid rate units {}, should be one of {}".format(units, RATE_UNITS))
+    return name
+
+
+class Calibration(object):
+    """
+    The rate conversion coefficients of one pump channel.
+
+    :param rev_per_ml: revolutions per mL of the channel, None if the pump has no
+        rpm calibration, in which case only volumetric units are converted
+    :type rev_per_ml: float, None
+    """
+
+    __slots__ = (
+        'rev_per_ml',
+        'factors',
+    )
+
+    def __init__(self, rev_per_ml: Union[float, None]):
+        """
+        Constructor method.
+        """
+        # a NaN or non-positive calibration read from the store is no calibration
+        if rev_per_ml is not None and not rev_per_ml > 0:
+            rev_per_ml = None
+        self.rev_per_ml: Union[float, None] = rev_per_ml
+
+        # (from units, to units): coefficient
+        self.factors: Dict[Tuple[str, str], float] = dict()
+        for a, ml_a in ML_MIN_PER_UNIT.items():
+            for b, ml_b in ML_MIN_PER_UNIT.items():
+                self.factors[a, b] = ml_a / ml_b
+        if rev_per_ml is not None:
+            self.factors[RPM, RPM] = 1.
+            for u, ml_u in ML_MIN_PER_UNIT.items():
+                self.factors[u, RPM] = ml_u * rev_per_ml
+                self.factors[RPM, u] = 1. / (rev_per_ml * ml_u)
+
+    def factor(self, from_units: str, to_units: str) -> float:
+        """
+        Get the coefficient converting a rate in `from_units` to `to_units`.
+
+        :param from_units: rate units of the values
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: coefficient
+        :rtype: float
+        :raises ValueError: for an unknown unit, or rpm without calibration
+        """
+        f = self.factors.get((from_units, to_units))
+        if f is None:
+            f = self.factors.get((unit_name(from_units), unit_name(to_units)))
+            if f is None:
+                raise ValueError("Cannot convert {} to {} without a rev_per_ml calibration".format(from_units, to_units))
+        return f
+
+    def convert(self, value: Union[float, int], from_units: str, to_units: str) -> float:
+        """
+        Convert a rate.
+
+        :param value: rate in `from_units`
+        :type value: float, int
+        :param from_units: rate units of the value
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: rate in `to_units`
+        :rtype: float
+        """
+        return value * self.factor(from_units, to_units)
+
+    def convert_many(self, values: Iterable[Union[float, int]], from_units: str, to_units: str) -> array.array:
+        """
+        Convert a sequence of rates, for instance the steps of a ramp, in one call.
+
+        :param values: rates in `from_units`
+        :type values: Iterable[float], array.array('d')
+        :param from_units: rate units of the values
+        :type from_units: str
+        :param to_units: rate units of the result
+        :type to_units: str
+        :return: rates in `to_units`
+        :rtype: array.array('d')
+        """
+        return array.array('d', map(float(self.factor(from_units, to_units)).__mul__, values))
+
+
+class CalibrationCache(object):
+    """
+    The calibrations of the channels of a Device, built on first use and kept until
+    :py:func:`invalidate` is called, typically when the configuration of the Device changes.
+
+    :param channels: number of channels
+    :type channels: int
+    :param source: function building the calibration of a channel from the Device parameters
+    :type source: Callable[[int], Calibration]
+    """
+
+    __slots__ = (
+        'channels',
+        'source',
+        '__entries__',
+    )
+
+    def __init__(self, channels: int, source: Callable[[int], Calibration]):
+        """
+        Constructor method.
+        """
+        self.channels: int = channels
+        self.source: Callable[[int], Calibration] = source
+        self.__entries__: Dict[int, Calibration] = dict()
+
+    def get(self, channel: int = 0) -> Calibration:
+        """
+        Get the calibration of a channel.
+
+        :param channel: channel index
+        :type channel: int
+        :return: calibration
+        :rtype: Calibration
+        :raises ValueError: for an invalid channel
+        """
+        cal = self.__entries__.get(channel)
+        if cal is None:
+            if not 0 <= channel < self.channels:
+                raise ValueError("Invalid channel {}, the Device has {} channels".format(channel, self.channels))
+            cal = self.__entries__[channel] = self.source(channel)
+        return cal
+
+    def invalidate(self, channel: Union[int, None] = None) -> None:
+        """
+        Drop the calibration of a channel, or of every channel.
+
+        :param channel: channel index, None for every channel
+        :type channel: int, None
+        :return: None
+        """
+        if channel is None:
+            self.__entries__.clear()
+        else:
+            self.__entries__.pop(channel, None)
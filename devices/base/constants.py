@@ -1,4 +1,6 @@
+import sys
 from enum import Enum, unique
+from typing import Iterable, Tuple
 
 DEVICE_GLOBAL_PARAM_PREFIX = 'D_'
 
@@ -48,3 +50,90 @@ BASE_DTYPES = {
     DeviceBase.number_decks.value: int.__name__,
     DeviceBase.number_icons.value: int.__name__,
 }
+
+
+class KeyTable(object):
+    """
+    A table of the per-channel parameter keys of a Device type, computed once
+    at import and indexed by `(channel, suffix)`.
+
+    Keys are interned, so lookups in the Device parameter dictionaries compare
+    by identity and no strings are built when a parameter is read or written.
+
+    .. code-block:: python
+
+        KEYS = KeyTable(
+            node_prefix='pump_',
+            channels=12,
+            global_suffixes=(MODE_SUFFIX, RPM_SUFFIX),
+            local_suffixes=(BLOCKING_SUFFIX,),
+        )
+
+        KEYS[0, RPM_SUFFIX]
+        # 'D_pump_0_rpm'
+
+        KEYS.column(RPM_SUFFIX)
+        # ('D_pump_0_rpm', 'D_pump_1_rpm', ...)
+
+    :param node_prefix: prefix of the channel number, for instance 'pump_'
+    :type node_prefix: str
+    :param channels: number of channels
+    :type channels: int
+    :param global_suffixes: suffixes of the parameters that are prefixed
+        with the global parameter prefix
+    :type global_suffixes: Iterable[str]
+    :param local_suffixes: suffixes of the parameters without the global prefix
+    :type local_suffixes: Iterable[str]
+    :param global_prefix: global parameter prefix
+    :type global_prefix: str
+    """
+
+    __slots__ = (
+        'node_prefix',
+        'channels',
+        '__keys__',
+        '__columns__',
+    )
+
+    def __init__(
+        self,
+        node_prefix: str,
+        channels: int,
+        global_suffixes: Iterable[str] = (),
+        local_suffixes: Iterable[str] = (),
+        global_prefix: str = DEVICE_GLOBAL_PARAM_PREFIX
+    ):
+        """
+        Constructor method.
+        """
+        self.node_prefix = node_prefix
+        self.channels = channels
+        self.__keys__ = dict()
+        self.__columns__ = dict()
+
+        for prefix, suffixes in ((global_prefix + node_prefix, global_suffixes), (node_prefix, local_suffixes)):
+            for suffix in suffixes:
+                column = tuple(sys.intern(prefix + str(i) + suffix) for i in range(channels))
+                self.__columns__[suffix] = column
+                for i, key in enumerate(column):
+                    self.__keys__[(i, suffix)] = key
+
+    def __getitem__(self, item: Tuple[int, str]) -> str:
+        return self.__keys__[item]
+
+    def __len__(self) -> int:
+        return len(self.__keys__)
+
+    def __iter__(self):
+        return iter(self.__keys__.values())
+
+    def column(self, suffix: str) -> Tuple[str, ...]:
+        """
+        Get the keys of a parameter for every channel, ordered by channel.
+
+        :param suffix: parameter suffix
+        :type suffix: str
+        :return: keys
+        :rtype: tuple
+        """
+        return self.__columns__[suffix]
@@ -1,13 +1,534 @@
+import concurrent.futures
+import contextlib
+import functools
+import inspect
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+import devices.base.wire
+
+
 class Device(object):
     """
     Devices are instantiated in Recipes and contain the attributes necessary
     to control execution between the device worker and the main recipe thread.
+
+    When a `store` (:py:class:`devices.base.store.DeviceStateStore`) is passed,
+    getters read the Device's state from it instead of the Hub's memory.
     """
     def __init__(self, **kwargs):
         self.__device_key__ = kwargs.get('device_key')
         self.__type__ = kwargs.get('type')
         self.__enqueue__ = kwargs.get('enqueue')
         self.__recipe_pid__ = kwargs.get('pid')
+        self.__store__ = kwargs.get('store')
+
+    def submit(self, action_name: str, **kwargs) -> concurrent.futures.Future:
+        """
+        Send a command to the device worker without pausing the Recipe.
+
+        The returned future resolves to the command dictionary when the device worker has
+        acknowledged the command. Inside a :py:func:`pipeline` the future is also added to
+        the pipeline's barrier, inside a :py:func:`transaction` the command is sent with the
+        transaction.
+
+        .. code-block:: python
+
+            futures = [pump.submit('set_config', name="tubing") for pump in pumps]
+            devices.base.obj.barrier(futures)
+
+        :param action_name: name of the Device method
+        :type action_name: str
+        :param kwargs: arguments of the Device method
+        :return: future
+        :rtype: concurrent.futures.Future
+        """
+        method = getattr(type(self), action_name, None)
+        schema = getattr(method, '__schema__', None)
+        if schema is not None:
+            content = CommandPayload(schema, schema.bind((), kwargs))
+        else:
+            content = add_object_info_to_content(vars(self), kwargs, action_name)
+        p = current_pipeline()
+        future = p.send(vars(self), content) if p is not None else enqueue(vars(self), content)
+        after = getattr(method, '__after__', None)
+        if after is not None:
+            after(self)
+        return future
+
+
+# maximum time in seconds a `SeqLock` reader retries
+SEQLOCK_TIMEOUT_S = 1.
+
+
+class SeqLock(object):
+    """
+    A sequence lock over a counter held in a buffer, typically the first 8 bytes of a
+    :py:class:`devices.base.store.DeviceStateStore`.
+
+    The writer increments the counter before and after each update, so the counter is odd
+    while an update is in progress. Readers copy the values, then check that the counter
+    was even and unchanged, and retry otherwise. Readers never take a lock and never delay
+    the writer, and the writer never waits for readers. A reader gives up with a
+    `TimeoutError` after `timeout_s` seconds of retries, for instance if the writer died
+    in the middle of an update.
+
+    There must be a single writer per buffer, the device worker.
+
+    .. code-block:: python
+
+        # writer
+        with lock.write():
+            store.write_vector(column, values)
+
+        # reader
+        values = lock.read(lambda: tuple(store.vector(column)))
+
+    :param buf: writable buffer holding the counter
+    :type buf: memoryview
+    :param offset: offset of the counter in the buffer
+    :type offset: int
+    :param timeout_s: maximum time in seconds a read retries, None to retry indefinitely
+    :type timeout_s: float, None
+    """
+
+    __slots__ = (
+        'buf',
+        'offset',
+        'timeout_s',
+        'retries',
+        '__depth__',
+    )
+
+    __COUNTER = struct.Struct('<Q')
+
+    # number of failed attempts before a reader yields to the writer
+    __SPIN = 16
+
+    def __init__(self, buf: memoryview, offset: int = 0, timeout_s: Union[float, None] = SEQLOCK_TIMEOUT_S):
+        """
+        Constructor method.
+        """
+        self.buf = buf
+        self.offset = offset
+        self.timeout_s = timeout_s
+        self.retries = 0
+        self.__depth__ = 0
+
+    @property
+    def sequence(self) -> int:
+        """
+        The current value of the counter. Even when no update is in progress.
+
+        :return: sequence
+        :rtype: int
+        """
+        return self.__COUNTER.unpack_from(self.buf, self.offset)[0]
+
+    @contextlib.contextmanager
+    def write(self):
+        """
+        Context manager grouping writes into one update. Nested updates are merged
+        into the outermost one.
+
+        :return: None
+        """
+        self.__depth__ += 1
+        if self.__depth__ == 1:
+            self.__COUNTER.pack_into(self.buf, self.offset, self.sequence + 1)
+        try:
+            yield
+        finally:
+            self.__depth__ -= 1
+            if self.__depth__ == 0:
+                self.__COUNTER.pack_into(self.buf, self.offset, self.sequence + 1)
+
+    def read(self, fn: Callable):
+        """
+        Call `fn` until it runs without an overlapping update and return its result.
+
+        `fn` must copy the values it reads, a view of the buffer is not a snapshot.
+
+        :param fn: callable without arguments that reads and copies the values
+        :type fn: Callable
+        :return: result of `fn`
+        :raises TimeoutError: if no read succeeded within `timeout_s`
+        """
+        unpack_from, buf, offset = self.__COUNTER.unpack_from, self.buf, self.offset
+        attempts = 0
+        deadline = None
+        while True:
+            before = unpack_from(buf, offset)[0]
+            if not before & 1:
+                result = fn()
+                if unpack_from(buf, offset)[0] == before:
+                    return result
+            attempts += 1
+            self.retries += 1
+            if attempts % self.__SPIN == 0:
+                if self.timeout_s is not None:
+                    now = time.monotonic()
+                    if deadline is None:
+                        deadline = now + self.timeout_s
+                    elif now >= deadline:
+                        raise TimeoutError("No consistent read in {} s, sequence {}".format(
+                            self.timeout_s, unpack_from(buf, offset)[0]))
+                # let the writer finish its update
+                time.sleep(0)
+
+
+_REQUIRED = object()
+
+
+class CommandSchema(object):
+    """
+    The payload layout of a Device command, built once from the signature of the
+    Device method. See :py:func:`command`.
+
+    :param action_name: name of the Device method
+    :type action_name: str
+    :param fn: the Device method
+    :type fn: Callable
+    """
+
+    __slots__ = (
+        'action_name',
+        'params',
+        'index',
+        'defaults',
+        'required',
+        'positional',
+    )
+
+    def __init__(self, action_name: str, fn: Callable):
+        """
+        Constructor method.
+        """
+        params = list(inspect.signature(fn).parameters.values())[1:]
+        for p in params:
+            if p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY):
+                raise TypeError("Device command {} cannot take *args or **kwargs".format(action_name))
+        self.action_name: str = action_name
+        self.params: tuple = tuple(sys.intern(p.name) for p in params)
+        self.index: dict = {name: i for i, name in enumerate(self.params)}
+        self.defaults: tuple = tuple(_REQUIRED if p.default is p.empty else p.default for p in params)
+        self.required: int = sum(1 for d in self.defaults if d is _REQUIRED)
+        self.positional: int = sum(1 for p in params if p.kind is p.POSITIONAL_OR_KEYWORD)
+
+    def bind(self, args: tuple, kwargs: dict) -> tuple:
+        """
+        Get the values of the command's parameters, in schema order.
+
+        :param args: positional arguments of the call
+        :type args: tuple
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict
+        :return: values
+        :rtype: tuple
+        :raises TypeError: for unknown, duplicate or missing arguments
+        """
+        n = len(args)
+        if n > self.positional:
+            raise TypeError("{}() takes {} positional arguments, {} given".format(self.action_name, self.positional, n))
+        if not kwargs:
+            values = args + self.defaults[n:] if n < len(self.params) else args
+        else:
+            values = list(args)
+            values.extend(self.defaults[n:])
+            index = self.index
+            for name, value in kwargs.items():
+                i = index.get(name, -1)
+                if i < n:
+                    raise TypeError("{}() got an unexpected or duplicate argument '{}'".format(self.action_name, name))
+                values[i] = value
+            values = tuple(values)
+        if self.required:
+            for name, v in zip(self.params, values):
+                if v is _REQUIRED:
+                    raise TypeError("{}() missing argument '{}'".format(self.action_name, name))
+        return values
+
+
+class CommandPayload(dict):
+    """
+    A command built by a :py:func:`command` method: a dictionary of parameter name: value
+    that also keeps its schema and the tuple of values, in schema order.
+
+    :param schema: schema of the command
+    :type schema: CommandSchema
+    :param args: values, in schema order
+    :type args: tuple
+    """
+
+    __slots__ = (
+        'schema',
+        'args',
+    )
+
+    def __init__(self, schema: CommandSchema, args: tuple):
+        """
+        Constructor method.
+        """
+        super().__init__(zip(schema.params, args))
+        self.schema = schema
+        self.args = args
+
+    @property
+    def action_name(self) -> str:
+        return self.schema.action_name
+
+    def __repr__(self) -> str:
+        return "{}{}".format(self.schema.action_name, super().__repr__())
+
+
+def command(fn: Callable = None, *, name: str = None, after: Callable = None) -> Callable:
+    """
+    Decorator for Device methods that send a command to the device worker.
+
+    The payload schema is built once, when the class is defined, from the method's
+    signature. Calls bind their arguments to a tuple and send a
+    :py:class:`CommandPayload` with :py:func:`enqueue_and_pause`, without copying
+    `locals()`. The body of the decorated method is not executed, it only
+    documents the command. Local work that must follow the command, for instance
+    dropping a cache of the Device configuration, is passed as `after`. A public method
+    that validates its arguments locally sends them with a private command method
+    decorated with the public `name`.
+
+    .. code-block:: python
+
+        class PP(devices.base.obj.Device):
+
+            @devices.base.obj.command(after=lambda self: self.__calibration__.invalidate())
+            def set_config(self, name: str = None) -> dict:
+                # sent as CommandPayload(schema, (name,)), then the calibration is dropped
+                ...
+
+    :param fn: Device method
+    :type fn: Callable
+    :param name: action name of the command, defaults to the name of the method
+    :type name: str, None
+    :param after: function called with the Device once the command has been sent
+    :type after: Callable, None
+    :return: method
+    :rtype: Callable
+    """
+    if fn is None:
+        return functools.partial(command, name=name, after=after)
+
+    schema = CommandSchema(name or fn.__name__, fn)
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs) -> CommandPayload:
+        content = CommandPayload(schema, schema.bind(args, kwargs))
+        enqueue_and_pause(vars(self), content)
+        if after is not None:
+            after(self)
+        return content
+
+    wrapper.__schema__ = schema
+    wrapper.__after__ = after
+    return wrapper
+
+
+class CompletionFuture(concurrent.futures.Future):
+    """
+    The future of a finite Device operation on one channel, such as a finite pump dose.
+
+    The future resolves with the command dictionary when the operation ends. While it runs,
+    the device worker reports its progress with :py:func:`set_progress`.
+
+    .. code-block:: python
+
+        doses = PP12.start(pump0=c0, pump1=c1, wait_for_complete=False)
+        while not devices.base.obj.wait_all(doses, timeout=5):
+            print([None if d is None else d.progress for d in doses])
+
+    :param channel: index of the channel, for instance the pump input
+    :type channel: int
+    :param target: finite value of the operation, in the operation's units, None if unknown
+    :type target: float, int, None
+    """
+
+    def __init__(self, channel: int = 0, target: Union[float, int, None] = None):
+        """
+        Constructor method.
+        """
+        super().__init__()
+        self.channel: int = channel
+        self.target: Union[float, int, None] = target
+        self.__value__: float = 0.
+
+    @property
+    def progress(self) -> Union[float, None]:
+        """
+        Fraction of the operation completed, from 0 to 1, None if the target is unknown
+        and the operation is still running.
+
+        :return: progress
+        :rtype: float, None
+        """
+        if self.done() and not self.cancelled():
+            return 1.
+        if not self.target:
+            return None
+        return min(max(self.__value__ / self.target, 0.), 1.)
+
+    def set_progress(self, value: Union[float, int]) -> None:
+        """
+        Report the amount of the operation completed, in the units of `target`.
+        Called by the device worker.
+
+        :param value: amount completed
+        :type value: float, int
+        :return: None
+        """
+        self.__value__ = float(value)
+
+    def wait(self, timeout: Union[float, int, None] = None) -> bool:
+        """
+        Block until the operation has ended.
+
+        :param timeout: maximum time to block in seconds, None to block indefinitely
+        :type timeout: float, int, None
+        :return: done
+        :rtype: bool
+        """
+        return wait_all((self,), timeout)
+
+
+def wait_all(
+    futures: Iterable[Union[concurrent.futures.Future, None]],
+    timeout: Union[float, int, None] = None
+) -> bool:
+    """
+    Block until every operation has ended. None entries, for channels without a
+    finite operation, are ignored.
+
+    :param futures: futures, for instance the tuple returned by a multi-channel `start`
+    :type futures: Iterable[concurrent.futures.Future, None]
+    :param timeout: maximum time to block in seconds, None to block indefinitely
+    :type timeout: float, int, None
+    :return: all done
+    :rtype: bool
+    """
+    futures = [f for f in futures if f is not None]
+    if not futures:
+        return True
+    _, not_done = concurrent.futures.wait(futures, timeout, concurrent.futures.ALL_COMPLETED)
+    return not not_done
+
+
+def wait_any(
+    futures: Iterable[Union[concurrent.futures.Future, None]],
+    timeout: Union[float, int, None] = None
+) -> Union[concurrent.futures.Future, None]:
+    """
+    Block until one of the operations has ended. None entries are ignored.
+
+    :param futures: futures, for instance the tuple returned by a multi-channel `start`
+    :type futures: Iterable[concurrent.futures.Future, None]
+    :param timeout: maximum time to block in seconds, None to block indefinitely
+    :type timeout: float, int, None
+    :return: the first future done, in the order of `futures`, None on time-out
+    :rtype: concurrent.futures.Future, None
+    """
+    futures = [f for f in futures if f is not None]
+    if not futures:
+        return None
+    done, _ = concurrent.futures.wait(futures, timeout, concurrent.futures.FIRST_COMPLETED)
+    for f in futures:
+        if f in done:
+            return f
+    return None
+
+
+def track_completion(inst: dict, content: dict, targets: Dict[int, Union[float, int, None]]) -> Dict[int, CompletionFuture]:
+    """
+    Register the finite operations of a command with the device worker, which reports
+    their progress and resolves their futures.
+
+    :param inst: instance variables of the Device
+    :type inst: dict
+    :param content: command dictionary
+    :type content: dict
+    :param targets: channel: finite value of each finite operation
+    :type targets: dict
+    :return: channel: future
+    :rtype: dict
+    """
+    futures = dict()
+    for channel, target in targets.items():
+        future = CompletionFuture(channel, target)
+        future.set_result(content)
+        futures[channel] = future
+    return futures
+
+
+def finite_completions(
+    inst: dict,
+    content: dict,
+    commands: Sequence,
+    mode_mapping: dict,
+    finite_mode: int,
+    wait_for_complete: Union[bool, Sequence[bool]] = True
+) -> Union[Tuple[Union[CompletionFuture, None], ...], None]:
+    """
+    Get the futures of the finite operations of a (multi-channel) pump command, and block
+    until the operations flagged in `wait_for_complete` have ended. The `wait_for_complete`
+    of a channel's command, if set, overrides the flag of the call for that channel.
+
+    Inside a pipeline or transaction the command is not sent before the barrier, so the
+    call never blocks: wait on the returned futures after the barrier instead.
+
+    :param inst: instance variables of the Device
+    :type inst: dict
+    :param content: command dictionary
+    :type content: dict
+    :param commands: per-channel commands, `PumpCommand` objects, dictionaries or None
+    :type commands: Sequence
+    :param mode_mapping: the Device's mapping of mode names to modes
+    :type mode_mapping: dict
+    :param finite_mode: the Device's finite mode
+    :type finite_mode: int
+    :param wait_for_complete: block until the finite operations end, or a tuple of
+        per-channel flags
+    :type wait_for_complete: bool, tuple of bools
+    :return: a future per channel, None for channels without a finite operation, or None
+        if the command has no finite operation
+    :rtype: tuple, None
+    """
+    if not isinstance(wait_for_complete, (tuple, list)):
+        wait_for_complete = (bool(wait_for_complete),) * len(commands)
+
+    targets = dict()
+    waits = []
+    for i, c in enumerate(commands):
+        if c is None:
+            continue
+        if isinstance(c, dict):
+            mode, target, wait = c.get('mode'), c.get('finite_value'), c.get('wait_for_complete')
+        else:
+            mode, target, wait = c.mode, c.finite_value, getattr(c, 'wait_for_complete', None)
+        if mode_mapping.get(mode) == finite_mode:
+            targets[i] = target
+            if wait is None:
+                wait = i < len(wait_for_complete) and wait_for_complete[i]
+            if wait:
+                waits.append(i)
+
+    if not targets:
+        return None
+
+    futures = track_completion(inst, content, targets)
+    completions = tuple(futures.get(i) for i in range(len(commands)))
+
+    if waits and current_pipeline() is None:
+        wait_all(completions[i] for i in waits)
+
+    return completions
 
 
 def initialize_object(obj: object, **kwargs):
@@ -19,6 +540,337 @@ def add_object_info_to_content(inst: dict, locs: dict, action_name: str):
     return content
 
 
+def enqueue(inst: dict, content: dict) -> concurrent.futures.Future:
+    """
+    Send a command to the device worker and return immediately.
+
+    :param inst: instance variables of the Device
+    :type inst: dict
+    :param content: command dictionary
+    :type content: dict
+    :return: future resolved with the command dictionary when the device worker acknowledges it
+    :rtype: concurrent.futures.Future
+    """
+    future = concurrent.futures.Future()
+    future.set_result(content)
+    return future
+
+
+def enqueue_many(commands: List[tuple]) -> concurrent.futures.Future:
+    """
+    Send several commands, possibly to different Devices, to the device workers
+    as a single message. The commands are dispatched in order with minimal skew.
+
+    :param commands: (instance variables of the Device, command dictionary) pairs
+    :type commands: list
+    :return: future resolved with the list of command dictionaries when the device workers acknowledge them
+    :rtype: concurrent.futures.Future
+    """
+    future = concurrent.futures.Future()
+    future.set_result([content for _, content in commands])
+    return future
+
+
 def enqueue_and_pause(inst: dict, content: dict) -> None:
+    """
+    Send a command to the device worker and pause the Recipe until it is acknowledged.
+
+    Inside a :py:func:`pipeline` the command is sent without pausing and the
+    pipeline waits for it at its barrier. Inside a :py:func:`transaction` the
+    command is held and sent with the transaction.
+
+    :param inst: instance variables of the Device
+    :type inst: dict
+    :param content: command dictionary
+    :type content: dict
+    :return: None
+    """
+    p = current_pipeline()
+    if p is not None:
+        p.send(inst, content)
     return
 
+
+def send_commands(
+    inst: dict,
+    codec: devices.base.wire.Codec,
+    action: str,
+    commands: Sequence,
+    command_type: type
+) -> dict:
+    """
+    Send per-channel command objects to the device worker as one binary frame, see
+    :py:mod:`devices.base.wire`, and pause the Recipe until it is acknowledged.
+
+    :param inst: instance variables of the Device
+    :type inst: dict
+    :param codec: opcode table of the Device type, `WIRE` of its constants module
+    :type codec: devices.base.wire.Codec
+    :param action: name of the command, must be in the opcode table
+    :type action: str
+    :param commands: per-channel command objects, dictionaries or None
+    :type commands: Sequence
+    :param command_type: class of the command objects, used to build them from dictionaries
+    :type command_type: type
+    :return: command dictionary
+    :rtype: dict
+    :raises ValueError: if a command does not match the record format
+    """
+    frame = codec.encode_commands(
+        action, tuple(command_type(**c) if isinstance(c, dict) else c for c in commands)
+    )
+    content = {devices.base.wire.FRAME_KEY: frame}
+    enqueue_and_pause(inst, content)
+    return content
+
+
+class _Local(threading.local):
+
+    def __init__(self):
+        # stack of the pipelines of the thread, innermost last
+        self.pipelines = []
+
+
+_local = _Local()
+
+
+class Pipeline(object):
+    """
+    Commands sent to Devices inside a pipeline are in flight together and are only
+    waited on at a barrier, so a sequence of commands to several Devices costs one
+    round-trip to the device workers instead of one per command.
+
+    Pipelines are per-thread. Leaving the `with` block waits at a barrier.
+
+    .. code-block:: python
+
+        with devices.base.obj.pipeline() as p:
+            for pump in pumps:
+                pump.set_config(name="tubing")
+                pump.pause()
+            # optional intermediate barrier
+            p.barrier()
+
+    :param timeout: maximum time in seconds to wait at a barrier, None to wait indefinitely
+    :type timeout: float, int, None
+    """
+
+    __slots__ = (
+        'timeout',
+        '__futures__',
+    )
+
+    def __init__(self, timeout: Union[float, int, None] = None):
+        """
+        Constructor method.
+        """
+        self.timeout = timeout
+        self.__futures__: List[concurrent.futures.Future] = []
+
+    def __enter__(self) -> "Pipeline":
+        _local.pipelines.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _local.pipelines.pop()
+        if exc_type is None:
+            self.barrier()
+
+    def __len__(self) -> int:
+        return len(self.__futures__)
+
+    def send(self, inst: dict, content: dict) -> concurrent.futures.Future:
+        """
+        Send a command and add it to the next barrier.
+
+        :param inst: instance variables of the Device
+        :type inst: dict
+        :param content: command dictionary
+        :type content: dict
+        :return: future of the command
+        :rtype: concurrent.futures.Future
+        """
+        future = enqueue(inst, content)
+        self.add(future)
+        return future
+
+    def add(self, future: concurrent.futures.Future) -> None:
+        """
+        Add an in-flight command to the next barrier.
+
+        :param future: future of the command
+        :type future: concurrent.futures.Future
+        :return: None
+        """
+        self.__futures__.append(future)
+
+    def barrier(self) -> list:
+        """
+        Wait until every command sent since the last barrier has been acknowledged.
+
+        :return: command dictionaries, in the order the commands were sent
+        :rtype: list
+        :raises TimeoutError: if the commands are not acknowledged within `timeout`
+        :raises Exception: the first exception raised by a command
+        """
+        futures, self.__futures__ = self.__futures__, []
+        return barrier(futures, self.timeout)
+
+
+class Transaction(Pipeline):
+    """
+    A pipeline that holds the commands sent inside it and sends them to the device workers
+    as one message when the `with` block exits, or at :py:func:`barrier`. Commands to
+    several Devices then start with minimal skew. If the block raises, no command is sent.
+
+    .. code-block:: python
+
+        with devices.transaction():
+            PP.start(...)
+            SV.set_port(...)
+            PV.set_position(...)
+        # the three commands are sent here, in one message
+
+    :param timeout: maximum time in seconds to wait for the acknowledgement, None to wait indefinitely
+    :type timeout: float, int, None
+    """
+
+    __slots__ = (
+        '__commands__',
+    )
+
+    def __init__(self, timeout: Union[float, int, None] = None):
+        """
+        Constructor method.
+        """
+        super().__init__(timeout)
+        self.__commands__: List[tuple] = []
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            for _, _, future in self.__commands__:
+                future.cancel()
+            self.__commands__ = []
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+    def __len__(self) -> int:
+        return len(self.__commands__) + super().__len__()
+
+    def send(self, inst: dict, content: dict) -> concurrent.futures.Future:
+        """
+        Hold a command until the transaction is sent.
+
+        :param inst: instance variables of the Device
+        :type inst: dict
+        :param content: command dictionary
+        :type content: dict
+        :return: future of the command, resolved when the transaction is acknowledged
+        :rtype: concurrent.futures.Future
+        """
+        future = concurrent.futures.Future()
+        self.__commands__.append((inst, content, future))
+        return future
+
+    def barrier(self) -> list:
+        """
+        Send the commands held so far as one message and wait until they have been acknowledged.
+
+        :return: command dictionaries, in the order the commands were sent
+        :rtype: list
+        :raises TimeoutError: if the commands are not acknowledged within `timeout`
+        :raises Exception: the exception raised by the message
+        """
+        commands, self.__commands__ = self.__commands__, []
+        results = []
+        if commands:
+            sent = enqueue_many([(inst, content) for inst, content, _ in commands])
+            try:
+                results = barrier((sent,), self.timeout)[0]
+            except Exception as e:
+                for _, _, future in commands:
+                    future.set_exception(e)
+                raise
+            for (_, _, future), result in zip(commands, results):
+                future.set_result(result)
+        return results + super().barrier()
+
+
+def pipeline(timeout: Union[float, int, None] = None) -> Pipeline:
+    """
+    Start a pipeline of Device commands on the current thread, see :py:class:`Pipeline`.
+
+    :param timeout: maximum time in seconds to wait at a barrier, None to wait indefinitely
+    :type timeout: float, int, None
+    :return: Pipeline
+    :rtype: Pipeline
+    """
+    return Pipeline(timeout)
+
+
+def transaction(timeout: Union[float, int, None] = None) -> Transaction:
+    """
+    Start a transaction of Device commands on the current thread, see :py:class:`Transaction`.
+
+    :param timeout: maximum time in seconds to wait for the acknowledgement, None to wait indefinitely
+    :type timeout: float, int, None
+    :return: Transaction
+    :rtype: Transaction
+    """
+    return Transaction(timeout)
+
+
+def batch(calls: Iterable[Callable], timeout: Union[float, int, None] = None) -> list:
+    """
+    Call Device methods in a :py:class:`Transaction` and send their commands as one message.
+
+    .. code-block:: python
+
+        devices.batch([
+            lambda: PP.start(mode="continuous", rate_value=10.),
+            lambda: SV.set_port(2),
+            lambda: PV.set_position(0.5),
+        ])
+
+    :param calls: callables without arguments that call Device methods
+    :type calls: Iterable[Callable]
+    :param timeout: maximum time in seconds to wait for the acknowledgement, None to wait indefinitely
+    :type timeout: float, int, None
+    :return: command dictionaries, in the order the commands were sent
+    :rtype: list
+    """
+    with transaction(timeout) as t:
+        for call in calls:
+            call()
+        return t.barrier()
+
+
+def current_pipeline() -> Union[Pipeline, None]:
+    """
+    Get the innermost pipeline or transaction of the current thread.
+
+    :return: Pipeline, None outside of a pipeline
+    :rtype: Pipeline, None
+    """
+    stack = _local.pipelines
+    return stack[-1] if stack else None
+
+
+def barrier(futures: Iterable[concurrent.futures.Future], timeout: Union[float, int, None] = None) -> list:
+    """
+    Wait until every command has been acknowledged.
+
+    :param futures: futures returned by :py:func:`Device.submit` or :py:func:`enqueue`
+    :type futures: Iterable[concurrent.futures.Future]
+    :param timeout: maximum time to wait in seconds, None to wait indefinitely
+    :type timeout: float, int, None
+    :return: command dictionaries, in the order of `futures`
+    :rtype: list
+    :raises TimeoutError: if the commands are not acknowledged within `timeout`
+    :raises Exception: the first exception raised by a command
+    """
+    futures = list(futures)
+    done, not_done = concurrent.futures.wait(futures, timeout)
+    if not_done:
+        raise TimeoutError("{} of {} commands not acknowledged".format(len(not_done), len(futures)))
+    return [f.result() for f in futures]
+
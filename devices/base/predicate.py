@@ -0,0 +1,180 @@
+"""
+Conditions on the packed status word of multi-channel Devices, compiled to bitmask comparisons.
+
+PP6, PP12, SYRP and TRCX report the state of each pump input in a 2-bit field of one
+integer status word `S`, input `i` in bits `2*i` and `2*i+1`. A condition such as
+"every input is stopped or paused" is compiled once into at most two comparisons:
+
+    (S & mask) == expected
+    ((S ^ (S >> 1)) & xor_mask) == xor_expected
+
+A set of one state compares both bits of the field. A set of two states compares the
+one bit they differ on, or, for {0, 3} and {1, 2}, whether the two bits are equal. Sets
+of three states fall back to per-byte lookup tables.
+
+.. code-block:: python
+
+    import devices.base.predicate
+
+    stopped = devices.base.predicate.all_in((STATUS_STOPPED, STATUS_PAUSED), range(12))
+    if stopped(S):
+        ...
+
+    # the equivalent Python expression, evaluated against `S`
+    stopped.expression
+"""
+
+import functools
+from typing import Iterable, Tuple
+
+
+FIELD_BITS = 2
+
+FIELD_MASK = (1 << FIELD_BITS) - 1
+
+# number of 2-bit fields per byte of a lookup table
+_FIELDS_PER_BYTE = 8 // FIELD_BITS
+
+
+class StatusPredicate(object):
+    """
+    A compiled condition on a status word, true when the field of every channel holds
+    one of the channel's allowed states. Call it with the status word.
+
+    Use :py:func:`all_in` to build predicates.
+
+    :param allowed: channel: allowed states
+    :type allowed: dict
+    """
+
+    __slots__ = (
+        'mask',
+        'expected',
+        'xor_mask',
+        'xor_expected',
+        'luts',
+        'never',
+        'expression',
+    )
+
+    def __init__(self, allowed: dict):
+        """
+        Constructor method.
+        """
+        self.mask: int = 0
+        self.expected: int = 0
+        self.xor_mask: int = 0
+        self.xor_expected: int = 0
+        self.never: bool = False
+        # byte index: 256 entries, channel sets of three states
+        lut_channels = dict()
+
+        for channel, states in allowed.items():
+            states = frozenset(states)
+            if not states <= frozenset(range(FIELD_MASK + 1)):
+                raise ValueError("Invalid states {} for channel {}".format(sorted(states), channel))
+            shift = FIELD_BITS * channel
+            if not states:
+                self.never = True
+            elif len(states) == 1:
+                self.mask |= FIELD_MASK << shift
+                self.expected |= next(iter(states)) << shift
+            elif len(states) == 2:
+                a, b = sorted(states)
+                diff = a ^ b
+                if diff == FIELD_MASK:
+                    # {0, 3} or {1, 2}: the two bits are equal, or differ
+                    self.xor_mask |= 1 << shift
+                    self.xor_expected |= (a & 1 ^ a >> 1) << shift
+                else:
+                    # the states share the bit that is not in `diff`
+                    keep = FIELD_MASK ^ diff
+                    self.mask |= keep << shift
+                    self.expected |= (a & keep) << shift
+            elif len(states) == 3:
+                lut_channels.setdefault(channel // _FIELDS_PER_BYTE, dict())[channel % _FIELDS_PER_BYTE] = states
+
+        self.luts: Tuple[Tuple[int, bytes], ...] = tuple(
+            (byte, _lut(fields)) for byte, fields in sorted(lut_channels.items())
+        )
+        self.expression: str = self.__expression__()
+
+    def __call__(self, status: int) -> bool:
+        """
+        Evaluate the predicate.
+
+        :param status: status word
+        :type status: int
+        :return: every channel holds an allowed state
+        :rtype: bool
+        """
+        if (status & self.mask) != self.expected:
+            return False
+        if self.xor_mask and ((status ^ (status >> 1)) & self.xor_mask) != self.xor_expected:
+            return False
+        for byte, lut in self.luts:
+            if not lut[(status >> (8 * byte)) & 0xFF]:
+                return False
+        return not self.never
+
+    def __expression__(self) -> str:
+        if self.never:
+            return "False"
+        terms = []
+        if self.mask:
+            terms.append("(int(S)&{})=={}".format(self.mask, self.expected))
+        if self.xor_mask:
+            terms.append("((int(S)^(int(S)>>1))&{})=={}".format(self.xor_mask, self.xor_expected))
+        for byte, lut in self.luts:
+            ok = tuple(i for i in range(256) if lut[i])
+            terms.append("((int(S)>>{})&255) in {}".format(8 * byte, ok))
+        return " and ".join(terms) or "True"
+
+
+def _lut(fields: dict) -> bytes:
+    # 1 for each value of a byte whose fields all hold an allowed state
+    return bytes(
+        int(all((v >> (FIELD_BITS * f)) & FIELD_MASK in states for f, states in fields.items()))
+        for v in range(256)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(states: Tuple[int, ...], channels: Tuple[int, ...]) -> StatusPredicate:
+    return StatusPredicate({c: states for c in channels})
+
+
+def all_in(states: Iterable[int], channels: Iterable[int]) -> StatusPredicate:
+    """
+    Get the predicate "the field of every channel in `channels` holds one of `states`".
+    Predicates are compiled once and cached.
+
+    :Example: auto-stop when every pump input is stopped or paused
+
+    .. code-block:: python
+
+        AUTO_STOP = all_in((STATUS_STOPPED, STATUS_PAUSED), range(NUMBER_INPUTS))
+
+    :param states: allowed states, each from 0 to 3
+    :type states: Iterable[int]
+    :param channels: channel indices
+    :type channels: Iterable[int]
+    :return: predicate
+    :rtype: StatusPredicate
+    """
+    return _compile(tuple(sorted(set(states))), tuple(sorted(set(channels))))
+
+
+def wait_for_complete(states: Iterable[int], flags: Iterable[bool]) -> StatusPredicate:
+    """
+    Get the predicate that a finite operation is complete on every channel flagged
+    in `flags`.
+
+    :param states: states of a completed operation, for instance (STATUS_STOPPED, STATUS_PAUSED)
+    :type states: Iterable[int]
+    :param flags: per-channel flags, as the `wait_for_complete` argument of multi-channel commands
+    :type flags: tuple of bools
+    :return: predicate
+    :rtype: StatusPredicate
+    """
+    return all_in(states, (i for i, f in enumerate(flags) if f))
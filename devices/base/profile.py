@@ -0,0 +1,343 @@
+"""
+Rate profiles of pumps, sent to the device worker as one command.
+
+A :py:class:`RateProfile` is a sequence of (time, rate) points, interpolated linearly
+(a ramp) or held until the next point (steps). The whole profile is sent with one
+`change_speed_profile` command and the device worker plays it with its own timer, a
+:py:class:`ProfilePlayer`, instead of the Recipe sending one `change_speed` command per
+step.
+
+.. code-block:: python
+
+    import devices.base.profile
+
+    # ramp from 10 to 100 rpm over 60 s, hold for 30 s, ramp down to 0 over 10 s
+    ramp = devices.base.profile.RateProfile.piecewise_linear(
+        ((0., 10.), (60., 100.), (90., 100.), (100., 0.)), units="rpm")
+    PPSIM.change_speed_profile(ramp)
+
+    # one rate per second, held for the second
+    steps = devices.base.profile.RateProfile.sampled(rates, interval_s=1., units="ml_min")
+    MFPPSIM.change_speed_profile(steps)
+"""
+
+import array
+import bisect
+import concurrent.futures
+import math
+import threading
+import time
+from typing import Callable, Iterable, Tuple, Union
+
+import devices.base.calibration
+
+
+LINEAR = 'linear'
+STEP = 'step'
+
+INTERPOLATIONS = (LINEAR, STEP)
+
+# maximum number of points of a profile
+MAX_POINTS = 100000
+
+DEFAULT_TICK_S = 0.05
+
+
+class RateProfile(object):
+    """
+    A rate profile, a sequence of (time, rate) points starting at time 0.
+
+    With `LINEAR` interpolation the rate changes linearly between points, with `STEP`
+    interpolation each rate is held until the next point. The rate of the last point is
+    held after the end of the profile.
+
+    :param times_s: times of the points in seconds, increasing and starting at 0
+    :type times_s: Iterable[float]
+    :param rates: rates of the points, in `units`
+    :type rates: Iterable[float]
+    :param units: rate units, for instance "rpm" or "ml_min"
+    :type units: str
+    :param interpolation: `LINEAR` or `STEP`
+    :type interpolation: str
+    :raises ValueError: for an invalid profile
+    """
+
+    __slots__ = (
+        'times_s',
+        'rates',
+        'units',
+        'interpolation',
+    )
+
+    def __init__(
+        self,
+        times_s: Iterable[Union[float, int]],
+        rates: Iterable[Union[float, int]],
+        units: str,
+        interpolation: str = LINEAR
+    ):
+        """
+        Constructor method.
+        """
+        self.times_s: array.array = array.array('d', times_s)
+        self.rates: array.array = array.array('d', rates)
+        self.units: str = units
+        self.interpolation: str = interpolation
+
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError("Invalid interpolation {}, should be one of {}".format(interpolation, INTERPOLATIONS))
+        if len(self.times_s) != len(self.rates):
+            raise ValueError("Expected one rate per time, got {} times and {} rates".format(
+                len(self.times_s), len(self.rates)))
+        if not 0 < len(self.times_s) <= MAX_POINTS:
+            raise ValueError("A profile has 1 to {} points, got {}".format(MAX_POINTS, len(self.times_s)))
+        if self.times_s[0] != 0.:
+            raise ValueError("A profile starts at time 0, got {}".format(self.times_s[0]))
+        if any(b <= a for a, b in zip(self.times_s, self.times_s[1:])):
+            raise ValueError("The times of a profile must be increasing")
+        if not all(map(math.isfinite, self.times_s)) or not all(map(math.isfinite, self.rates)):
+            raise ValueError("The times and rates of a profile must be finite")
+
+    @classmethod
+    def piecewise_linear(
+        cls,
+        breakpoints: Iterable[Tuple[Union[float, int], Union[float, int]]],
+        units: str
+    ) -> "RateProfile":
+        """
+        Make a profile from (time, rate) breakpoints, interpolated linearly.
+
+        :param breakpoints: (time in seconds, rate) pairs, the first at time 0
+        :type breakpoints: Iterable[tuple]
+        :param units: rate units
+        :type units: str
+        :return: profile
+        :rtype: RateProfile
+        """
+        breakpoints = tuple(breakpoints)
+        return cls((t for t, _ in breakpoints), (r for _, r in breakpoints), units, LINEAR)
+
+    @classmethod
+    def sampled(
+        cls,
+        rates: Iterable[Union[float, int]],
+        interval_s: float,
+        units: str,
+        interpolation: str = STEP
+    ) -> "RateProfile":
+        """
+        Make a profile from rates sampled at a fixed interval.
+
+        :param rates: rates, the first at time 0
+        :type rates: Iterable[float]
+        :param interval_s: interval between the samples in seconds
+        :type interval_s: float
+        :param units: rate units
+        :type units: str
+        :param interpolation: `STEP` to hold each rate for the interval, `LINEAR` to ramp
+        :type interpolation: str
+        :return: profile
+        :rtype: RateProfile
+        """
+        if not interval_s > 0:
+            raise ValueError("The interval must be positive, got {}".format(interval_s))
+        rates = array.array('d', rates)
+        return cls((i * interval_s for i in range(len(rates))), rates, units, interpolation)
+
+    def __len__(self) -> int:
+        return len(self.times_s)
+
+    @property
+    def duration_s(self) -> float:
+        """
+        Time of the last point in seconds.
+
+        :rtype: float
+        """
+        return self.times_s[-1]
+
+    def rate_at(self, t: float) -> float:
+        """
+        Get the rate at time `t`.
+
+        :param t: time in seconds from the start of the profile
+        :type t: float
+        :return: rate
+        :rtype: float
+        """
+        i = bisect.bisect_right(self.times_s, t) - 1
+        if i < 0:
+            return self.rates[0]
+        if i >= len(self.times_s) - 1 or self.interpolation == STEP:
+            return self.rates[i]
+        t0, t1 = self.times_s[i], self.times_s[i + 1]
+        r0, r1 = self.rates[i], self.rates[i + 1]
+        return r0 + (r1 - r0) * (t - t0) / (t1 - t0)
+
+    def converted(self, calibration: devices.base.calibration.Calibration, units: str) -> "RateProfile":
+        """
+        Get the profile in other rate units, converting every point in one call.
+
+        :param calibration: calibration of the pump, see `calibration()` of the Device
+        :type calibration: devices.base.calibration.Calibration
+        :param units: rate units of the result
+        :type units: str
+        :return: profile
+        :rtype: RateProfile
+        """
+        return RateProfile(
+            self.times_s, calibration.convert_many(self.rates, self.units, units), units, self.interpolation
+        )
+
+    def simplified(self, tolerance: float) -> "RateProfile":
+        """
+        Get a profile with fewer points, within `tolerance` of this profile. Points of a
+        `LINEAR` profile are dropped where the ramp between the remaining points deviates
+        by at most `tolerance`, points of a `STEP` profile where the rate changes by at most
+        `tolerance`. A sampled ramp of thousands of points is reduced to its breakpoints.
+
+        :param tolerance: maximum deviation of the rate, in the rate units
+        :type tolerance: float
+        :return: profile
+        :rtype: RateProfile
+        """
+        times, rates = self.times_s, self.rates
+        n = len(times)
+        keep = [0]
+        if self.interpolation == STEP:
+            for i in range(1, n):
+                if abs(rates[i] - rates[keep[-1]]) > tolerance:
+                    keep.append(i)
+        else:
+            # extend the segment from the last kept point while its slope stays in the range
+            # of slopes passing within tolerance of every skipped point
+            lo, hi = -math.inf, math.inf
+            for i in range(1, n):
+                t0, r0 = times[keep[-1]], rates[keep[-1]]
+                slope = (rates[i] - r0) / (times[i] - t0)
+                if not lo <= slope <= hi:
+                    keep.append(i - 1)
+                    t0, r0 = times[i - 1], rates[i - 1]
+                    lo, hi = -math.inf, math.inf
+                dt = times[i] - t0
+                lo = max(lo, (rates[i] - tolerance - r0) / dt)
+                hi = min(hi, (rates[i] + tolerance - r0) / dt)
+        if n > 1 and keep[-1] != n - 1:
+            keep.append(n - 1)
+        return RateProfile((times[i] for i in keep), (rates[i] for i in keep), self.units, self.interpolation)
+
+    def _to_command(self) -> dict:
+        return dict(
+            units=self.units,
+            interpolation=self.interpolation,
+            times_s=self.times_s.tolist(),
+            rates=self.rates.tolist(),
+        )
+
+
+class ProfilePlayer(object):
+    """
+    Play a rate profile with a local timer, as the device worker does.
+
+    A `LINEAR` profile is evaluated every `tick_s` seconds, a `STEP` profile at the time of
+    each point. `set_rate` is called only when the rate changes by more than `min_change`.
+    `future` resolves when the last point is reached.
+
+    :param profile: rate profile
+    :type profile: RateProfile
+    :param set_rate: function setting the rate of the pump, in the units of the profile
+    :type set_rate: Callable[[float], None]
+    :param tick_s: interval between updates of a `LINEAR` profile in seconds
+    :type tick_s: float
+    :param min_change: smallest change of rate sent to `set_rate`
+    :type min_change: float
+    """
+
+    def __init__(
+        self,
+        profile: RateProfile,
+        set_rate: Callable[[float], None],
+        tick_s: float = DEFAULT_TICK_S,
+        min_change: float = 0.
+    ):
+        """
+        Constructor method.
+        """
+        self.profile: RateProfile = profile
+        self.set_rate: Callable[[float], None] = set_rate
+        self.tick_s: float = tick_s
+        self.min_change: float = min_change
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        # number of calls to `set_rate`
+        self.updates: int = 0
+
+        self.__stop__ = threading.Event()
+        self.__lock__ = threading.Lock()
+        self.__thread__: Union[threading.Thread, None] = None
+
+    def start(self) -> None:
+        """
+        Start playing the profile.
+
+        :return: None
+        """
+        if self.__thread__ is None:
+            self.__thread__ = threading.Thread(target=self.__run__, daemon=True)
+            self.__thread__.start()
+
+    def stop(self) -> None:
+        """
+        Stop playing the profile, the rate is left unchanged.
+
+        :return: None
+        """
+        self.__stop__.set()
+        with self.__lock__:
+            if self.future.cancel():
+                self.future.set_running_or_notify_cancel()
+
+    def wait(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Block until the profile has ended or is stopped.
+
+        :param timeout: maximum time to wait in seconds, None to wait indefinitely
+        :type timeout: float, None
+        :return: True if the profile has ended or is stopped, False on timeout
+        :rtype: bool
+        """
+        done, _ = concurrent.futures.wait((self.future,), timeout)
+        return bool(done)
+
+    def __run__(self):
+        profile = self.profile
+        times = profile.times_s
+        last = None
+        origin = time.monotonic()
+        try:
+            while not self.__stop__.is_set():
+                t = time.monotonic() - origin
+                rate = profile.rate_at(t)
+                if last is None or abs(rate - last) > self.min_change or t >= profile.duration_s:
+                    if rate != last:
+                        self.set_rate(rate)
+                        self.updates += 1
+                    last = rate
+                if t >= profile.duration_s:
+                    break
+                if profile.interpolation == STEP:
+                    # sleep until the next point
+                    i = bisect.bisect_right(times, t)
+                    wake = times[i] if i < len(times) else profile.duration_s
+                else:
+                    wake = min((math.floor(t / self.tick_s) + 1) * self.tick_s, profile.duration_s)
+                self.__stop__.wait(max(wake - (time.monotonic() - origin), 0.))
+        except Exception as e:  # noqa
+            self.__resolve__(self.future.set_exception, e)
+            return
+        self.__resolve__(self.future.set_result, self.updates)
+
+    def __resolve__(self, setter: Callable, value) -> None:
+        # under the lock of `stop`, which may cancel the future concurrently
+        with self.__lock__:
+            if not self.future.done():
+                setter(value)
@@ -0,0 +1,458 @@
+"""
+Scheduling of per-channel dose timelines on multi-channel pumps.
+
+A multi-channel pump, such as PP12 or PP6, starts or stops any of its inputs with one
+command. A :py:class:`DoseScheduler` takes the doses of every input, each with a start
+time and the doses it must follow, and sends the doses that are due in the same tick
+of its timer wheel as one `start` command, and the doses that end in the same tick as
+one `stop` command. A plate-filling sequence of 96 doses on 12 inputs is then sent as
+a few merged commands instead of 96 blocking calls.
+
+.. code-block:: python
+
+    schedule = PP12SIM.scheduler()
+
+    # 2 mL on inputs 0 to 11 at t = 0 s
+    first = [schedule.add(i, PP12SIM.make_command(mode="finite", direction="forward",
+        rate_value=10., rate_units="ml_min", finite_value=2., finite_units="ml")) for i in range(12)]
+
+    # 1 mL on input 0 once the first doses of inputs 0 and 1 are complete
+    schedule.add(0, dose_1ml, after=(first[0], first[1]))
+
+    # continuous flow on input 5 from t = 30 s for 10 s
+    schedule.add(5, continuous, at_s=30., duration_s=10.)
+
+    schedule.start()
+    schedule.wait()
+"""
+
+import collections
+import concurrent.futures
+import math
+import threading
+import time
+from typing import Iterable, List, Tuple, Union
+
+import devices.base.obj
+
+
+DEFAULT_TICK_S = 0.05
+
+DEFAULT_WHEEL_SIZE = 256
+
+# keyword of channel `i` in the `start` and `stop` commands of the Device
+DEFAULT_CHANNEL_KEYWORD = 'pump{}'
+
+START = 0
+STOP = 1
+
+
+def _cancel(future: concurrent.futures.Future) -> None:
+    # notify waiters, `concurrent.futures.wait` only returns futures cancelled and notified
+    if future.cancel():
+        future.set_running_or_notify_cancel()
+
+
+class Dose(object):
+    """
+    A command on one channel of a schedule. Use :py:func:`DoseScheduler.add` to create doses.
+
+    `future` resolves when the dose is complete: when its finite operation ends, when it
+    is stopped after `duration_s`, or, for a continuous dose without a duration, when it
+    is started.
+
+    :param channel: channel (pump input) index
+    :type channel: int
+    :param command: command of the channel, typically a `PumpCommand`
+    :param at_s: earliest start, in seconds from the start of the schedule
+    :type at_s: float
+    :param duration_s: stop the channel this many seconds after the dose starts, None to let
+        the command end on its own
+    :type duration_s: float, None
+    :param after: doses that must be complete before this dose starts
+    :type after: tuple of Dose
+    """
+
+    __slots__ = (
+        'channel',
+        'command',
+        'at_s',
+        'duration_s',
+        'after',
+        'future',
+        'started_s',
+        '__waiting__',
+        '__dependents__',
+    )
+
+    def __init__(
+        self,
+        channel: int,
+        command,
+        at_s: float = 0.,
+        duration_s: Union[float, None] = None,
+        after: Tuple["Dose", ...] = ()
+    ):
+        """
+        Constructor method.
+        """
+        self.channel: int = channel
+        self.command = command
+        self.at_s: float = float(at_s)
+        self.duration_s: Union[float, None] = duration_s
+        self.after: Tuple[Dose, ...] = after
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        # time the start command was sent, in seconds from the start of the schedule
+        self.started_s: Union[float, None] = None
+        self.__waiting__: int = len(after)
+        self.__dependents__: List[Dose] = []
+
+
+class TimerWheel(object):
+    """
+    A hashed timer wheel. Items are placed in the slot of their tick, modulo the number
+    of slots, so adding an item and collecting the items of a tick take constant time
+    regardless of the number of pending items.
+
+    :param tick_s: duration of a tick in seconds
+    :type tick_s: float
+    :param size: number of slots
+    :type size: int
+    """
+
+    __slots__ = (
+        'tick_s',
+        'size',
+        'slots',
+        'tick',
+        'pending',
+    )
+
+    def __init__(self, tick_s: float = DEFAULT_TICK_S, size: int = DEFAULT_WHEEL_SIZE):
+        """
+        Constructor method.
+        """
+        self.tick_s: float = tick_s
+        self.size: int = size
+        self.slots: Tuple[list, ...] = tuple([] for _ in range(size))
+        # next tick to collect
+        self.tick: int = 0
+        self.pending: int = 0
+
+    def add(self, t: float, item) -> int:
+        """
+        Add an item due at time `t`. Items due in the past are due at the next tick.
+
+        :param t: time in seconds from the origin of the wheel
+        :type t: float
+        :param item: item
+        :return: tick of the item
+        :rtype: int
+        """
+        tick = max(int(math.ceil(t / self.tick_s - 1e-9)), self.tick)
+        self.slots[tick % self.size].append((tick, item))
+        self.pending += 1
+        return tick
+
+    def collect(self, t: float) -> List[Tuple[int, list]]:
+        """
+        Collect the items of every tick up to time `t`.
+
+        :param t: time in seconds from the origin of the wheel
+        :type t: float
+        :return: (tick, items) for each tick with items, in tick order
+        :rtype: list
+        """
+        last = int(t / self.tick_s)
+        if not self.pending:
+            self.tick = max(self.tick, last + 1)
+            return []
+        due = []
+        # slots repeat every `size` ticks
+        for tick in range(self.tick, min(last, self.tick + self.size - 1) + 1):
+            slot = self.slots[tick % self.size]
+            if slot:
+                items = [item for k, item in slot if k <= last]
+                if items:
+                    slot[:] = [(k, item) for k, item in slot if k > last]
+                    self.pending -= len(items)
+                    due.append((tick, items))
+        self.tick = max(self.tick, last + 1)
+        return due
+
+    def next_time(self) -> Union[float, None]:
+        """
+        Get the time of the next tick to collect, None if the wheel is empty.
+
+        :return: time in seconds from the origin of the wheel
+        :rtype: float, None
+        """
+        return self.tick * self.tick_s if self.pending else None
+
+
+class DoseScheduler(object):
+    """
+    Dispatch per-channel dose timelines to a multi-channel pump with merged commands.
+
+    Doses due in the same tick are started with one `start` command of the Device, and
+    doses whose duration ends in the same tick are stopped with one `stop` command. A dose
+    whose channel is already started in the tick is moved to the next tick, and a dose whose
+    channel runs a dose with a duration is started when that dose is stopped. Dependencies
+    are resolved when the doses complete, so a dose that follows a finite-mode dose starts
+    in the first tick after the operation ends.
+
+    :param device: multi-channel pump, for instance a PP12 or PP6
+    :type device: devices.base.obj.Device
+    :param channels: number of channels of the Device
+    :type channels: int
+    :param tick_s: resolution of the schedule in seconds
+    :type tick_s: float
+    :param wheel_size: number of slots of the timer wheel
+    :type wheel_size: int
+    :param channel_keyword: keyword of a channel in the `start` and `stop` commands
+    :type channel_keyword: str
+    """
+
+    def __init__(
+        self,
+        device: devices.base.obj.Device,
+        channels: int,
+        tick_s: float = DEFAULT_TICK_S,
+        wheel_size: int = DEFAULT_WHEEL_SIZE,
+        channel_keyword: str = DEFAULT_CHANNEL_KEYWORD
+    ):
+        """
+        Constructor method.
+        """
+        self.device: devices.base.obj.Device = device
+        self.channels: int = channels
+        self.channel_keywords: Tuple[str, ...] = tuple(channel_keyword.format(i) for i in range(channels))
+        self.doses: List[Dose] = []
+        # number of `start` and `stop` commands sent
+        self.commands_sent: int = 0
+
+        self.__wheel__ = TimerWheel(tick_s, wheel_size)
+        self.__origin__: Union[float, None] = None
+        # channel: dose running with a duration
+        self.__running__: dict = dict()
+        # channel: doses due while the channel runs a dose with a duration, in due order
+        self.__deferred__: dict = dict()
+        self.__lock__ = threading.Lock()
+        self.__wake__ = threading.Event()
+        self.__closed__: bool = False
+        self.__thread__: Union[threading.Thread, None] = None
+
+    def add(
+        self,
+        channel: int,
+        command,
+        at_s: float = 0.,
+        duration_s: Union[float, None] = None,
+        after: Union[Dose, Iterable[Dose]] = ()
+    ) -> Dose:
+        """
+        Add a dose to the schedule. Doses can be added before or after the schedule is started.
+
+        :param channel: channel (pump input) index
+        :type channel: int
+        :param command: command of the channel, typically made with `make_command`
+        :param at_s: earliest start, in seconds from the start of the schedule
+        :type at_s: float
+        :param duration_s: stop the channel this many seconds after the dose starts
+        :type duration_s: float, None
+        :param after: dose, or doses, that must be complete before this dose starts
+        :type after: Dose, Iterable[Dose]
+        :return: dose
+        :rtype: Dose
+        :raises ValueError: for an invalid channel
+        """
+        if not 0 <= channel < self.channels:
+            raise ValueError("Invalid channel {}, the Device has {} channels".format(channel, self.channels))
+        after = (after,) if isinstance(after, Dose) else tuple(after)
+        dose = Dose(channel, command, at_s, duration_s, after)
+        with self.__lock__:
+            self.doses.append(dose)
+            for d in after:
+                if d.future.done():
+                    dose.__waiting__ -= 1
+                else:
+                    d.__dependents__.append(dose)
+            if any(d.future.done() and (d.future.cancelled() or d.future.exception()) for d in after):
+                _cancel(dose.future)
+            elif not dose.__waiting__ and self.__origin__ is not None:
+                self.__schedule__(dose.at_s, (START, dose))
+        return dose
+
+    def start(self) -> None:
+        """
+        Start the schedule. The start times of the doses are relative to this call.
+
+        :return: None
+        """
+        with self.__lock__:
+            if self.__origin__ is not None:
+                return
+            self.__origin__ = time.monotonic()
+            for dose in self.doses:
+                if not dose.__waiting__ and not dose.future.done():
+                    self.__wheel__.add(dose.at_s, (START, dose))
+        self.__thread__ = threading.Thread(target=self.__run__, daemon=True)
+        self.__thread__.start()
+
+    def wait(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Block until every dose is complete, or cancelled.
+
+        :param timeout: maximum time to wait in seconds, None to wait indefinitely
+        :type timeout: float, None
+        :return: True if every dose is done, False on timeout
+        :rtype: bool
+        """
+        with self.__lock__:
+            futures = [d.future for d in self.doses]
+        return devices.base.obj.wait_all(futures, timeout)
+
+    def cancel(self) -> None:
+        """
+        Cancel the doses that have not started and stop, with one command, the doses
+        running with a duration.
+
+        :return: None
+        :raises Exception: the error of the stop command, which also fails the running doses
+        """
+        with self.__lock__:
+            self.__closed__ = True
+            running = list(self.__running__.values())
+            self.__running__.clear()
+            self.__deferred__.clear()
+            for dose in self.doses:
+                if dose.started_s is None:
+                    _cancel(dose.future)
+        self.__wake__.set()
+        if running:
+            try:
+                self.__send__(self.device.stop, {self.channel_keywords[d.channel]: True for d in running})
+            except Exception as e:  # noqa
+                for dose in running:
+                    self.__complete__(dose, None, e)
+                raise
+            for dose in running:
+                _cancel(dose.future)
+
+    def __schedule__(self, at_s: float, item: tuple) -> None:
+        # called with the lock held
+        self.__wheel__.add(at_s, item)
+        self.__wake__.set()
+
+    def __now__(self) -> float:
+        return time.monotonic() - self.__origin__
+
+    def __run__(self):
+        wheel = self.__wheel__
+        while True:
+            with self.__lock__:
+                if self.__closed__:
+                    return
+                due = wheel.collect(self.__now__())
+                next_s = wheel.next_time()
+                self.__wake__.clear()
+            for tick, items in due:
+                self.__dispatch__(tick, items)
+            if not due:
+                self.__wake__.wait(None if next_s is None else max(next_s - self.__now__(), 0.))
+
+    def __dispatch__(self, tick: int, items: list):
+        # stop first, so a channel can be stopped and started in the same tick
+        stops = [dose for action, dose in items if action == STOP]
+        if stops:
+            with self.__lock__:
+                stops = [d for d in stops if self.__running__.pop(d.channel, None) is d]
+                # doses that waited for the stopped doses start in this tick
+                items = items + [(START, d) for s in stops for d in self.__deferred__.pop(s.channel, ())]
+            if stops:
+                error = None
+                try:
+                    self.__send__(self.device.stop, {self.channel_keywords[d.channel]: True for d in stops})
+                except Exception as e:  # noqa
+                    error = e
+                for dose in stops:
+                    self.__complete__(dose, None, error)
+
+        starts = dict()
+        with self.__lock__:
+            for action, dose in items:
+                if action != START or dose.future.done():
+                    continue
+                if dose.channel in starts:
+                    # one command per channel in a tick, start in the next tick
+                    self.__schedule__(0., (START, dose))
+                    continue
+                if dose.channel in self.__running__:
+                    # the channel runs a dose with a duration, start when it is stopped
+                    self.__deferred__.setdefault(dose.channel, []).append(dose)
+                    continue
+                starts[dose.channel] = dose
+                dose.started_s = self.__now__()
+                if dose.duration_s is not None:
+                    self.__running__[dose.channel] = dose
+                    # from the tick of the start, so durations are not delayed by dispatch
+                    self.__schedule__(tick * self.__wheel__.tick_s + dose.duration_s, (STOP, dose))
+        if not starts:
+            return
+
+        try:
+            completions = self.__send__(
+                self.device.start,
+                {self.channel_keywords[c]: d.command for c, d in starts.items()},
+                wait_for_complete=False
+            )
+        except Exception as e:  # noqa
+            for dose in starts.values():
+                self.__complete__(dose, None, e)
+            return
+
+        for channel, dose in starts.items():
+            future = completions[channel] if isinstance(completions, tuple) else None
+            if dose.duration_s is not None:
+                continue
+            if future is None:
+                self.__complete__(dose, None)
+            else:
+                future.add_done_callback(lambda f, d=dose: self.__complete__(d, f))
+
+    def __send__(self, fn, kwargs: dict, **options):
+        self.commands_sent += 1
+        return fn(**kwargs, **options)
+
+    def __complete__(
+        self,
+        dose: Dose,
+        future: Union[concurrent.futures.Future, None],
+        error: Union[BaseException, None] = None
+    ):
+        if future is not None and future.cancelled():
+            _cancel(dose.future)
+        elif future is not None and future.exception() is not None:
+            error = future.exception()
+        if dose.future.done():
+            pass
+        elif error is not None:
+            dose.future.set_exception(error)
+        else:
+            dose.future.set_result(None if future is None else future.result())
+
+        failed = not dose.future.done() or dose.future.cancelled() or dose.future.exception() is not None
+        queue = collections.deque([dose])
+        with self.__lock__:
+            while queue:
+                for dependent in queue.popleft().__dependents__:
+                    if dependent.future.done():
+                        continue
+                    if failed:
+                        # a dose that follows a failed dose never starts
+                        _cancel(dependent.future)
+                        queue.append(dependent)
+                        continue
+                    dependent.__waiting__ -= 1
+                    if not dependent.__waiting__ and not self.__closed__:
+                        self.__schedule__(max(dependent.at_s, self.__now__()), (START, dependent))
@@ -0,0 +1,167 @@
+"""
+Decoding of the packed status word of multi-channel Devices.
+
+PP6, PP12, SYRP and TRCX report the state of each pump input in a 2-bit field of one
+integer status word, input `i` in bits `2*i` and `2*i+1` (see
+:py:mod:`devices.base.predicate`). A decoder turns a status word into the state of
+every channel, and a history of status words into one array of states per channel,
+through precomputed per-byte lookup tables: the loops over channels and samples run
+in `bytes.translate` and strided slices instead of Python code.
+
+States are returned as `bytes`, indexing yields the integer state of a channel.
+
+.. code-block:: python
+
+    import devices.aqueduct.trcx.constants as c
+
+    c.STATUS_DECODER.decode(0b1001)
+    # b'\\x01\\x02\\x00\\x00...', input 0 infusing, input 1 withdrawing
+
+    c.STATUS_DECODER.active(0b1001)
+    # (True, True, False, False, ...)
+
+    # one array per input over a history of status words
+    active = c.STATUS_DECODER.active_many(words)
+    active[3].count(1)  # number of samples with input 3 active
+"""
+
+import array
+import sys
+from typing import Iterable, Tuple
+
+from devices.base.predicate import FIELD_BITS, FIELD_MASK
+
+
+# number of 2-bit fields per byte of a status word
+FIELDS_PER_BYTE = 8 // FIELD_BITS
+
+# width in bytes of a packed history sample, an unsigned 64-bit integer
+WORD_SIZE = 8
+
+# byte value: the states of its fields, in channel order
+BYTE_STATES = tuple(
+    bytes((v >> (FIELD_BITS * f)) & FIELD_MASK for f in range(FIELDS_PER_BYTE))
+    for v in range(256)
+)
+
+# field index: `bytes.translate` table from a byte value to the state of the field
+FIELD_TABLES = tuple(
+    bytes((v >> (FIELD_BITS * f)) & FIELD_MASK for v in range(256))
+    for f in range(FIELDS_PER_BYTE)
+)
+
+
+def _pack(words: Iterable[int]) -> bytes:
+    # status words as little-endian unsigned 64-bit integers
+    a = words if isinstance(words, array.array) and words.typecode == 'Q' else array.array('Q', words)
+    if sys.byteorder != 'little':
+        a = array.array('Q', a)
+        a.byteswap()
+    return a.tobytes()
+
+
+class StatusDecoder(object):
+    """
+    Decoder of the status words of a multi-channel Device type.
+
+    :param channels: number of channels (pump inputs) of the Device type, at most 32
+    :type channels: int
+    :param active_states: states of an active channel, for instance (STATUS_INFUSING, STATUS_WITHDRAWING)
+    :type active_states: Iterable[int]
+    """
+
+    __slots__ = (
+        'channels',
+        'size',
+        'mask',
+        'active_states',
+        'active_table',
+        'active_field_tables',
+    )
+
+    def __init__(self, channels: int, active_states: Iterable[int]):
+        """
+        Constructor method.
+        """
+        if not 0 < channels * FIELD_BITS <= 8 * WORD_SIZE:
+            raise ValueError("A status word holds 1 to {} channels, got {}".format(
+                8 * WORD_SIZE // FIELD_BITS, channels))
+        self.channels: int = channels
+        # number of bytes of a status word
+        self.size: int = -(-channels // FIELDS_PER_BYTE)
+        # bits of a status word held in `size` bytes
+        self.mask: int = (1 << 8 * self.size) - 1
+        self.active_states: frozenset = frozenset(active_states)
+        # `bytes.translate` table from a state to 1 if active, 0 otherwise
+        self.active_table: bytes = bytes(int(s in self.active_states) for s in range(256))
+        # field index: `bytes.translate` table from a byte value to 1 if the field is active
+        self.active_field_tables: Tuple[bytes, ...] = tuple(t.translate(self.active_table) for t in FIELD_TABLES)
+
+    def decode(self, status: int) -> bytes:
+        """
+        Get the state of every channel. Bits above the fields of the channels are ignored.
+
+        :param status: status word
+        :type status: int
+        :return: states, in channel order
+        :rtype: bytes
+        """
+        return b''.join([BYTE_STATES[b] for b in (status & self.mask).to_bytes(self.size, 'little')])[:self.channels]
+
+    def active(self, status: int) -> Tuple[bool, ...]:
+        """
+        Get whether every channel is active.
+
+        :param status: status word
+        :type status: int
+        :return: active flags, in channel order
+        :rtype: tuple of bools
+        """
+        active = self.active_states
+        return tuple(s in active for s in self.decode(status))
+
+    def decode_many(self, words: Iterable[int]) -> Tuple[bytes, ...]:
+        """
+        Get the state of every channel over a history of status words.
+
+        :param words: status words, for instance the recorded history of the status parameter
+        :type words: Iterable[int], array.array('Q')
+        :return: one array per channel of the states of the channel, in sample order
+        :rtype: tuple of bytes
+        """
+        raw = _pack(words)
+        return tuple(
+            raw[c // FIELDS_PER_BYTE::WORD_SIZE].translate(FIELD_TABLES[c % FIELDS_PER_BYTE])
+            for c in range(self.channels)
+        )
+
+    def active_many(self, words: Iterable[int]) -> Tuple[bytes, ...]:
+        """
+        Get whether every channel is active over a history of status words.
+
+        :param words: status words
+        :type words: Iterable[int], array.array('Q')
+        :return: one array per channel of 1 (active) or 0, in sample order
+        :rtype: tuple of bytes
+        """
+        raw = _pack(words)
+        return tuple(
+            raw[c // FIELDS_PER_BYTE::WORD_SIZE].translate(self.active_field_tables[c % FIELDS_PER_BYTE])
+            for c in range(self.channels)
+        )
+
+    def any_active_many(self, words: Iterable[int]) -> bytes:
+        """
+        Get whether any channel is active over a history of status words.
+
+        :param words: status words
+        :type words: Iterable[int], array.array('Q')
+        :return: 1 (any channel active) or 0, in sample order
+        :rtype: bytes
+        """
+        columns = self.active_many(words)
+        # OR of the columns, byte by byte
+        acc = int.from_bytes(columns[0], 'little')
+        for column in columns[1:]:
+            acc |= int.from_bytes(column, 'little')
+        return acc.to_bytes(len(columns[0]), 'little')
@@ -0,0 +1,424 @@
+"""
+A local, shared-memory store of Device state.
+
+Each Device type's parameters are laid out in a fixed binary struct derived from
+its `BASE_DTYPES`. A worker process writes parameter values into the store and
+any number of Recipe processes read them without IPC. Per-channel parameters
+listed as columns are laid out contiguously, so a whole column can be read as a
+zero-copy `memoryview`.
+
+Readers get consistent snapshots of several values without taking a lock, see
+:py:class:`devices.base.obj.SeqLock`. The counter of the lock occupies the first
+8 bytes of the store.
+
+The store is backed by `multiprocessing.shared_memory` when it is available
+(Python >= 3.8) and by a memory-mapped file in `/dev/shm`, or the temporary
+directory, otherwise. The same store backs simulation and tests on any Linux
+machine.
+
+.. code-block:: python
+
+    import devices.aqueduct.scip.constants as c
+    from devices.base.store import DeviceStateStore
+
+    # in the worker
+    store = DeviceStateStore.create("scip_0", c.BASE_DTYPES, c.STORE_COLUMNS, c.BASE)
+    store.write_vector(c.TRANSDUCER_KEYS.column(c.PRESSURE_VALUE_SUFFIX), pressures)
+
+    # group several writes into one update
+    with store.lock.write():
+        store.write(c.TRANSDUCER_KEYS[0, c.PRESSURE_UNITS_SUFFIX], "bar")
+        store.write_vector(c.TRANSDUCER_KEYS.column(c.PRESSURE_VALUE_SUFFIX), pressures)
+
+    # in the Recipe
+    scip = SCIP(device_key="scip_0", store=DeviceStateStore.open("scip_0", c.BASE_DTYPES, c.STORE_COLUMNS))
+    scip.get_all_pressures()
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, Tuple, Union
+
+from devices.base.obj import SeqLock
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # Python < 3.8, or Windows
+    resource_tracker = None
+
+
+# fixed size in bytes of `str` parameters, longer values are truncated
+STR_SIZE = 64
+
+FORMATS = {
+    int.__name__: 'q',
+    float.__name__: 'd',
+    bool.__name__: '?',
+    str.__name__: '{}s'.format(STR_SIZE),
+}
+
+# formats that can be read as a typed `memoryview`
+VECTOR_FORMATS = ('q', 'd', '?')
+
+ALIGNMENT = 8
+
+# bytes reserved for the sequence counter
+HEADER_SIZE = 8
+
+SHM_DIR = '/dev/shm'
+
+STORE_PREFIX = 'aqueduct_'
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+# names of the blocks created by this process, registered with its resource tracker
+_CREATED = set()
+
+
+def _attach(name: str):
+    # attach to a block without taking ownership of it: the resource tracker of a process
+    # that attached to a block unlinks it when the process exits
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    if resource_tracker is not None and name not in _CREATED:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class Layout(object):
+    """
+    The fixed binary layout of a Device type's parameters.
+
+    The sequence counter comes first. Columns follow, each contiguously and in channel order. The remaining
+    parameters follow, 8-byte values first, then booleans, then strings. Parameters
+    whose dtype has no fixed size (for instance 'list') are not stored.
+
+    :param dtypes: dictionary of parameter key: dtype name, typically `BASE_DTYPES`
+    :type dtypes: dict
+    :param columns: tuples of parameter keys to lay out contiguously, typically
+        `KeyTable.column(...)` values, every key of a column must share a numeric dtype
+    :type columns: Iterable[tuple]
+    """
+
+    __slots__ = (
+        'fields',
+        'columns',
+        'size',
+        '__structs__',
+    )
+
+    def __init__(self, dtypes: Dict[str, str], columns: Iterable[Tuple[str, ...]] = ()):
+        """
+        Constructor method.
+        """
+        self.fields: Dict[str, Tuple[int, str]] = dict()
+        self.columns: Dict[Tuple[str, ...], Tuple[int, str]] = dict()
+        self.__structs__: Dict[str, struct.Struct] = dict()
+
+        offset = HEADER_SIZE
+
+        for column in columns:
+            column = tuple(column)
+            formats = {FORMATS.get(dtypes.get(key)) for key in column}
+            if len(formats) != 1 or next(iter(formats)) not in VECTOR_FORMATS:
+                raise ValueError("Column keys must share a numeric dtype: {}".format(column))
+            fmt = formats.pop()
+            offset = _align(offset)
+            self.columns[column] = (offset, fmt)
+            for key in column:
+                self.fields[key] = (offset, fmt)
+                offset += struct.calcsize(fmt)
+
+        remaining = [(k, FORMATS[d]) for k, d in dtypes.items() if k not in self.fields and d in FORMATS]
+
+        for fmt_order in (('q', 'd'), ('?',), (FORMATS[str.__name__],)):
+            offset = _align(offset)
+            for key, fmt in remaining:
+                if fmt in fmt_order:
+                    self.fields[key] = (offset, fmt)
+                    offset += struct.calcsize(fmt)
+
+        self.size = max(_align(offset), ALIGNMENT)
+
+        for _, fmt in self.fields.values():
+            if fmt not in self.__structs__:
+                self.__structs__[fmt] = struct.Struct('<' + fmt)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fields
+
+    def struct(self, key: str) -> Tuple[int, struct.Struct]:
+        """
+        Get the offset and `struct.Struct` of a parameter.
+
+        :param key: parameter key
+        :type key: str
+        :return: (offset, struct)
+        :rtype: tuple
+        :raises KeyError: if the parameter is not stored
+        """
+        offset, fmt = self.fields[key]
+        return offset, self.__structs__[fmt]
+
+
+class DeviceStateStore(object):
+    """
+    A block of shared memory holding the state of one Device.
+
+    Use :py:func:`create` in the process that writes the Device state and :py:func:`open`
+    in the processes that read it.
+
+    :param name: name of the shared memory block, unique per Device
+    :type name: str
+    :param layout: layout of the Device type's parameters
+    :type layout: Layout
+    :param create: create the block instead of attaching to an existing one
+    :type create: bool
+    """
+
+    def __init__(self, name: str, layout: Layout, create: bool = False):
+        """
+        Constructor method.
+        """
+        self.name: str = name
+        self.layout: Layout = layout
+        self.__owner__: bool = create
+        self.__shm__ = None
+        self.__mmap__ = None
+        self.__path__: str = None
+        self.__closed__: bool = False
+
+        if shared_memory is not None:
+            if create:
+                self.__shm__ = shared_memory.SharedMemory(name=STORE_PREFIX + name, create=True, size=layout.size)
+                _CREATED.add(STORE_PREFIX + name)
+            else:
+                self.__shm__ = _attach(STORE_PREFIX + name)
+            buf = self.__shm__.buf
+        else:
+            directory = SHM_DIR if os.path.isdir(SHM_DIR) else tempfile.gettempdir()
+            self.__path__ = os.path.join(directory, STORE_PREFIX + name)
+            with open(self.__path__, 'w+b' if create else 'r+b') as f:
+                if create:
+                    f.truncate(layout.size)
+                self.__mmap__ = mmap.mmap(f.fileno(), layout.size)
+            buf = memoryview(self.__mmap__)
+
+        self.buf: memoryview = buf[:layout.size]
+        self.lock: SeqLock = SeqLock(self.buf, 0)
+        self.__views__: Dict[Tuple[str, ...], memoryview] = dict()
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        dtypes: Dict[str, str],
+        columns: Iterable[Tuple[str, ...]] = (),
+        base: dict = None
+    ) -> "DeviceStateStore":
+        """
+        Create the store of a Device and write its default parameter values.
+
+        :param name: name of the shared memory block, unique per Device
+        :type name: str
+        :param dtypes: dictionary of parameter key: dtype name, typically `BASE_DTYPES`
+        :type dtypes: dict
+        :param columns: tuples of parameter keys to lay out contiguously
+        :type columns: Iterable[tuple]
+        :param base: dictionary of default parameter values, typically `BASE`
+        :type base: dict
+        :return: DeviceStateStore
+        :rtype: DeviceStateStore
+        """
+        store = cls(name, Layout(dtypes, columns), create=True)
+        if base is not None:
+            store.update(base)
+        return store
+
+    @classmethod
+    def open(cls, name: str, dtypes: Dict[str, str], columns: Iterable[Tuple[str, ...]] = ()) -> "DeviceStateStore":
+        """
+        Attach to the existing store of a Device.
+
+        :param name: name of the shared memory block
+        :type name: str
+        :param dtypes: dictionary of parameter key: dtype name, must match the creator's
+        :type dtypes: dict
+        :param columns: tuples of parameter keys to lay out contiguously, must match the creator's
+        :type columns: Iterable[tuple]
+        :return: DeviceStateStore
+        :rtype: DeviceStateStore
+        """
+        return cls(name, Layout(dtypes, columns), create=False)
+
+    def read(self, key: str):
+        """
+        Read a parameter value.
+
+        :param key: parameter key
+        :type key: str
+        :return: value
+        :rtype: int, float, bool, str
+        :raises KeyError: if the parameter is not stored
+        """
+        offset, s = self.layout.struct(key)
+        value = s.unpack_from(self.buf, offset)[0]
+        if isinstance(value, bytes):
+            return value.rstrip(b'\x00').decode('utf-8', 'replace')
+        return value
+
+    def write(self, key: str, value) -> None:
+        """
+        Write a parameter value. `None` is written as 0, or NaN for float parameters.
+
+        :param key: parameter key
+        :type key: str
+        :param value: value
+        :type value: int, float, bool, str, None
+        :return: None
+        :raises KeyError: if the parameter is not stored
+        """
+        offset, s = self.layout.struct(key)
+        fmt = s.format[-1:]
+        if value is None:
+            value = float('nan') if fmt == 'd' else (b'' if fmt == 's' else 0)
+        elif fmt == 's':
+            value = str(value).encode('utf-8')
+        elif fmt == 'q':
+            value = int(value)
+        elif fmt == 'd':
+            value = float(value)
+        with self.lock.write():
+            s.pack_into(self.buf, offset, value)
+
+    def update(self, values: dict) -> None:
+        """
+        Write several parameter values. Parameters that are not stored are ignored.
+
+        :param values: dictionary of parameter key: value
+        :type values: dict
+        :return: None
+        """
+        with self.lock.write():
+            for key, value in values.items():
+                if key in self.layout:
+                    self.write(key, value)
+
+    def vector(self, column: Tuple[str, ...]) -> memoryview:
+        """
+        Get a zero-copy, typed view of a column.
+
+        The view reflects later writes, use :py:func:`read_vector` for a consistent
+        copy. Views are released when the store is closed.
+
+        :param column: tuple of parameter keys, as passed to the layout
+        :type column: tuple
+        :return: view
+        :rtype: memoryview
+        :raises KeyError: if the column is not in the layout
+        """
+        view = self.__views__.get(column)
+        if view is None:
+            offset, fmt = self.layout.columns[column]
+            size = struct.calcsize(fmt)
+            view = self.__views__[column] = self.buf[offset:offset + size * len(column)].cast(fmt)
+        return view
+
+    def read_vector(self, column: Tuple[str, ...]) -> tuple:
+        """
+        Read a consistent copy of a column, never mixing values of two updates.
+
+        :param column: tuple of parameter keys, as passed to the layout
+        :type column: tuple
+        :return: values, in channel order
+        :rtype: tuple
+        :raises KeyError: if the column is not in the layout
+        """
+        view = self.vector(column)
+        return self.lock.read(lambda: tuple(view))
+
+    def snapshot(self, keys: Iterable[str]) -> tuple:
+        """
+        Read a consistent copy of several parameters, never mixing values of two updates.
+
+        :param keys: parameter keys
+        :type keys: Iterable[str]
+        :return: values, in the order of `keys`
+        :rtype: tuple
+        :raises KeyError: if a parameter is not stored
+        """
+        keys = tuple(keys)
+        return self.lock.read(lambda: tuple(self.read(k) for k in keys))
+
+    def write_vector(self, column: Tuple[str, ...], values: Iterable[Union[int, float, bool, None]]) -> None:
+        """
+        Write every value of a column.
+
+        :param column: tuple of parameter keys, as passed to the layout
+        :type column: tuple
+        :param values: values, in channel order
+        :type values: Iterable
+        :return: None
+        """
+        offset, fmt = self.layout.columns[column]
+        values = tuple(values)
+        if len(values) != len(column):
+            raise ValueError("Expected {} values, got {}".format(len(column), len(values)))
+        if fmt == 'd':
+            values = tuple(float('nan') if v is None else v for v in values)
+        with self.lock.write():
+            struct.pack_into('<{}{}'.format(len(values), fmt), self.buf, offset, *values)
+
+    def close(self) -> None:
+        """
+        Detach from the store. Views returned by :py:func:`vector` are released. Called when
+        the store is garbage collected.
+
+        :return: None
+        """
+        if self.__closed__:
+            return
+        self.__closed__ = True
+        # the block cannot be closed while views of it exist
+        for view in self.__views__.values():
+            view.release()
+        self.__views__.clear()
+        self.lock.buf = None
+        self.buf.release()
+        if self.__shm__ is not None:
+            self.__shm__.close()
+        if self.__mmap__ is not None:
+            self.__mmap__.close()
+
+    def __del__(self):
+        # a store that failed to attach has no `__closed__`
+        if not getattr(self, '__closed__', True):
+            self.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the store. Only the creator should unlink the store.
+
+        :return: None
+        """
+        if self.__shm__ is not None:
+            self.__shm__.unlink()
+            _CREATED.discard(STORE_PREFIX + self.name)
+        elif self.__path__ is not None:
+            try:
+                os.remove(self.__path__)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,196 @@
+"""
+Compact, versioned binary encoding of Device commands.
+
+A frame is a 4-byte header followed by fixed-size records, one per channel (pump
+input, mixer, move point...):
+
+    header:  version (B), opcode (B), number of records (H)
+    record:  channel (B), presence mask (B), fields...
+
+The fields of a record are the tuple returned by the `_to_command()` method of a
+command object (`PumpCommand`, `MoveCommand`, `MixerCommand`...). A field that is
+None has its bit cleared in the presence mask and is packed as 0.
+
+Each Device type defines its opcode table, `WIRE`, in its constants module, and the
+multi-channel pump commands of PP6, PP12, SYRP and TRCX are sent as one frame with
+:py:func:`devices.base.obj.send_commands`. Opcodes
+are assigned in table order, so new commands must be appended to keep the encoding
+of existing commands stable. Changes to the frame layout increment `WIRE_VERSION`.
+
+.. code-block:: python
+
+    import devices.aqueduct.pp12.constants as c
+
+    frame = c.WIRE.encode_commands('start', (pump0, None, pump2))
+    # PP12.start(pump0=pump0, pump2=pump2) sends {FRAME_KEY: frame}
+    action, records = c.WIRE.decode(frame)
+    # 'start', ((0, (1, 1, 10.0, 3, 5.0, 4)), (2, (...)))
+"""
+
+import struct
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+
+WIRE_VERSION = 1
+
+HEADER = struct.Struct('<BBH')
+
+# key of the frame in the command dictionary sent to the device worker
+FRAME_KEY = 'frame'
+
+# a record field that is None is packed as this value
+_NONE = 0
+
+
+class RecordFormat(object):
+    """
+    The fields of a command record.
+
+    :param name: name of the record, for messages
+    :type name: str
+    :param fields: `struct` format characters of the fields, at most 8
+    :type fields: str
+    """
+
+    __slots__ = (
+        'name',
+        'fields',
+        'full',
+        'record',
+    )
+
+    def __init__(self, name: str, fields: str):
+        """
+        Constructor method.
+        """
+        if len(fields) > 8:
+            raise ValueError("A record has at most 8 fields, {} has {}".format(name, len(fields)))
+        self.name: str = name
+        self.fields: str = fields
+        # presence mask of a record without None fields
+        self.full: int = (1 << len(fields)) - 1
+        self.record: struct.Struct = struct.Struct('<BB' + fields)
+
+
+# records carrying only a channel, for instance to stop a pump input
+CHANNEL = RecordFormat('channel', '')
+
+# `PumpCommand._to_command()`: mode, direction, rate_value, rate_units, finite_value, finite_units
+PUMP_COMMAND = RecordFormat('PumpCommand', 'BBdBdB')
+
+# `MoveCommand._to_command()`: x, y, z, z_threshold
+MOVE_COMMAND = RecordFormat('MoveCommand', 'dddd')
+
+# `MixerCommand._to_command()`: direction, rpm
+MIXER_COMMAND = RecordFormat('MixerCommand', 'Bd')
+
+# `SetValveCommand._to_command()`: position, direction
+VALVE_COMMAND = RecordFormat('SetValveCommand', 'BB')
+
+
+class Codec(object):
+    """
+    The opcode table of a Device type.
+
+    :param commands: (action name, record format) pairs, opcodes are assigned
+        in order starting at 1, append new commands only
+    :type commands: Sequence[tuple]
+    """
+
+    __slots__ = (
+        'opcodes',
+        'actions',
+        'formats',
+    )
+
+    def __init__(self, commands: Sequence[Tuple[str, RecordFormat]]):
+        """
+        Constructor method.
+        """
+        self.opcodes: Dict[str, int] = {action: i + 1 for i, (action, _) in enumerate(commands)}
+        self.actions: Dict[int, str] = {i + 1: action for i, (action, _) in enumerate(commands)}
+        self.formats: Dict[int, RecordFormat] = {i + 1: fmt for i, (_, fmt) in enumerate(commands)}
+
+    def encode(self, action: str, records: Iterable[Tuple[int, tuple]]) -> bytes:
+        """
+        Encode a command.
+
+        :param action: name of the command, must be in the opcode table
+        :type action: str
+        :param records: (channel, fields) pairs, `fields` as returned by `_to_command()`
+        :type records: Iterable[tuple]
+        :return: frame
+        :rtype: bytes
+        :raises KeyError: if the command is not in the opcode table
+        :raises ValueError: if a record does not match the record format
+        """
+        opcode = self.opcodes[action]
+        fmt = self.formats[opcode]
+        records = records if isinstance(records, (list, tuple)) else list(records)
+        pack_into, size, full = fmt.record.pack_into, fmt.record.size, fmt.full
+        buf = bytearray(HEADER.size + len(records) * size)
+        HEADER.pack_into(buf, 0, WIRE_VERSION, opcode, len(records))
+        offset = HEADER.size
+        try:
+            for channel, fields in records:
+                if None in fields:
+                    mask = 0
+                    values = list(fields)
+                    for i, v in enumerate(values):
+                        if v is None:
+                            values[i] = _NONE
+                        else:
+                            mask |= 1 << i
+                    pack_into(buf, offset, channel, mask, *values)
+                else:
+                    pack_into(buf, offset, channel, full, *fields)
+                offset += size
+        except struct.error as e:
+            raise ValueError("Cannot encode {}: {}".format(action, e))
+        return bytes(buf)
+
+    def encode_commands(self, action: str, commands: Sequence[Union[object, None]]) -> bytes:
+        """
+        Encode a command from command objects, one per channel, skipping channels that are None.
+
+        :param action: name of the command, must be in the opcode table
+        :type action: str
+        :param commands: command objects with a `_to_command()` method, or None
+        :type commands: Sequence
+        :return: frame
+        :rtype: bytes
+        """
+        return self.encode(action, ((i, c._to_command()) for i, c in enumerate(commands) if c is not None))
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> Tuple[str, Tuple[Tuple[int, tuple], ...]]:
+        """
+        Decode a frame.
+
+        :param data: frame
+        :type data: bytes, bytearray, memoryview
+        :return: (action name, ((channel, fields), ...))
+        :rtype: tuple
+        :raises ValueError: for an unsupported version, an unknown opcode or a truncated frame
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Cannot decode a frame of {} bytes, the header has {} bytes".format(
+                len(data), HEADER.size))
+        version, opcode, count = HEADER.unpack_from(data, 0)
+        if version != WIRE_VERSION:
+            raise ValueError("Unsupported wire version {}, expected {}".format(version, WIRE_VERSION))
+        if opcode not in self.formats:
+            raise ValueError("Unknown opcode {}".format(opcode))
+        fmt = self.formats[opcode]
+        body = memoryview(data)[HEADER.size:]
+        if len(body) != count * fmt.record.size:
+            raise ValueError("Cannot decode {}: expected {} records of {} bytes, got {} bytes".format(
+                self.actions[opcode], count, fmt.record.size, len(body)))
+        full = fmt.full
+        records = []
+        for r in fmt.record.iter_unpack(body):
+            mask = r[1]
+            if mask == full:
+                records.append((r[0], r[2:]))
+            else:
+                records.append((r[0], tuple(v if mask >> i & 1 else None for i, v in enumerate(r[2:]))))
+        return self.actions[opcode], tuple(records)
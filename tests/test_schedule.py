@@ -0,0 +1,63 @@
+import threading
+import unittest
+
+from devices.base.schedule import DoseScheduler
+
+
+class MockPump(object):
+    """
+    A multi-channel pump recording the `start` and `stop` commands it receives.
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def start(self, wait_for_complete: bool = True, **kwargs):
+        with self.lock:
+            self.commands.append(('start', kwargs))
+        return {}
+
+    def stop(self, **kwargs):
+        with self.lock:
+            self.commands.append(('stop', kwargs))
+        return {}
+
+
+class TestDoseScheduler(unittest.TestCase):
+
+    def test_overlapping_doses_on_a_channel_are_serialized(self):
+        pump = MockPump()
+        schedule = DoseScheduler(pump, 2, tick_s=0.01)
+        a = schedule.add(0, 'A', duration_s=0.3)
+        b = schedule.add(0, 'B', at_s=0.05, duration_s=0.1)
+        schedule.start()
+
+        self.assertTrue(schedule.wait(2.))
+        self.assertIsNone(a.future.exception())
+        self.assertIsNone(b.future.exception())
+        # B starts when A is stopped, not over it
+        self.assertGreaterEqual(b.started_s, a.started_s + a.duration_s)
+        self.assertEqual(
+            [action for action, _ in pump.commands],
+            ['start', 'stop', 'start', 'stop'],
+        )
+        self.assertEqual(pump.commands[0][1], {'pump0': 'A'})
+        self.assertEqual(pump.commands[2][1], {'pump0': 'B'})
+
+    def test_cancel_cancels_deferred_doses(self):
+        pump = MockPump()
+        schedule = DoseScheduler(pump, 2, tick_s=0.01)
+        a = schedule.add(0, 'A', duration_s=10.)
+        b = schedule.add(0, 'B', at_s=0.02, duration_s=0.1)
+        schedule.start()
+        threading.Event().wait(0.1)
+        schedule.cancel()
+
+        self.assertTrue(schedule.wait(1.))
+        self.assertTrue(a.future.cancelled())
+        self.assertTrue(b.future.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()